@@ -4,6 +4,9 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_OPTIONS_UPDATED
 
 DOMAIN = "tge_rdn"
 PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR]
@@ -11,6 +14,10 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up from configuration.yaml."""
+    # Imported here so importing the package stays free of voluptuous/cv
+    from .services import async_setup_services
+
+    async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -19,7 +26,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("✅ TGE Web Table Parsing + DST support")
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    # Runtime objects shared with platforms (sensor stores the coordinator here)
+    hass.data[DOMAIN][entry.entry_id] = {}
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -30,13 +38,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload entry when options change."""
-    _LOGGER.info("♻️ TGE RDN options changed, reloading...")
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply option changes in place, keeping the cached TGE prices.
+
+    Tariff, VAT and unit only affect derived values, so entities rebuild
+    them from entry.options; no reload and no refetch.
+    """
+    runtime = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    if "coordinator" not in runtime:
+        _LOGGER.info("♻️ TGE RDN options changed, reloading...")
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    _LOGGER.info("♻️ TGE RDN options changed, recomputing prices in place...")
+    async_dispatcher_send(hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id))
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        runtime = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = runtime.get("coordinator")
+        if coordinator is not None:
+            # Write pending cache data now so a reload restores the latest prices
+            await coordinator.async_flush_storage()
     return unload_ok
@@ -0,0 +1,178 @@
+"""TGE RDN HTTP client — async fetches over a pooled keep-alive session."""
+from __future__ import annotations
+
+import asyncio
+import codecs
+import importlib.util
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from .const import TGE_PAGE_URL, REQUEST_TIMEOUT, USER_AGENT, STREAM_CHUNK_SIZE
+from .parser import TableStream, page_fingerprint
+
+_LOGGER = logging.getLogger(__name__)
+
+# aiohttp decodes brotli only when a brotli binding is installed
+_BROTLI_AVAILABLE = bool(
+    importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+)
+ACCEPT_ENCODING = "gzip, deflate, br" if _BROTLI_AVAILABLE else "gzip, deflate"
+
+
+def url_for_date(target_date: datetime) -> str:
+    """Build the page URL listing prices for a delivery date.
+
+    The TGE website shows prices for the NEXT day after the dateShow
+    parameter, so date X is requested with dateShow=X-1.
+    """
+    previous_day = target_date - timedelta(days=1)
+    return f"{TGE_PAGE_URL}?dateShow={previous_day.strftime('%d-%m-%Y')}"
+
+
+@dataclass
+class PageCacheEntry:
+    """Validators and content fingerprint of the last response for one URL.
+
+    `data` is owned by the caller: it holds whatever was parsed from the
+    page, so an unchanged page can be answered without parsing again.
+    """
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fingerprint: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class PageFetch:
+    """Outcome of a conditional page fetch.
+
+    `html` is only the table markup when the table was found while
+    streaming, otherwise the whole page.
+    """
+
+    entry: PageCacheEntry
+    changed: bool
+    html: Optional[str] = None
+
+
+class TGERDNClient:
+    """Fetch RDN pages without blocking an executor thread.
+
+    The session is expected to be Home Assistant's shared client session,
+    so connections to tge.pl are pooled and kept alive between ticks.
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, timeout: int = REQUEST_TIMEOUT) -> None:
+        """Initialize client."""
+        self._session = session
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+        self._cache: Dict[str, PageCacheEntry] = {}
+
+    def forget(self, target_date: datetime) -> None:
+        """Drop cached validators for a delivery date."""
+        self._cache.pop(url_for_date(target_date), None)
+
+    async def async_fetch_page(self, target_date: datetime) -> Optional[PageFetch]:
+        """Conditionally fetch the page for a delivery date.
+
+        Sends If-None-Match/If-Modified-Since from the previous response and
+        compares a fingerprint of the price table, so `changed` is False both
+        on 304 and when the server re-sends identical content.
+        Returns None on HTTP/network error.
+        """
+        url = url_for_date(target_date)
+        entry = self._cache.get(url)
+        headers = dict(self._headers)
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        _LOGGER.debug(f"📡 Fetching table data for: {target_date.date()} from {url}")
+        try:
+            async with self._session.get(
+                url, headers=headers, timeout=self._timeout
+            ) as response:
+                if response.status == 304 and entry is not None:
+                    _LOGGER.debug(f"TGE page not modified: {url}")
+                    return PageFetch(entry=entry, changed=False)
+                if response.status != 200:
+                    _LOGGER.warning(f"Failed to access TGE page: HTTP {response.status}")
+                    return None
+                stream = await self._async_read_table(response)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except asyncio.TimeoutError:
+            _LOGGER.warning(f"⏰ Timeout fetching TGE page for {target_date.date()}")
+            return None
+        except aiohttp.ClientError as err:
+            _LOGGER.warning(f"❌ Error fetching TGE page for {target_date.date()}: {err}")
+            return None
+
+        html = stream.html
+        fingerprint = page_fingerprint(html)
+        if entry is not None and entry.fingerprint == fingerprint:
+            entry.etag = etag or entry.etag
+            entry.last_modified = last_modified or entry.last_modified
+            _LOGGER.debug(f"TGE page unchanged (fingerprint {fingerprint}): {url}")
+            return PageFetch(entry=entry, changed=False)
+
+        entry = PageCacheEntry(etag=etag, last_modified=last_modified, fingerprint=fingerprint)
+        self._cache[url] = entry
+        return PageFetch(entry=entry, changed=True, html=html)
+
+    async def async_fetch_table(self, target_date: datetime) -> Optional[str]:
+        """Unconditionally fetch the price table markup for a delivery date.
+
+        Used for history backfill: nothing is cached, so the caller can
+        parse the table in another process.
+        Returns the whole page if the table marker is missing, None on
+        HTTP/network error.
+        """
+        url = url_for_date(target_date)
+        _LOGGER.debug(f"📡 Fetching history table for: {target_date.date()} from {url}")
+        try:
+            async with self._session.get(
+                url, headers=self._headers, timeout=self._timeout
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.warning(f"Failed to access TGE page: HTTP {response.status}")
+                    return None
+                stream = await self._async_read_table(response)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(f"⏰ Timeout fetching TGE page for {target_date.date()}")
+            return None
+        except aiohttp.ClientError as err:
+            _LOGGER.warning(f"❌ Error fetching TGE page for {target_date.date()}: {err}")
+            return None
+        return stream.html
+
+    @staticmethod
+    async def _async_read_table(response: aiohttp.ClientResponse) -> TableStream:
+        """Collect the table markup while the body downloads.
+
+        Chunks after `</table>` are read but neither decoded nor kept: the
+        body is drained so aiohttp returns the connection to the
+        keep-alive pool instead of closing it.
+        """
+        try:
+            decoder_cls = codecs.getincrementaldecoder(response.charset or "utf-8")
+        except LookupError:
+            decoder_cls = codecs.getincrementaldecoder("utf-8")
+        decoder = decoder_cls(errors="replace")
+        stream = TableStream()
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            if not stream.done:
+                stream.feed(decoder.decode(chunk))
+        stream.feed(decoder.decode(b"", final=True))
+        return stream
@@ -0,0 +1,278 @@
+"""Append-only memory-mapped archive of complete delivery days.
+
+Blocking I/O — open and append from the executor. Reads go through a
+read-only `mmap`, so only the pages a query touches are loaded.
+
+File layout (little-endian)::
+
+    header  8s magic, H version, H record size, B hour slots, B quarter slots, 2x
+    record  i date ordinal, H flags, B hours, B quarters, d EUR rate (NaN = none)
+            25 × d hourly prices, 100 × d quarter prices,
+            25 × b hour numbers, 25 × c hour DST markers,
+            100 × H quarter start minutes, 100 × c quarter DST markers, 2x
+
+Records are fixed width, so a day is found through the in-memory
+date → offset index built at open time. A day appended again supersedes
+its earlier record.
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from datetime import date, datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .cache import is_day_complete
+from .series import DaySeries
+from .slots import TGE_TIMEZONE, day_bounds_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"TGERDNPA"
+VERSION = 1
+HOUR_SLOTS = 25
+QUARTER_SLOTS = 100
+
+FLAG_QUARTER_SOURCE = 1  # hourly prices are means of the quarter series
+FLAG_SHORT_DAY = 2       # 23-hour spring-forward day
+FLAG_LONG_DAY = 4        # 25-hour fall-back day
+
+_HEADER = struct.Struct("<8sHHBB2x")
+_RECORD_HEAD = struct.Struct("<iHBBd")
+_HOURS = _RECORD_HEAD.size
+_QUARTERS = _HOURS + HOUR_SLOTS * 8
+_HOUR_NUMBERS = _QUARTERS + QUARTER_SLOTS * 8
+_HOUR_MARKERS = _HOUR_NUMBERS + HOUR_SLOTS
+_QUARTER_MINUTES = _HOUR_MARKERS + HOUR_SLOTS
+_QUARTER_MARKERS = _QUARTER_MINUTES + QUARTER_SLOTS * 2
+# Multiple of 8 keeps every record's float blocks aligned for cast('d')
+RECORD_SIZE = (_QUARTER_MARKERS + QUARTER_SLOTS + 7) // 8 * 8
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _flags(series: DaySeries) -> int:
+    """Source and DST flags of a complete day."""
+    flags = FLAG_QUARTER_SOURCE if series.hourly_source == "quarters" else 0
+    if series.total_hours == 23:
+        flags |= FLAG_SHORT_DAY
+    elif series.total_hours == 25:
+        flags |= FLAG_LONG_DAY
+    return flags
+
+
+def _encode(series: DaySeries) -> bytes:
+    """Pack one day into a fixed-width record."""
+    record = bytearray(RECORD_SIZE)
+    hours = len(series.hour_prices)
+    quarters = len(series.quarter_prices)
+    _RECORD_HEAD.pack_into(
+        record, 0, series.day.toordinal(), _flags(series), hours, quarters,
+        math.nan if series.eur_rate is None else series.eur_rate,
+    )
+    struct.pack_into(f"<{hours}d", record, _HOURS, *series.hour_prices)
+    struct.pack_into(f"<{quarters}d", record, _QUARTERS, *series.quarter_prices)
+    struct.pack_into(f"<{hours}b", record, _HOUR_NUMBERS, *series.hour_numbers)
+    record[_HOUR_MARKERS:_HOUR_MARKERS + hours] = series.hour_markers.encode("ascii")
+    struct.pack_into(f"<{quarters}H", record, _QUARTER_MINUTES, *series.quarter_minutes)
+    record[_QUARTER_MARKERS:_QUARTER_MARKERS + quarters] = series.quarter_markers.encode("ascii")
+    return bytes(record)
+
+
+class PriceArchive:
+    """Complete delivery days in a fixed-width binary file, read via mmap.
+
+    `hour_prices(day)` / `quarter_prices(day)` are zero-copy `memoryview`s
+    of float64 into the mapping; `numpy.asarray(view)` wraps one without
+    copying. Point queries (`price_at`, `average_at`) read single floats
+    with `struct.unpack_from`, never materializing whole days.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Use `PriceArchive.open`."""
+        self.path = path
+        self._mm: Optional[mmap.mmap] = None
+        self._index: Dict[int, int] = {}
+        self._ordinals: List[int] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path: str) -> "PriceArchive":
+        """Open or create the archive and index its records."""
+        archive = cls(path)
+        archive._prepare_file()
+        archive._remap()
+        for offset in range(_HEADER.size, len(archive._mm), RECORD_SIZE):
+            ordinal = _RECORD_HEAD.unpack_from(archive._mm, offset)[0]
+            archive._index[ordinal] = offset
+        archive._ordinals = sorted(archive._index)
+        _LOGGER.debug(f"📚 Price archive: {len(archive)} days in {path}")
+        return archive
+
+    def _prepare_file(self) -> None:
+        """Create the file, set aside an unreadable one, drop a torn last record."""
+        header = _HEADER.pack(MAGIC, VERSION, RECORD_SIZE, HOUR_SLOTS, QUARTER_SLOTS)
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                if f.read(_HEADER.size) == header:
+                    size = os.fstat(f.fileno()).st_size
+                    whole = _HEADER.size + (size - _HEADER.size) // RECORD_SIZE * RECORD_SIZE
+                    if whole == size:
+                        return
+                    _LOGGER.warning("⚠️ Price archive ends with a partial record, truncating")
+                    os.truncate(self.path, whole)
+                    return
+            _LOGGER.warning(f"⚠️ Unreadable price archive moved to {self.path}.bad")
+            os.replace(self.path, f"{self.path}.bad")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "wb") as f:
+            f.write(header)
+
+    def _remap(self) -> None:
+        """Map the file as it is now.
+
+        The previous mapping is left to the garbage collector: views handed
+        out earlier keep it alive and stay valid.
+        """
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        """Drop the mapping; outstanding views keep their pages alive."""
+        self._mm = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, day: date) -> bool:
+        return day.toordinal() in self._index
+
+    def dates(self) -> List[date]:
+        """Archived delivery dates, oldest first."""
+        return [date.fromordinal(o) for o in self._ordinals]
+
+    def missing(self, start: date, end: date) -> List[date]:
+        """Delivery dates in [start, end] that are not archived yet."""
+        return [
+            date.fromordinal(o)
+            for o in range(start.toordinal(), end.toordinal() + 1)
+            if o not in self._index
+        ]
+
+    def append(self, days: Iterable[Optional[DaySeries]]) -> int:
+        """Append complete days in one write; partial days are skipped."""
+        records = [(s.day.toordinal(), _encode(s)) for s in days if s and is_day_complete(s.day, s)]
+        if not records:
+            return 0
+        with self._lock:
+            with open(self.path, "ab") as f:
+                start = f.tell()
+                f.write(b"".join(record for _ordinal, record in records))
+                f.flush()
+                os.fsync(f.fileno())
+            self._remap()
+            for i, (ordinal, _record) in enumerate(records):
+                if ordinal not in self._index:
+                    bisect.insort(self._ordinals, ordinal)
+                self._index[ordinal] = start + i * RECORD_SIZE
+        return len(records)
+
+    def _floats(self, offset: int, count: int):
+        """`count` float64 starting at `offset`, zero-copy where the host is little-endian."""
+        raw = memoryview(self._mm)[offset:offset + count * 8]
+        if _LITTLE_ENDIAN:
+            return raw.cast("d")
+        values = array("d", raw.tobytes())
+        values.byteswap()
+        return values
+
+    def hour_prices(self, day: date):
+        """Hourly prices of a day (PLN/MWh), None if not archived."""
+        offset = self._index.get(day.toordinal())
+        if offset is None:
+            return None
+        _ordinal, _flags, hours, _quarters, _rate = _RECORD_HEAD.unpack_from(self._mm, offset)
+        return self._floats(offset + _HOURS, hours)
+
+    def quarter_prices(self, day: date):
+        """Quarter-hour prices of a day (PLN/MWh), None if not archived."""
+        offset = self._index.get(day.toordinal())
+        if offset is None:
+            return None
+        _ordinal, _flags, _hours, quarters, _rate = _RECORD_HEAD.unpack_from(self._mm, offset)
+        return self._floats(offset + _QUARTERS, quarters)
+
+    def get(self, day: date) -> Optional[DaySeries]:
+        """Rebuild the headline series of a day; per-column vectors are not archived."""
+        offset = self._index.get(day.toordinal())
+        if offset is None:
+            return None
+        mm = self._mm
+        _ordinal, flags, hours, quarters, rate = _RECORD_HEAD.unpack_from(mm, offset)
+        return DaySeries(
+            day,
+            struct.unpack_from(f"<{hours}d", mm, offset + _HOURS),
+            struct.unpack_from(f"<{hours}b", mm, offset + _HOUR_NUMBERS),
+            mm[offset + _HOUR_MARKERS:offset + _HOUR_MARKERS + hours].decode("ascii"),
+            struct.unpack_from(f"<{quarters}d", mm, offset + _QUARTERS),
+            struct.unpack_from(f"<{quarters}H", mm, offset + _QUARTER_MINUTES),
+            mm[offset + _QUARTER_MARKERS:offset + _QUARTER_MARKERS + quarters].decode("ascii"),
+            eur_rate=None if math.isnan(rate) else rate,
+            hourly_source="quarters" if flags & FLAG_QUARTER_SOURCE else "hours",
+        )
+
+    @staticmethod
+    def _hour_position(day: date, hour: int, flags: int) -> Optional[int]:
+        """Position of local wall-clock `hour` (first occurrence on fall-back days)."""
+        if not flags & (FLAG_SHORT_DAY | FLAG_LONG_DAY):
+            return hour
+        local = datetime(day.year, day.month, day.day, hour, tzinfo=TGE_TIMEZONE)
+        utc = local.astimezone(timezone.utc)
+        if utc.astimezone(TGE_TIMEZONE).hour != hour:
+            return None  # skipped by spring-forward
+        return int((utc - day_bounds_utc(day)[0]).total_seconds()) // 3600
+
+    def price_at(self, day: date, hour: int) -> Optional[float]:
+        """Hourly price at local `hour` (0–23) of a day, None if unknown."""
+        offset = self._index.get(day.toordinal())
+        if offset is None:
+            return None
+        _ordinal, flags, hours, _quarters, _rate = _RECORD_HEAD.unpack_from(self._mm, offset)
+        pos = self._hour_position(day, hour, flags)
+        if pos is None or not 0 <= pos < hours:
+            return None
+        return struct.unpack_from("<d", self._mm, offset + _HOURS + pos * 8)[0]
+
+    def average_at(
+        self,
+        hour: int,
+        count: int,
+        include: Optional[Callable[[date], bool]] = None,
+        before: Optional[date] = None,
+    ) -> Optional[float]:
+        """Mean price at local `hour` over the latest `count` archived days.
+
+        `include` filters days (e.g. workdays only); `before` excludes it
+        and later days. None when no day qualifies.
+        """
+        end = bisect.bisect_left(self._ordinals, before.toordinal()) if before else len(self._ordinals)
+        total = 0.0
+        used = 0
+        for i in range(end - 1, -1, -1):
+            if used == count:
+                break
+            day = date.fromordinal(self._ordinals[i])
+            if include is not None and not include(day):
+                continue
+            price = self.price_at(day, hour)
+            if price is not None:
+                total += price
+                used += 1
+        return total / used if used else None
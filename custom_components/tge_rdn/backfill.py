@@ -0,0 +1,214 @@
+"""History backfill: fetch a range of past delivery days from tge.pl."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .archive import PriceArchive
+from .cache import is_day_complete
+from .const import (
+    BACKFILL_CONCURRENCY,
+    BACKFILL_PROCESS_POOL_MIN_DAYS,
+    BACKFILL_REQUEST_INTERVAL,
+)
+from .parser import parse_rdn_table
+from .series import DaySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parsed days buffered before one archive append while a backfill runs
+_CHECKPOINT_EVERY = 20
+
+
+def _process_pool(workers: int) -> Executor:
+    """Parser worker processes; spawned, since forking Home Assistant's threads is unsafe."""
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of one backfill run."""
+
+    start: date
+    end: date
+    stored: List[date] = field(default_factory=list)
+    skipped: int = 0
+    failed: List[date] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary for logs and service responses."""
+        return {
+            "start_date": self.start.isoformat(),
+            "end_date": self.end.isoformat(),
+            "stored": len(self.stored),
+            "skipped": self.skipped,
+            "failed": [day.isoformat() for day in self.failed],
+        }
+
+
+class BackfillEngine:
+    """Owns the price history archive and fills gaps in it from tge.pl.
+
+    Requests run `concurrency` at a time and their starts are spaced by
+    `request_interval`, so a year of history takes minutes without
+    hammering the site. Dates already archived are skipped. The requested
+    range is persisted in `store` until the run ends, so an interrupted
+    backfill resumes after a restart (`async_resume`) and only the days
+    still missing are fetched.
+    """
+
+    def __init__(
+        self,
+        hass,
+        client,
+        store,
+        archive_path: str,
+        request_interval: float = BACKFILL_REQUEST_INTERVAL,
+        pool_min_days: int = BACKFILL_PROCESS_POOL_MIN_DAYS,
+        pool_factory: Callable[[int], Executor] = _process_pool,
+    ) -> None:
+        """Initialize engine."""
+        self.hass = hass
+        # Opened by async_load
+        self.history: Optional[PriceArchive] = None
+        self.pending: Optional[Dict[str, str]] = None
+        self._client = client
+        self._store = store
+        self._archive_path = archive_path
+        self._request_interval = request_interval
+        self._pool_min_days = pool_min_days
+        self._pool_factory = pool_factory
+        self._next_request = 0.0
+        self._pace_lock = asyncio.Lock()
+        self._run_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Open the archive and restore an unfinished run from storage."""
+        self.history = await self.hass.async_add_executor_job(PriceArchive.open, self._archive_path)
+        data = await self._store.async_load() or {}
+        self.pending = data.get("pending")
+        if len(self.history):
+            _LOGGER.debug(f"📚 Price history: {len(self.history)} days archived")
+
+    async def async_flush(self) -> None:
+        """Write the pending backfill range immediately."""
+        await self._store.async_save({"pending": self.pending})
+
+    async def async_record(self, data: Optional[DaySeries]) -> None:
+        """Archive a day that became final during regular polling."""
+        if self.history is not None and data is not None and data.day not in self.history:
+            await self.hass.async_add_executor_job(self.history.append, [data])
+
+    async def async_resume(self) -> Optional[BackfillResult]:
+        """Continue a backfill interrupted by a restart."""
+        if not self.pending:
+            return None
+        start = date.fromisoformat(self.pending["start"])
+        end = date.fromisoformat(self.pending["end"])
+        _LOGGER.info(f"📚 Resuming backfill {start} → {end}")
+        return await self.async_backfill(start, end)
+
+    async def async_backfill(
+        self, start: date, end: date, concurrency: int = BACKFILL_CONCURRENCY
+    ) -> BackfillResult:
+        """Fetch every delivery day in [start, end] that is not stored yet."""
+        async with self._run_lock:
+            if self.history is None:
+                await self.async_load()
+            return await self._async_run(start, end, max(1, concurrency))
+
+    async def _async_run(self, start: date, end: date, concurrency: int) -> BackfillResult:
+        """One backfill run; runs are serialized by the caller."""
+        result = BackfillResult(start, end)
+        days = self.history.missing(start, end)
+        result.skipped = (end - start).days + 1 - len(days)
+        if not days:
+            _LOGGER.info(f"📚 Backfill {start} → {end}: nothing to fetch")
+            return result
+
+        _LOGGER.info(
+            f"📚 Backfill {start} → {end}: {len(days)} days to fetch, "
+            f"{result.skipped} already stored"
+        )
+        self.pending = {"start": start.isoformat(), "end": end.isoformat()}
+        await self.async_flush()
+
+        pool: Optional[Executor] = None
+        if len(days) >= self._pool_min_days:
+            try:
+                pool = await self.hass.async_add_executor_job(self._pool_factory, concurrency)
+            except (OSError, NotImplementedError) as err:
+                _LOGGER.warning(f"⚠️ No process pool ({err}), parsing in threads")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        batch: List[DaySeries] = []
+
+        async def store_batch() -> None:
+            ready = batch[:]
+            batch.clear()
+            await self.hass.async_add_executor_job(self.history.append, ready)
+
+        async def fetch(day: date) -> None:
+            target = datetime(day.year, day.month, day.day)
+            async with semaphore:
+                await self._async_pace()
+                html = await self._client.async_fetch_table(target)
+            data = await self._async_parse(pool, html, target) if html else None
+            if not is_day_complete(day, data):
+                result.failed.append(day)
+                return
+            result.stored.append(day)
+            batch.append(data)
+            if len(batch) >= _CHECKPOINT_EVERY:
+                await store_batch()
+
+        try:
+            await asyncio.gather(*(fetch(day) for day in days))
+        finally:
+            # Parsed days are kept even when the run is cancelled or fails
+            if batch:
+                await store_batch()
+            if pool is not None:
+                # Idle workers exit on their own; don't block the loop joining them
+                pool.shutdown(wait=False)
+        # Only a finished run clears the marker; cancelled runs resume after restart
+        self.pending = None
+        await self.async_flush()
+
+        result.failed.sort()
+        _LOGGER.info(
+            f"✅ Backfill {start} → {end}: {len(result.stored)} stored, "
+            f"{result.skipped} skipped, {len(result.failed)} unavailable"
+        )
+        return result
+
+    async def _async_pace(self) -> None:
+        """Space request starts by the request interval across all workers."""
+        async with self._pace_lock:
+            now = time.monotonic()
+            wait = self._next_request - now
+            self._next_request = max(now, self._next_request) + self._request_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _async_parse(
+        self, pool: Optional[Executor], html: str, target: datetime
+    ) -> Optional[DaySeries]:
+        """Parse table markup in the process pool, or HA's executor without one."""
+        try:
+            if pool is not None:
+                return await asyncio.get_running_loop().run_in_executor(
+                    pool, parse_rdn_table, html, target
+                )
+            return await self.hass.async_add_executor_job(parse_rdn_table, html, target)
+        except Exception as err:
+            _LOGGER.error(f"Error parsing history for {target.date()}: {err}")
+            return None
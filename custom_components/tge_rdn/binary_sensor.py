@@ -1,14 +1,13 @@
 """TGE RDN binary sensor platform — dynamic tariff indicator."""
 from __future__ import annotations
 
-import json
 import logging
-import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
@@ -16,32 +15,25 @@ from .const import (
     CONF_DEALER,
     CONF_DEALER_TARIFF,
     SENSOR_IS_DYNAMIC,
+    SIGNAL_OPTIONS_UPDATED,
+    SIGNAL_TARIFFS_RELOADED,
 )
+from .tariffs import TariffRegistry, as_registry, async_get_registry, load_tariffs  # noqa: F401 - load_tariffs re-exported
 
 _LOGGER = logging.getLogger(__name__)
 
 ENTITY_NAME_PL = "Taryfa dynamiczna"
 
 
-def load_tariffs() -> dict:
-    """Load tariffs from JSON file."""
-    path = os.path.join(os.path.dirname(__file__), "tariffs.json")
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {"sellers": [], "distributors": []}
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up binary sensors from config entry."""
-    tariffs_data = await hass.async_add_executor_job(load_tariffs)
+    tariffs = await async_get_registry(hass)
     async_add_entities(
-        [TGEDynamicTariffBinarySensor(entry, tariffs_data)],
+        [TGEDynamicTariffBinarySensor(entry, tariffs)],
         True,
     )
 
@@ -49,28 +41,39 @@ async def async_setup_entry(
 class TGEDynamicTariffBinarySensor(BinarySensorEntity):
     """Binary sensor indicating whether the configured seller tariff is dynamic."""
 
-    def __init__(self, entry: ConfigEntry, tariffs_data: dict) -> None:
+    def __init__(self, entry: ConfigEntry, tariffs: TariffRegistry) -> None:
         """Initialize binary sensor."""
         self._entry = entry
-        self._tariffs_data = tariffs_data
+        self._tariffs = as_registry(tariffs)
         self._attr_has_entity_name = True
         self._attr_name = ENTITY_NAME_PL
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{SENSOR_IS_DYNAMIC}"
         self._attr_icon = "mdi:lightning-bolt"
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to in-place option changes and tariff reloads."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_TARIFFS_RELOADED, self._async_tariffs_reloaded)
+        )
+
+    @callback
+    def _async_tariffs_reloaded(self, tariffs: TariffRegistry) -> None:
+        """Switch to the reloaded tariffs.json."""
+        self._tariffs = tariffs
+        self.async_write_ha_state()
+
     def _resolve_is_dynamic(self) -> bool:
         """Look up is_dynamic flag from tariffs data for the selected seller tariff."""
         opts = self._entry.options
-        dealer = opts.get(CONF_DEALER)
-        dealer_tariff = opts.get(CONF_DEALER_TARIFF)
-        if dealer and dealer_tariff:
-            for seller in self._tariffs_data.get("sellers", []):
-                if seller["name"] == dealer:
-                    for tariff in seller.get("tariffs", []):
-                        if tariff["name"] == dealer_tariff:
-                            return tariff.get("is_dynamic", False)
-                    break
-        return False
+        tariff = self._tariffs.seller_tariff(opts.get(CONF_DEALER), opts.get(CONF_DEALER_TARIFF))
+        return tariff.is_dynamic if tariff else False
 
     @property
     def is_on(self) -> bool:
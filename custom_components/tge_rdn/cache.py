@@ -0,0 +1,71 @@
+"""Delivery-day cache for parsed TGE price tables."""
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import Any, Dict, Optional
+
+from .series import DaySeries
+from .slots import hours_in_day
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def is_day_complete(day: date, data: Optional[DaySeries]) -> bool:
+    """Check whether parsed data holds every delivery hour of the day (DST-aware)."""
+    if not data:
+        return False
+    return data.total_hours >= hours_in_day(day)
+
+
+class DayCache:
+    """Parsed day tables keyed by delivery date.
+
+    A complete day is final: published RDN prices never change, so a final
+    day is served from memory and never fetched again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize cache."""
+        self._days: Dict[date, DaySeries] = {}
+        self._final: set = set()
+
+    def get(self, day: date) -> Optional[DaySeries]:
+        """Return cached data for a delivery date."""
+        return self._days.get(day)
+
+    def is_final(self, day: date) -> bool:
+        """Return True if the day is complete and must not be refetched."""
+        return day in self._final
+
+    def store(self, day: date, data: Optional[DaySeries]) -> bool:
+        """Cache parsed data for a day; return True if the day became final."""
+        if not data:
+            return False
+        self._days[day] = data
+        if day not in self._final and is_day_complete(day, data):
+            self._final.add(day)
+            _LOGGER.debug(f"✅ {day} complete ({data.total_hours}h), marked final")
+            return True
+        return False
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialize for storage, keyed by ISO delivery date."""
+        return {"days": {day.isoformat(): data.as_dict() for day, data in sorted(self._days.items())}}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "DayCache":
+        """Restore from storage; finality is re-derived from completeness."""
+        cache = cls()
+        for iso, day_data in (data or {}).get("days", {}).items():
+            try:
+                cache.store(date.fromisoformat(iso), DaySeries.from_dict(day_data))
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning(f"Ignoring invalid cached day: {iso}")
+        return cache
+
+    def prune(self, keep_from: date) -> None:
+        """Forget delivery dates before `keep_from`."""
+        for day in [d for d in self._days if d < keep_from]:
+            self._days.pop(day, None)
+            self._final.discard(day)
@@ -1,19 +1,17 @@
 """Config flow for TGE RDN integration."""
-import json
-import os
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from .const import *
+from .tariffs import async_get_registry
 
-def load_tariffs():
-    """Load tariffs from JSON file (blocking I/O — call via executor)."""
-    path = os.path.join(os.path.dirname(__file__), "tariffs.json")
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {"sellers": [], "distributors": []}
+
+def _apply_tariff_fees(data: dict, tariffs) -> None:
+    """Auto-populate fees from JSON for dynamic tariffs."""
+    tariff = tariffs.seller_tariff(data.get(CONF_DEALER), data.get(CONF_DEALER_TARIFF))
+    if tariff and tariff.is_dynamic:
+        data[CONF_EXCHANGE_FEE] = tariff.exchange_fee
+        data[CONF_TRADE_FEE] = tariff.trade_fee
 
 class TGERDNConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle config flow."""
@@ -22,19 +20,19 @@ class TGERDNConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize."""
         self.data = {}
-        self.tariffs_data = None
+        self.tariffs = None
 
     async def async_step_user(self, user_input=None):
         """Step 1: Select Dealer and Distributor."""
-        if self.tariffs_data is None:
-            self.tariffs_data = await self.hass.async_add_executor_job(load_tariffs)
+        if self.tariffs is None:
+            self.tariffs = await async_get_registry(self.hass)
 
         if user_input is not None:
             self.data.update(user_input)
             return await self.async_step_tariffs()
 
-        sellers = [d["name"] for d in self.tariffs_data.get("sellers", [])]
-        distributors = [d["name"] for d in self.tariffs_data.get("distributors", [])]
+        sellers = self.tariffs.sellers()
+        distributors = self.tariffs.distributors()
 
         return self.async_show_form(
             step_id="user",
@@ -52,18 +50,7 @@ class TGERDNConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Step 2: Select Tariffs."""
         if user_input is not None:
             self.data.update(user_input)
-            # Auto-populate fees from JSON for dynamic tariffs
-            dealer_tariff_name = self.data.get(CONF_DEALER_TARIFF)
-            dealer_name = self.data.get(CONF_DEALER)
-            for d in self.tariffs_data.get("sellers", []):
-                if d["name"] == dealer_name:
-                    for t in d.get("tariffs", []):
-                        if t["name"] == dealer_tariff_name:
-                            if t.get("is_dynamic", False):
-                                self.data[CONF_EXCHANGE_FEE] = t.get("exchange_fee", DEFAULT_EXCHANGE_FEE)
-                                self.data[CONF_TRADE_FEE] = t.get("trade_fee", DEFAULT_TRADE_FEE)
-                            break
-                    break
+            _apply_tariff_fees(self.data, self.tariffs)
             await self.async_set_unique_id("tge_rdn_integration")
             self._abort_if_unique_id_configured()
             return self.async_create_entry(title="TGE RDN Energy Prices", data={}, options=self.data)
@@ -71,17 +58,8 @@ class TGERDNConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         dealer_name = self.data.get(CONF_DEALER)
         dist_name = self.data.get(CONF_DISTRIBUTOR)
 
-        dealer_tariffs = []
-        for d in self.tariffs_data.get("sellers", []):
-            if d["name"] == dealer_name:
-                dealer_tariffs = [t["name"] for t in d.get("tariffs", [])]
-                break
-
-        dist_tariffs = []
-        for d in self.tariffs_data.get("distributors", []):
-            if d["name"] == dist_name:
-                dist_tariffs = [t["name"] for t in d.get("tariffs", [])]
-                break
+        dealer_tariffs = self.tariffs.seller_tariffs(dealer_name)
+        dist_tariffs = self.tariffs.distribution_tariffs(dist_name)
 
         return self.async_show_form(
             step_id="tariffs",
@@ -103,20 +81,20 @@ class TGERDNOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self._config_entry = config_entry
         self._data = dict(config_entry.options)
-        self._tariffs_data = None
+        self._tariffs = None
 
     async def async_step_init(self, user_input=None):
         """Step 1: Select Seller and Distributor."""
-        if self._tariffs_data is None:
-            self._tariffs_data = await self.hass.async_add_executor_job(load_tariffs)
+        if self._tariffs is None:
+            self._tariffs = await async_get_registry(self.hass)
 
         if user_input is not None:
             self._data.update(user_input)
             return await self.async_step_tariffs()
 
         opts = self._config_entry.options
-        sellers = [d["name"] for d in self._tariffs_data.get("sellers", [])]
-        distributors = [d["name"] for d in self._tariffs_data.get("distributors", [])]
+        sellers = self._tariffs.sellers()
+        distributors = self._tariffs.distributors()
 
         return self.async_show_form(
             step_id="init",
@@ -127,6 +105,7 @@ class TGERDNOptionsFlow(config_entries.OptionsFlow):
                     [UNIT_PLN_KWH, UNIT_PLN_MWH, UNIT_EUR_KWH, UNIT_EUR_MWH]
                 ),
                 vol.Required(CONF_VAT_RATE, default=opts.get(CONF_VAT_RATE, DEFAULT_VAT_RATE)): vol.Coerce(float),
+                vol.Optional(CONF_EXTRA_HOLIDAYS, default=opts.get(CONF_EXTRA_HOLIDAYS, "")): str,
             })
         )
 
@@ -134,35 +113,15 @@ class TGERDNOptionsFlow(config_entries.OptionsFlow):
         """Step 2: Select Tariffs."""
         if user_input is not None:
             self._data.update(user_input)
-            # Auto-populate fees from JSON for dynamic tariffs
-            dealer_tariff_name = self._data.get(CONF_DEALER_TARIFF)
-            dealer_name = self._data.get(CONF_DEALER)
-            for d in self._tariffs_data.get("sellers", []):
-                if d["name"] == dealer_name:
-                    for t in d.get("tariffs", []):
-                        if t["name"] == dealer_tariff_name:
-                            if t.get("is_dynamic", False):
-                                self._data[CONF_EXCHANGE_FEE] = t.get("exchange_fee", DEFAULT_EXCHANGE_FEE)
-                                self._data[CONF_TRADE_FEE] = t.get("trade_fee", DEFAULT_TRADE_FEE)
-                            break
-                    break
+            _apply_tariff_fees(self._data, self._tariffs)
             return self.async_create_entry(title="", data=self._data)
 
         opts = self._data
         dealer_name = opts.get(CONF_DEALER)
         dist_name = opts.get(CONF_DISTRIBUTOR)
 
-        dealer_tariffs = []
-        for d in self._tariffs_data.get("sellers", []):
-            if d["name"] == dealer_name:
-                dealer_tariffs = [t["name"] for t in d.get("tariffs", [])]
-                break
-
-        dist_tariffs = []
-        for d in self._tariffs_data.get("distributors", []):
-            if d["name"] == dist_name:
-                dist_tariffs = [t["name"] for t in d.get("tariffs", [])]
-                break
+        dealer_tariffs = self._tariffs.seller_tariffs(dealer_name)
+        dist_tariffs = self._tariffs.distribution_tariffs(dist_name)
 
         return self.async_show_form(
             step_id="tariffs",
@@ -8,6 +8,8 @@ UNIT_PLN_MWH = "PLN/MWh"
 UNIT_PLN_KWH = "PLN/kWh"
 UNIT_EUR_MWH = "EUR/MWh"
 UNIT_EUR_KWH = "EUR/kWh"
+# PLN per EUR when the page quotes no Fixing II EUR price for the day
+DEFAULT_EUR_RATE = 4.3
 
 # Configuration
 CONF_UNIT = "unit"
@@ -20,6 +22,7 @@ CONF_DIST_TARIFF = "dist_tariff"
 
 CONF_EXCHANGE_FEE = "exchange_fee"
 CONF_VAT_RATE = "vat_rate"
+CONF_EXTRA_HOLIDAYS = "extra_holidays"
 CONF_DIST_LOW = "dist_low"
 CONF_DIST_MED = "dist_med"
 CONF_DIST_HIGH = "dist_high"
@@ -29,6 +32,14 @@ CONF_SUBSCRIPTION_FEE = "subscription_fee"
 CONF_CAPACITY_FEE = "capacity_fee"
 CONF_TRADE_FEE = "trade_fee"
 
+# Dispatcher signal (format with entry_id): options changed, recompute in place
+SIGNAL_OPTIONS_UPDATED = "tge_rdn_options_updated_{}"
+# Dispatcher signal (arg: new TariffRegistry): tariffs.json changed on disk
+SIGNAL_TARIFFS_RELOADED = "tge_rdn_tariffs_reloaded"
+
+# hass.data[DOMAIN] key of the shared TariffRegistry
+DATA_TARIFFS = "tariffs"
+
 # Binary sensor
 SENSOR_IS_DYNAMIC = "is_dynamic_tariff"
 
@@ -43,11 +54,58 @@ DEFAULT_SUBSCRIPTION_FEE = 0.0
 DEFAULT_CAPACITY_FEE = 0.0
 DEFAULT_TRADE_FEE = 0.0
 
+# Price slot length (minutes); sensors re-render on every slot boundary.
+# Days with a quarter-hour (15-minute MTU) series use QUARTER_MINUTES.
+SLOT_MINUTES = 60
+QUARTER_MINUTES = 15
+
 # Update intervals (seconds)
-UPDATE_INTERVAL_CURRENT = 300      # 5 min
-UPDATE_INTERVAL_NEXT_DAY = 600     # 10 min
-UPDATE_INTERVAL_FREQUENT = 900     # 15 min
-UPDATE_INTERVAL_NORMAL = 3600      # 1 hour
+UPDATE_INTERVAL_CURRENT = 300      # 5 min — retry while today is incomplete
+
+# tariffs.json modification check for hot reload (seconds)
+TARIFFS_CHECK_INTERVAL = 300       # 5 min
+
+# Persistent price cache (parsed day tables keyed by delivery date)
+PRICE_CACHE_STORAGE_KEY = "tge_rdn.price_cache"
+PRICE_CACHE_STORAGE_VERSION = 1
+PRICE_CACHE_SAVE_DELAY = 10  # seconds
+
+# Price history (final delivery days, filled by the coordinator and backfill):
+# binary archive in .storage, plus a Store for the running backfill range
+HISTORY_ARCHIVE_FILE = "tge_rdn.price_archive"
+HISTORY_STORAGE_KEY = "tge_rdn.price_history"
+HISTORY_STORAGE_VERSION = 1
+
+# Backfill service: parallel requests, pacing between request starts (seconds)
+SERVICE_BACKFILL = "backfill"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_CONCURRENCY = "concurrency"
+BACKFILL_CONCURRENCY = 4
+BACKFILL_MAX_CONCURRENCY = 8
+BACKFILL_REQUEST_INTERVAL = 0.5
+# Ranges at least this long are parsed in a process pool
+BACKFILL_PROCESS_POOL_MIN_DAYS = 31
+
+# Publication scheduler (minutes of local day / seconds between polls)
+PUBLICATION_STORAGE_KEY = "tge_rdn.publication_times"
+PUBLICATION_STORAGE_VERSION = 1
+PUBLICATION_BUCKET_MINUTES = 5
+PUBLICATION_MIN_OBSERVATIONS = 3
+PUBLICATION_MAX_OBSERVATIONS = 60
+PUBLICATION_PRIOR_WINDOW = (11 * 60, 16 * 60)  # 11:00–16:00 until learned
+PUBLICATION_WINDOW_MARGIN = 10
+POLL_INTERVAL_PRIOR = 300          # 5 min
+POLL_INTERVAL_DENSE = 60           # 1 min around the predicted instant
+POLL_INTERVAL_BACKOFF_MIN = 120    # 2 min, doubling after the window
+POLL_INTERVAL_BACKOFF_MAX = 1800   # 30 min
+
+# Stale-while-revalidate: retry pacing after tge.pl errors (doubles per failure)
+RETRY_INTERVAL_MIN = 60            # 1 min
+RETRY_INTERVAL_MAX = 900           # 15 min
 
 # TGE DATA SOURCE
 TGE_PAGE_URL = "https://tge.pl/energia-elektryczna-rdn"
+REQUEST_TIMEOUT = 30  # seconds
+STREAM_CHUNK_SIZE = 16 * 1024  # bytes per body read while streaming the table
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
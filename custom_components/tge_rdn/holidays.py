@@ -0,0 +1,109 @@
+"""Polish public holiday calendar with configurable extra non-working days."""
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statutory fixed-date holidays (month, day)
+FIXED_HOLIDAYS = ((1, 1), (1, 6), (5, 1), (5, 3), (8, 15), (11, 1), (11, 11), (12, 25), (12, 26))
+
+# Moveable holidays as days after Easter Sunday: Easter, Easter Monday,
+# Pentecost (Zielone Świątki), Corpus Christi (Boże Ciało)
+EASTER_OFFSETS = (0, 1, 49, 60)
+
+# (month, day, first_year, last_year); 0 = open-ended
+ExtraHoliday = Tuple[int, int, int, int]
+
+
+@lru_cache(maxsize=None)
+def _easter(y: int) -> date:
+    """Calculate Easter Sunday date for a given year."""
+    a = y % 19
+    b = y // 100
+    c = y % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    mon = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    return date(y, mon, day)
+
+
+def _parse_one(item) -> ExtraHoliday:
+    """Parse "YYYY-MM-DD" (one-off), "MM-DD" (yearly) or {"date", "from", "until"}."""
+    first = last = 0
+    if isinstance(item, dict):
+        text = str(item["date"])
+        first = int(item.get("from") or 0)
+        last = int(item.get("until") or 0)
+    else:
+        text = str(item)
+    parts = [int(p) for p in text.strip().split("-")]
+    if len(parts) == 3:
+        year, month, day = parts
+        first = last = year
+    elif len(parts) == 2:
+        month, day = parts
+    else:
+        raise ValueError(text)
+    # Validate against a leap year so 02-29 is accepted as a yearly date
+    date(first or 2000, month, day)
+    return month, day, first, last
+
+
+def parse_extra_holidays(items: Iterable) -> Tuple[ExtraHoliday, ...]:
+    """Normalize extra non-working days from tariffs.json or options.
+
+    Accepts a list of entries or a comma/whitespace separated string;
+    invalid entries are skipped with a warning. The result is hashable, so
+    it can key the per-year calendar cache.
+    """
+    if isinstance(items, str):
+        items = items.replace(",", " ").split()
+    parsed = []
+    for item in items or ():
+        try:
+            parsed.append(_parse_one(item))
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning(f"⚠️ Ignoring invalid extra holiday: {item!r}")
+    return tuple(sorted(set(parsed)))
+
+
+@lru_cache(maxsize=64)
+def holidays_for_year(year: int, extra: Tuple[ExtraHoliday, ...] = ()) -> FrozenSet[date]:
+    """All non-working days of a year, computed once per (year, extra)."""
+    days = {date(year, month, day) for month, day in FIXED_HOLIDAYS}
+    easter = _easter(year)
+    days.update(easter + timedelta(days=offset) for offset in EASTER_OFFSETS)
+    for month, day, first, last in extra:
+        if (not first or year >= first) and (not last or year <= last):
+            try:
+                days.add(date(year, month, day))
+            except ValueError:
+                continue  # 29 February outside leap years
+    return frozenset(days)
+
+
+def is_polish_holiday(d: date, extra: Tuple[ExtraHoliday, ...] = ()) -> bool:
+    """Check if a date is a Polish public holiday (or a configured extra day)."""
+    return d in holidays_for_year(d.year, extra)
+
+
+def holidays_in_range(
+    start: date, end: date, extra: Tuple[ExtraHoliday, ...] = ()
+) -> List[date]:
+    """Sorted non-working days in [start, end)."""
+    days: List[date] = []
+    for year in range(start.year, end.year + 1):
+        days.extend(d for d in holidays_for_year(year, extra) if start <= d < end)
+    return sorted(days)
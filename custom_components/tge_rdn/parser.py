@@ -0,0 +1,539 @@
+"""TGE RDN HTML table parser.
+
+Pure, blocking functions only — callers run them in the executor.
+
+Only the `<table id="rdn">` slice of the ~50 KB page is parsed. Row
+extraction is pluggable: the fastest installed backend is chosen
+(selectolax → lxml → stdlib tokenizer) and BeautifulSoup remains the
+fallback if a backend fails on unexpected markup.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:  # reported by sensor.REQUIRED_LIBRARIES_AVAILABLE
+    BeautifulSoup = None
+    SoupStrainer = None
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+from .const import QUARTER_MINUTES
+from .series import DaySeries
+from .slots import hours_in_day
+
+_LOGGER = logging.getLogger(__name__)
+
+# Format: 2025-11-22_H01 or 2025-11-22_H02a (DST marker)
+HOUR_ROW_RE = re.compile(r'(\d{4}-\d{2}-\d{2})_H(\d{2})([a-z]?)')
+# Format: 2025-11-22_Q00:15 (quarter ENDING at 00:15), optional DST marker
+QUARTER_ROW_RE = re.compile(r'(\d{4}-\d{2}-\d{2})_Q(\d{2}):(\d{2})([a-z]?)')
+
+# Rows of a table: per <tr>, the stripped text of each <td>
+TableRows = List[List[str]]
+
+# Column index per field; "price" fields are PLN/MWh unless suffixed _eur
+ColumnMap = Dict[str, int]
+
+# Layout as of 2025 — used when the <thead> cannot be recognized
+DEFAULT_COLUMN_MAP: ColumnMap = {
+    "fixing1": 2,
+    "fixing1_volume": 3,
+    "continuous": 4,
+    "continuous_volume": 5,
+    "fixing2_eur": 6,
+    "fixing2": 7,
+    "fixing2_volume": 8,
+    "min": 11,
+    "max": 12,
+    "weighted": 13,
+    "volume": 14,
+}
+
+# Headline price: Fixing I → Fixing II → weighted average of all sessions
+PRICE_PRIORITY = ("fixing1", "fixing2", "weighted")
+
+# (group header, column kind) → field
+_HEADER_FIELDS = {
+    ("fixing i", "price"): "fixing1",
+    ("fixing i", "volume"): "fixing1_volume",
+    ("notowania ciągłe", "price"): "continuous",
+    ("notowania ciągłe", "volume"): "continuous_volume",
+    ("fixing ii", "price_eur"): "fixing2_eur",
+    ("fixing ii", "price"): "fixing2",
+    ("fixing ii", "volume"): "fixing2_volume",
+    ("łącznie notowania", "min"): "min",
+    ("łącznie notowania", "max"): "max",
+    ("łącznie notowania", "price"): "weighted",
+    ("łącznie notowania", "volume"): "volume",
+}
+
+# Parsed layouts keyed by <thead> fingerprint
+_COLUMN_MAP_CACHE: Dict[str, ColumnMap] = {}
+
+
+def extract_table_html(html: str) -> Optional[str]:
+    """Return the raw `<table id="rdn">...</table>` markup, or None if absent."""
+    start = html.find('id="rdn"')
+    if start == -1:
+        start = html.find('table-rdb')
+    if start == -1:
+        return None
+    start = html.rfind('<table', 0, start)
+    if start == -1:
+        return None
+    end = html.find('</table>', start)
+    if end == -1:
+        return html[start:]
+    return html[start:end + len('</table>')]
+
+
+def page_fingerprint(html: str) -> str:
+    """Hash the price table markup so volatile page chrome doesn't defeat caching."""
+    content = extract_table_html(html) or html
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class _HeaderTokenizer(HTMLParser):
+    """Collect (text, colspan) of every <th> per <tr> of a <thead>."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows: List[List[Tuple[str, int]]] = []
+        self._cell: Optional[List[str]] = None
+        self._span = 1
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self.rows.append([])
+        elif tag == 'th' and self.rows:
+            self._cell = []
+            try:
+                self._span = int(dict(attrs).get('colspan') or 1)
+            except ValueError:
+                self._span = 1
+
+    def handle_endtag(self, tag):
+        if tag == 'th' and self._cell is not None:
+            self.rows[-1].append((' '.join(''.join(self._cell).split()), self._span))
+            self._cell = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def _column_kind(name: str) -> Optional[str]:
+    """Classify a second-row header ("Kurs jednolity [EUR/MWh]" → price_eur)."""
+    name = name.lower()
+    if name.startswith('kurs min'):
+        return 'min'
+    if name.startswith('kurs max'):
+        return 'max'
+    if name.startswith('kurs'):
+        return 'price_eur' if 'eur' in name else 'price'
+    if name.startswith('wolumen') and 'kupna' not in name and 'sprzeda' not in name:
+        return 'volume'
+    return None
+
+
+def _build_column_map(thead_html: str) -> Optional[ColumnMap]:
+    """Derive the column map from the two header rows (groups with colspan, then names)."""
+    tokenizer = _HeaderTokenizer()
+    tokenizer.feed(thead_html)
+    tokenizer.close()
+    rows = [r for r in tokenizer.rows if r]
+    if len(rows) < 2:
+        return None
+
+    groups: List[str] = []
+    for text, span in rows[0]:
+        groups.extend([text.lower()] * span)
+
+    columns: ColumnMap = {}
+    for index, (name, _span) in enumerate(rows[1]):
+        if index >= len(groups):
+            break
+        field = _HEADER_FIELDS.get((groups[index], _column_kind(name)))
+        if field and field not in columns:
+            columns[field] = index
+    return columns if "fixing1" in columns else None
+
+
+def column_map(table_html: Optional[str]) -> ColumnMap:
+    """Return the column map for a table, cached per <thead> fingerprint."""
+    if not table_html:
+        return DEFAULT_COLUMN_MAP
+    start = table_html.find('<thead')
+    end = table_html.find('</thead>', start)
+    if start == -1 or end == -1:
+        return DEFAULT_COLUMN_MAP
+    thead = table_html[start:end]
+    key = hashlib.blake2b(thead.encode('utf-8'), digest_size=16).hexdigest()
+    columns = _COLUMN_MAP_CACHE.get(key)
+    if columns is None:
+        columns = _build_column_map(thead)
+        if columns is None:
+            _LOGGER.warning("Unrecognized TGE table header, using default column layout")
+            columns = DEFAULT_COLUMN_MAP
+        elif columns != DEFAULT_COLUMN_MAP:
+            _LOGGER.info(f"📐 TGE table layout changed: {columns}")
+        _COLUMN_MAP_CACHE[key] = columns
+    return columns
+
+
+def _parse_price(text: str) -> Optional[float]:
+    """Normalize a TGE price cell ("1 234,56") to float, None when empty."""
+    if not text or text == '-':
+        return None
+    try:
+        return float(text.replace(',', '.').replace(' ', '').replace('\xa0', ''))
+    except ValueError:
+        return None
+
+
+class _TableRowTokenizer(HTMLParser):
+    """Collect <td> texts per <tr> from table markup without building a tree.
+
+    Text nodes are stripped and joined like bs4's get_text(strip=True);
+    a node fed in several pieces is stripped only once it is complete.
+    Unclosed cells/rows are closed by the next <td>/<tr> or </table>.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows: TableRows = []
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+        self._text: List[str] = []
+
+    def _flush_text(self) -> None:
+        if self._text:
+            text = ''.join(self._text).strip()
+            self._text = []
+            if text and self._cell is not None:
+                self._cell.append(text)
+
+    def _close_cell(self) -> None:
+        if self._cell is not None and self._row is not None:
+            self._row.append(''.join(self._cell))
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        if tag == 'tr':
+            self._close_cell()
+            self._row = []
+            self.rows.append(self._row)
+        elif tag == 'td' and self._row is not None:
+            self._close_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        if tag == 'td':
+            self._close_cell()
+        elif tag in ('tr', 'table'):
+            self._close_cell()
+            self._row = None
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._text.append(data)
+
+
+def _rows_tokenizer(table_html: str) -> TableRows:
+    """Stdlib backend: single-pass tokenizer over the table slice."""
+    tokenizer = _TableRowTokenizer()
+    tokenizer.feed(table_html)
+    tokenizer.close()
+    return tokenizer.rows
+
+
+def _rows_selectolax(table_html: str) -> TableRows:
+    """selectolax (lexbor) backend."""
+    tree = SelectolaxParser(table_html)
+    return [
+        [td.text(deep=True, separator='', strip=True) for td in tr.css('td')]
+        for tr in tree.css('tr')
+    ]
+
+
+def _rows_lxml(table_html: str) -> TableRows:
+    """lxml backend."""
+    table = lxml_html.fragment_fromstring(table_html)
+    return [
+        [''.join(t.strip() for t in td.itertext()) for td in tr.iter('td')]
+        for tr in table.iter('tr')
+    ]
+
+
+def _rows_bs4(table_html: str) -> TableRows:
+    """BeautifulSoup backend, restricted to <tr> elements by a SoupStrainer."""
+    soup = BeautifulSoup(table_html, 'html.parser', parse_only=SoupStrainer('tr'))
+    return [
+        [td.get_text(strip=True) for td in tr.find_all('td')]
+        for tr in soup.find_all('tr')
+    ]
+
+
+# Fastest first; the first available one is the default
+ROW_BACKENDS: Dict[str, Callable[[str], TableRows]] = {}
+if SelectolaxParser is not None:
+    ROW_BACKENDS['selectolax'] = _rows_selectolax
+if lxml_html is not None:
+    ROW_BACKENDS['lxml'] = _rows_lxml
+ROW_BACKENDS['tokenizer'] = _rows_tokenizer
+if BeautifulSoup is not None:
+    ROW_BACKENDS['bs4'] = _rows_bs4
+
+DEFAULT_BACKEND = next(iter(ROW_BACKENDS))
+
+
+def extract_table_rows(html: str, backend: Optional[str] = None) -> Optional[TableRows]:
+    """Return the price table as rows of cell texts, or None if the table is absent.
+
+    Falls back to the bs4 backend if the chosen one raises.
+    """
+    table_html = extract_table_html(html)
+    if table_html is None:
+        return None
+    name = backend or DEFAULT_BACKEND
+    try:
+        return ROW_BACKENDS[name](table_html)
+    except Exception as err:
+        if name == 'bs4' or 'bs4' not in ROW_BACKENDS:
+            raise
+        _LOGGER.warning(f"Parser backend {name} failed ({err}), falling back to bs4")
+        return _rows_bs4(table_html)
+
+
+class TableStream:
+    """Incrementally locate and collect the price table from decoded chunks.
+
+    Text is buffered only until `<table id="rdn">` is seen; from there on
+    only the table markup is kept. `done` turns True at `</table>`, after
+    which nothing more is buffered. If the marker never shows up, `html`
+    holds the whole page. Nothing is tokenized here: the slice is parsed
+    in the executor like any other page.
+    """
+
+    _START = 'id="rdn"'
+    _END = '</table>'
+
+    def __init__(self) -> None:
+        """Initialize stream."""
+        self._found = False
+        self._head = ''
+        self._scan_from = 0
+        self._table: List[str] = []
+        self._tail = ''
+        self.done = False
+
+    @property
+    def found(self) -> bool:
+        """True once the table start has been seen."""
+        return self._found
+
+    @property
+    def html(self) -> str:
+        """Table markup once found, otherwise everything read so far."""
+        return ''.join(self._table) if self.found else self._head
+
+    def feed(self, text: str) -> None:
+        """Consume the next decoded chunk."""
+        if self.done or not text:
+            return
+        if not self._found:
+            self._head += text
+            idx = self._head.find(self._START, self._scan_from)
+            if idx == -1:
+                self._scan_from = max(0, len(self._head) - len(self._START))
+                return
+            start = self._head.rfind('<table', 0, idx)
+            if start == -1:
+                self._scan_from = idx + len(self._START)
+                return
+            text = self._head[start:]
+            self._head = ''
+            self._found = True
+
+        # Look for the end tag, also when it straddles two chunks
+        window = self._tail + text
+        end = window.find(self._END)
+        if end != -1:
+            text = text[:end + len(self._END) - len(self._tail)]
+            self.done = True
+        self._tail = window[-(len(self._END) - 1):]
+        self._table.append(text)
+
+
+def parse_rdn_table(
+    html: str, target_date: datetime, backend: Optional[str] = None
+) -> Optional[DaySeries]:
+    """Parse the RDN price table from page HTML for a specific delivery date."""
+    rows = extract_table_rows(html, backend)
+    if rows is None:
+        _LOGGER.warning("Could not find price table")
+        return None
+    return parse_table_rows(rows, target_date, column_map(extract_table_html(html)))
+
+
+def _row_values(cells: List[str], columns: ColumnMap) -> Dict[str, float]:
+    """Parse every mapped numeric column of a row."""
+    values = {}
+    for field, col in columns.items():
+        if col < len(cells):
+            value = _parse_price(cells[col])
+            if value is not None:
+                values[field] = value
+    return values
+
+
+def _column_vectors(values: List[Dict[str, float]]) -> Dict[str, List[Optional[float]]]:
+    """Turn per-slot column dicts into one value list per column."""
+    names = sorted({name for v in values for name in v})
+    return {name: [v.get(name) for v in values] for name in names}
+
+
+def _mean(values: List[float]) -> float:
+    """Arithmetic mean."""
+    return sum(values) / len(values)
+
+
+# Hourly value of a column from its quarters: MW volumes and prices average
+# over the hour, the MWh total adds up and the session extremes stay extremes
+_HOURLY_AGGREGATES: Dict[str, Callable[[List[float]], float]] = {
+    "min": min,
+    "max": max,
+    "volume": sum,
+}
+
+
+def _hour_values(quarter_values: List[Dict[str, float]]) -> List[Dict[str, float]]:
+    """Per-hour column dicts of a complete quarter series (runs of four quarters)."""
+    hours = []
+    for i in range(0, len(quarter_values), 4):
+        run = quarter_values[i:i + 4]
+        merged = {}
+        for name in {name for v in run for name in v}:
+            values = [v[name] for v in run if name in v]
+            merged[name] = _HOURLY_AGGREGATES.get(name, _mean)(values)
+        hours.append(merged)
+    return hours
+
+
+def parse_table_rows(
+    rows: TableRows, target_date: datetime, columns: Optional[ColumnMap] = None
+) -> Optional[DaySeries]:
+    """Build the day series for a delivery date from extracted table rows.
+
+    Every mapped column is kept per slot (`DaySeries.columns` /
+    `quarter_columns`), so alternative price sources and the page's EUR
+    prices need no second parse.
+
+    Quarter-hour rows (`_Q00:15` … `_Q24:00`) are labelled by their END
+    time and go to the quarter arrays. When the day's quarter series is
+    complete, hourly prices are the mean of each hour's four quarters and
+    the hourly columns are aggregated from the quarter columns the same way
+    (`_HOURLY_AGGREGATES`); otherwise the `_H` rows are used.
+    """
+    columns = columns or DEFAULT_COLUMN_MAP
+    try:
+        date_str = target_date.strftime("%Y-%m-%d")
+        hour_rows = []
+        quarters = []
+        eur_rates = []
+
+        for cells in rows[2:]:  # Skip header rows
+            if len(cells) < 3:
+                continue
+
+            # First cell contains date and slot: "2025-11-22_H01" / "2025-11-22_Q00:15"
+            date_hour_text = cells[0]
+            quarter = QUARTER_ROW_RE.match(date_hour_text)
+            match = quarter or HOUR_ROW_RE.match(date_hour_text)
+            if not match or match.group(1) != date_str:
+                continue
+
+            values = _row_values(cells, columns)
+            price = next((values[f] for f in PRICE_PRIORITY if f in values), None)
+            if price is None:
+                continue
+
+            # The page's own PLN/EUR rate, from Fixing II quoted in both currencies
+            if values.get("fixing2_eur") and "fixing2" in values:
+                eur_rates.append(values["fixing2"] / values["fixing2_eur"])
+
+            if quarter:
+                start_minute = int(quarter.group(2)) * 60 + int(quarter.group(3)) - QUARTER_MINUTES
+                quarters.append((start_minute, quarter.group(4), price, values))
+            else:
+                hour_rows.append((int(match.group(2)), match.group(3), price, values))
+
+        # Repeated DST hour: all "a" quarters of the hour precede the "b" ones
+        quarters.sort(key=lambda q: (q[0] // 60, q[1], q[0]))
+        quarter_prices = [q[2] for q in quarters]
+
+        if quarters and len(quarters) == hours_in_day(target_date.date()) * 4:
+            # Whole-series aggregation: mean of each run of four quarters
+            hour_prices = [
+                sum(quarter_prices[i:i + 4]) / 4 for i in range(0, len(quarter_prices), 4)
+            ]
+            hour_numbers = [q[0] // 60 + 1 for q in quarters[::4]]
+            hour_markers = "".join(q[1] or " " for q in quarters[::4])
+            hour_columns = _column_vectors(_hour_values([q[3] for q in quarters]))
+            hourly_source = "quarters"
+        else:
+            # Sort by hour
+            hour_rows.sort(key=lambda h: (h[0], h[1]))
+            hour_prices = [h[2] for h in hour_rows]
+            hour_numbers = [h[0] for h in hour_rows]
+            hour_markers = "".join(h[1] or " " for h in hour_rows)
+            hour_columns = _column_vectors([h[3] for h in hour_rows])
+            hourly_source = "hours"
+
+        if not hour_prices:
+            _LOGGER.debug(f"No data for {date_str}")
+            return None
+
+        result = DaySeries(
+            target_date.date(),
+            hour_prices,
+            hour_numbers,
+            hour_markers,
+            quarter_prices,
+            [q[0] for q in quarters],
+            "".join(q[1] or " " for q in quarters),
+            hour_columns,
+            _column_vectors([q[3] for q in quarters]),
+            round(sum(eur_rates) / len(eur_rates), 4) if eur_rates else None,
+            hourly_source,
+        )
+
+        _LOGGER.debug(
+            f"✅ Found {result.total_hours} hours ({hourly_source}), "
+            f"{len(quarters)} quarters for {date_str}"
+        )
+        return result
+
+    except Exception as e:
+        _LOGGER.error(f"Error parsing table for {target_date.date()}: {e}")
+        return None
@@ -0,0 +1,278 @@
+"""Gross price rules and vectors shared by the coordinator and price entities of one entry."""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+from .const import (
+    CONF_DEALER,
+    CONF_DEALER_TARIFF,
+    CONF_DIST_LOW,
+    CONF_DIST_TARIFF,
+    CONF_DISTRIBUTOR,
+    CONF_EXCHANGE_FEE,
+    CONF_EXTRA_HOLIDAYS,
+    CONF_UNIT,
+    CONF_VAT_RATE,
+    DEFAULT_DIST_LOW,
+    DEFAULT_EUR_RATE,
+    DEFAULT_EXCHANGE_FEE,
+    DEFAULT_UNIT,
+    DEFAULT_VAT_RATE,
+    UNIT_EUR_KWH,
+    UNIT_EUR_MWH,
+    UNIT_PLN_KWH,
+)
+from .holidays import is_polish_holiday, parse_extra_holidays
+from .series import DaySeries
+from .slots import TGE_TIMEZONE, SlotIndex, as_market_time
+from .tariffs import TariffRegistry
+from .zones import compile_zones
+
+# Days × tariff variants kept; today/tomorrow/yesterday under a couple of option sets
+_MAX_ENTRIES = 8
+
+
+def to_unit(mwh: float, unit: str, eur_rate: Optional[float] = None) -> float:
+    """Convert PLN/MWh to `unit`; EUR uses the day's TGE rate."""
+    rate = eur_rate or DEFAULT_EUR_RATE
+    if unit == UNIT_PLN_KWH: return mwh / 1000
+    elif unit == UNIT_EUR_MWH: return mwh / rate
+    elif unit == UNIT_EUR_KWH: return mwh / (rate * 1000)
+    return mwh
+
+
+class TariffPricing:
+    """Gross price rules of one config entry: seller, fees, distribution zones, VAT, unit.
+
+    Built from entry options and the tariff registry by the coordinator and
+    by each price entity. Equal rules have equal `key`, so all of them read
+    the same `DayPrices` from the coordinator's `PriceBook`.
+    """
+
+    __slots__ = (
+        "unit",
+        "vat",
+        "is_dynamic",
+        "seller_prices",
+        "negative_prices_allowed",
+        "fee",
+        "zones",
+        "zone_table",
+        "extra_holidays",
+        "key",
+    )
+
+    def __init__(self, options: Mapping[str, Any], tariffs: TariffRegistry) -> None:
+        """Load unit, VAT, seller prices and distribution zones from entry options."""
+        self.unit = options.get(CONF_UNIT, DEFAULT_UNIT)
+        self.vat = options.get(CONF_VAT_RATE, DEFAULT_VAT_RATE)
+
+        # Load seller tariff info
+        seller = tariffs.seller_tariff(options.get(CONF_DEALER), options.get(CONF_DEALER_TARIFF))
+        self.is_dynamic = seller.is_dynamic if seller else False
+        self.seller_prices: Dict[str, float] = dict(seller.energy_prices) if seller else {}
+        self.negative_prices_allowed = seller.negative_prices_allowed if seller else False
+
+        # Exchange fee only applies for dynamic tariffs
+        self.fee = options.get(CONF_EXCHANGE_FEE, DEFAULT_EXCHANGE_FEE) if self.is_dynamic else 0.0
+
+        # Load distribution zone schedule from tariffs.json
+        dist = tariffs.distribution_tariff(options.get(CONF_DISTRIBUTOR), options.get(CONF_DIST_TARIFF))
+        if dist and dist.zone_table:
+            self.zones = dist.zones
+            self.zone_table = dist.zone_table
+        else:
+            # Fallback for legacy configs without zones in JSON
+            dl = options.get(CONF_DIST_LOW, DEFAULT_DIST_LOW)
+            self.zones = {"all": {"rate": dl, "schedule": [{"default": True}]}}
+            self.zone_table = compile_zones(self.zones)
+
+        # Extra non-working days: tariffs.json first, then the user's own list
+        self.extra_holidays = tuple(sorted(set(
+            tariffs.extra_holidays + parse_extra_holidays(options.get(CONF_EXTRA_HOLIDAYS, ""))
+        )))
+
+        self.key = (
+            self.unit, self.vat, self.fee, self.is_dynamic, self.negative_prices_allowed,
+            repr(self.seller_prices), repr(dict(self.zones)), self.extra_holidays,
+        )
+
+    def resolve(self, when: datetime) -> Tuple[str, float, Optional[float]]:
+        """Resolve (zone_name, dist_rate, energy_price_netto) for given time."""
+        local = as_market_time(when)
+        holiday = is_polish_holiday(local.date(), self.extra_holidays)
+        zone_name, dist_rate = self.zone_table.resolve(local, holiday)
+        if self.is_dynamic or not self.seller_prices:
+            energy_price = None  # caller must use TGE price
+        else:
+            energy_price = self.seller_prices.get(zone_name)
+            if energy_price is None:
+                energy_price = self.seller_prices.get("all")
+        return zone_name, dist_rate, energy_price
+
+    def zone_total(self, tge_price: float, when: datetime) -> Tuple[str, float]:
+        """Return (zone_name, total PLN/MWh netto+VAT) for given TGE price and time."""
+        zone_name, dist_rate, seller_price = self.resolve(when)
+        if seller_price is not None:
+            base = seller_price
+        else:
+            base = tge_price if self.negative_prices_allowed else max(0, tge_price)
+        subtotal_netto = base + self.fee + dist_rate
+        return zone_name, subtotal_netto * (1 + self.vat)
+
+    def apply_unit(self, mwh: float, eur_rate: Optional[float] = None) -> float:
+        """Convert PLN/MWh to the configured unit."""
+        return to_unit(mwh, self.unit, eur_rate)
+
+    def day_prices(self, book: "PriceBook", series: DaySeries) -> "DayPrices":
+        """Gross vectors of a day under these rules, from the shared book."""
+        return book.get(series, self.key, lambda day: build_day_prices(day, self.zone_total, self.apply_unit))
+
+
+def _schedule_block(index: SlotIndex, spot: Sequence[float], values: Sequence[float]) -> Dict[str, Any]:
+    """Slots as first start + step + parallel arrays (spot PLN/MWh, gross in unit).
+
+    Starts are implied by position; a gap in the day is filled with None
+    so the arithmetic stays valid.
+    """
+    starts = index.starts
+    if not starts:
+        return {"start": None, "step": index.step // 60, "spot": [], "gross": []}
+    first = starts[0]
+    size = (starts[-1] - first) // index.step + 1
+    gross = [round(v, 6) for v in values]
+    if size == len(starts):
+        spot_out: List[Optional[float]] = list(spot)
+        gross_out: List[Optional[float]] = gross
+    else:
+        spot_out = [None] * size
+        gross_out = [None] * size
+        for pos, ts in enumerate(starts):
+            slot = (ts - first) // index.step
+            spot_out[slot] = spot[pos]
+            gross_out[slot] = gross[pos]
+    return {
+        "start": datetime.fromtimestamp(first, TGE_TIMEZONE).isoformat(),
+        "step": index.step // 60,
+        "spot": spot_out,
+        "gross": gross_out,
+    }
+
+
+class DayPrices:
+    """Gross prices of one delivery day under one tariff configuration.
+
+    `gross` / `quarter_gross` are PLN/MWh including fees, distribution and
+    VAT, aligned with the series' hourly and quarter slots; `values` /
+    `quarter_values` are the same in the configured unit. `schedule` is
+    the ready-made compact payload of the price schedule entity.
+    """
+
+    __slots__ = (
+        "series",
+        "gross",
+        "zones",
+        "values",
+        "quarter_gross",
+        "quarter_zones",
+        "quarter_values",
+        "average",
+        "schedule",
+    )
+
+    def __init__(
+        self,
+        series: DaySeries,
+        gross: List[float],
+        zones: List[str],
+        values: List[float],
+        quarter_gross: List[float],
+        quarter_zones: List[str],
+        quarter_values: List[float],
+        average: Optional[float],
+    ) -> None:
+        """Initialize from per-slot vectors."""
+        self.series = series
+        self.gross = array('d', gross)
+        self.zones = tuple(zones)
+        self.values = array('d', values)
+        self.quarter_gross = array('d', quarter_gross)
+        self.quarter_zones = tuple(quarter_zones)
+        self.quarter_values = array('d', quarter_values)
+        self.average = average
+        self.schedule = {
+            "date": series.date,
+            "hours": _schedule_block(series.hour_index, series.hour_prices, self.values),
+        }
+        if series.has_quarters:
+            self.schedule["quarters"] = _schedule_block(
+                series.quarter_index, series.quarter_prices, self.quarter_values
+            )
+
+    def value_at(self, when: datetime) -> Optional[float]:
+        """Unit price of the slot holding `when`: its quarter if published, else its hour."""
+        pos = self.series.quarter_index.position(when)
+        if pos is not None:
+            return self.quarter_values[pos]
+        pos = self.series.hour_index.position(when)
+        return self.values[pos] if pos is not None else None
+
+
+def build_day_prices(
+    series: DaySeries,
+    gross: Callable[[float, datetime], Tuple[str, float]],
+    to_unit: Callable[[float, Optional[float]], float],
+) -> DayPrices:
+    """Evaluate `gross(price, slot start) -> (zone, PLN/MWh)` over every slot of a day."""
+    hours = [gross(price, series.hour_start(pos)) for pos, price in enumerate(series.hour_prices)]
+    quarters = [
+        gross(price, series.quarter_start(pos)) for pos, price in enumerate(series.quarter_prices)
+    ]
+    rate = series.eur_rate
+    hour_gross = [total for _zone, total in hours]
+    average = sum(hour_gross) / len(hour_gross) if hour_gross else None
+    return DayPrices(
+        series,
+        hour_gross,
+        [zone for zone, _total in hours],
+        [to_unit(total, rate) for total in hour_gross],
+        [total for _zone, total in quarters],
+        [zone for zone, _total in quarters],
+        [to_unit(total, rate) for _zone, total in quarters],
+        to_unit(average, rate) if average is not None else None,
+    )
+
+
+class PriceBook:
+    """Memo of `DayPrices` keyed by (series, tariff key).
+
+    Owned by the coordinator, so every price entity of an entry reads the
+    same vectors: they are computed once per new day series or option
+    change, not once per entity and state write.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty book."""
+        self._days: Dict[Tuple[int, Hashable], DayPrices] = {}
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def get(
+        self,
+        series: DaySeries,
+        tariff_key: Hashable,
+        build: Callable[[DaySeries], DayPrices],
+    ) -> DayPrices:
+        """Return the day's prices for a tariff, building them on first use."""
+        key = (id(series), tariff_key)
+        prices = self._days.get(key)
+        # DayPrices keeps its series alive, so a matching id is the same object
+        if prices is None:
+            prices = build(series)
+            self._days[key] = prices
+            while len(self._days) > _MAX_ENTRIES:
+                del self._days[next(iter(self._days))]
+        return prices
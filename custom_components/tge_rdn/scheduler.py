@@ -0,0 +1,109 @@
+"""Polling scheduler that learns when TGE publishes tomorrow's prices."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from .const import (
+    PUBLICATION_BUCKET_MINUTES,
+    PUBLICATION_MIN_OBSERVATIONS,
+    PUBLICATION_MAX_OBSERVATIONS,
+    PUBLICATION_PRIOR_WINDOW,
+    PUBLICATION_WINDOW_MARGIN,
+    POLL_INTERVAL_PRIOR,
+    POLL_INTERVAL_DENSE,
+    POLL_INTERVAL_BACKOFF_MIN,
+    POLL_INTERVAL_BACKOFF_MAX,
+)
+from .slots import TGE_TIMEZONE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _minute_of_day(when: datetime) -> float:
+    """Minutes since local (Europe/Warsaw) midnight, with seconds as fraction."""
+    local = when.astimezone(TGE_TIMEZONE) if when.tzinfo else when
+    return local.hour * 60 + local.minute + local.second / 60
+
+
+class PublicationScheduler:
+    """Pace tomorrow polls around the learned publication instant.
+
+    First-seen publication times are kept as a histogram of
+    PUBLICATION_BUCKET_MINUTES buckets (minute of day → count). Until
+    enough days have been observed the scheduler polls the whole prior
+    window at the old fixed rate. Afterwards it polls densely only inside
+    [p10 - margin, p90 + margin], sleeps before it, and backs off
+    exponentially after it.
+    """
+
+    def __init__(self, histogram: Optional[Dict[int, int]] = None) -> None:
+        """Initialize scheduler."""
+        self._histogram: Dict[int, int] = dict(histogram or {})
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "PublicationScheduler":
+        """Restore from storage."""
+        raw = (data or {}).get("histogram", {})
+        return cls({int(bucket): int(count) for bucket, count in raw.items()})
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialize for storage (JSON object keys must be strings)."""
+        return {"histogram": {str(bucket): count for bucket, count in sorted(self._histogram.items())}}
+
+    @property
+    def observations(self) -> int:
+        """Number of (aged) first-seen samples in the histogram."""
+        return sum(self._histogram.values())
+
+    def record(self, seen_at: datetime) -> None:
+        """Add a first-seen publication time."""
+        bucket = int(_minute_of_day(seen_at) // PUBLICATION_BUCKET_MINUTES) * PUBLICATION_BUCKET_MINUTES
+        self._histogram[bucket] = self._histogram.get(bucket, 0) + 1
+        if self.observations > PUBLICATION_MAX_OBSERVATIONS:
+            # Age old samples so a shift in TGE's timetable is picked up
+            self._histogram = {
+                b: c // 2 for b, c in self._histogram.items() if c // 2 > 0
+            }
+        _LOGGER.debug(f"⏰ Publication seen at bucket {bucket // 60:02d}:{bucket % 60:02d}")
+
+    def _quantile(self, q: float) -> int:
+        """Return the bucket start at cumulative fraction q."""
+        target = q * self.observations
+        running = 0
+        for bucket in sorted(self._histogram):
+            running += self._histogram[bucket]
+            if running >= target:
+                return bucket
+        return max(self._histogram)
+
+    @property
+    def learned(self) -> bool:
+        """True once enough days were observed to trust the histogram."""
+        return self.observations >= PUBLICATION_MIN_OBSERVATIONS
+
+    def window(self) -> Tuple[int, int]:
+        """Return (start, end) minute of day of the dense polling window."""
+        if not self.learned:
+            return PUBLICATION_PRIOR_WINDOW
+        start = self._quantile(0.1) - PUBLICATION_WINDOW_MARGIN
+        end = self._quantile(0.9) + PUBLICATION_BUCKET_MINUTES + PUBLICATION_WINDOW_MARGIN
+        return max(0, start), min(24 * 60, end)
+
+    def next_poll_delay(self, now: datetime, tomorrow_final: bool) -> Optional[float]:
+        """Seconds until the next tomorrow poll, or None to stop polling today."""
+        if tomorrow_final:
+            return None
+
+        minute = _minute_of_day(now)
+        start, end = self.window()
+        if minute < start:
+            return (start - minute) * 60
+        if minute <= end:
+            return POLL_INTERVAL_DENSE if self.learned else POLL_INTERVAL_PRIOR
+
+        # Past the window: the gap doubles with time since the window closed
+        since_end = (minute - end) * 60
+        delay = max(POLL_INTERVAL_BACKOFF_MIN, since_end)
+        return min(delay, POLL_INTERVAL_BACKOFF_MAX)
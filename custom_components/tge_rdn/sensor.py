@@ -1,15 +1,12 @@
 """TGE RDN sensor platform v2.1.4 - Web Table Parsing with Date Fix."""
 import logging
 import asyncio
-import re
-import json
-import os
-from datetime import datetime, timedelta, time, date
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta, timezone, date
+from typing import Dict, Optional, Any
 
 try:
-    import requests
-    from bs4 import BeautifulSoup
+    import aiohttp  # noqa: F401 - bundled with Home Assistant
+    from bs4 import BeautifulSoup  # noqa: F401 - used by parser
     REQUIRED_LIBRARIES_AVAILABLE = True
 except ImportError as err:
     REQUIRED_LIBRARIES_AVAILABLE = False
@@ -20,35 +17,35 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_track_point_in_time, async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.util import dt as dt_util
 
+from .api import TGERDNClient
+from .backfill import BackfillEngine
+from .cache import DayCache
+from .holidays import _easter, is_polish_holiday  # noqa: F401 - _easter re-exported
+from .pricing import DayPrices, PriceBook, TariffPricing
+from .tariffs import TariffRegistry, as_registry, async_get_registry, load_tariffs  # noqa: F401 - load_tariffs re-exported
 from .const import (
     DOMAIN,
     DEFAULT_NAME,
     TGE_PAGE_URL,
     UNIT_PLN_MWH,
-    UNIT_PLN_KWH,
-    UNIT_EUR_MWH,
-    UNIT_EUR_KWH,
-    CONF_UNIT,
-    DEFAULT_UNIT,
     CONF_DEALER,
     CONF_DISTRIBUTOR,
     CONF_DEALER_TARIFF,
     CONF_DIST_TARIFF,
-    CONF_EXCHANGE_FEE,
-    DEFAULT_EXCHANGE_FEE,
     CONF_VAT_RATE,
     DEFAULT_VAT_RATE,
-    CONF_DIST_LOW,
-    DEFAULT_DIST_LOW,
     CONF_DIST_MED,
     DEFAULT_DIST_MED,
     CONF_DIST_HIGH,
@@ -64,125 +61,31 @@ from .const import (
     CONF_TRADE_FEE,
     DEFAULT_TRADE_FEE,
     UPDATE_INTERVAL_CURRENT,
-    UPDATE_INTERVAL_NEXT_DAY,
-    UPDATE_INTERVAL_FREQUENT,
+    SLOT_MINUTES,
+    QUARTER_MINUTES,
+    PUBLICATION_STORAGE_KEY,
+    PUBLICATION_STORAGE_VERSION,
+    PRICE_CACHE_STORAGE_KEY,
+    PRICE_CACHE_STORAGE_VERSION,
+    PRICE_CACHE_SAVE_DELAY,
+    HISTORY_ARCHIVE_FILE,
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    RETRY_INTERVAL_MIN,
+    RETRY_INTERVAL_MAX,
+    SIGNAL_OPTIONS_UPDATED,
+    SIGNAL_TARIFFS_RELOADED,
+    TARIFFS_CHECK_INTERVAL,
 )
+from .parser import parse_rdn_table
+from .scheduler import PublicationScheduler
+from .series import DaySeries
+from .statistics import PriceStatistics
+from .slots import TGE_TIMEZONE, next_slot_boundary
+from .zones import resolve_zone  # noqa: F401 - re-exported
 
 _LOGGER = logging.getLogger(__name__)
 
-def load_tariffs():
-    """Load tariffs from JSON file."""
-    path = os.path.join(os.path.dirname(__file__), "tariffs.json")
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {"sellers": [], "distributors": []}
-
-
-def _easter(y: int):
-    """Calculate Easter Sunday date for a given year."""
-    a = y % 19
-    b = y // 100
-    c = y % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    l = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * l) // 451
-    mon = (h + l - 7 * m + 114) // 31
-    day = ((h + l - 7 * m + 114) % 31) + 1
-    return date(y, mon, day)
-
-
-def is_polish_holiday(d: date) -> bool:
-    """Check if a date is a Polish public holiday."""
-    fixed = [(1, 1), (1, 6), (5, 1), (5, 3), (8, 15), (11, 1), (11, 11), (12, 25), (12, 26)]
-    if (d.month, d.day) in fixed:
-        return True
-    easter_date = _easter(d.year)
-    moveable = [
-        easter_date,
-        easter_date + timedelta(days=1),
-        easter_date + timedelta(days=49),
-        easter_date + timedelta(days=60),
-    ]
-    return d in moveable
-
-
-def _matches_season(rule_season: str, dt: datetime) -> bool:
-    """Check if datetime falls within the rule's season."""
-    if rule_season == "all":
-        return True
-    month = dt.month
-    if rule_season == "summer":
-        return 4 <= month <= 9
-    if rule_season == "winter":
-        return month <= 3 or month >= 10
-    return True
-
-
-def _matches_days(rule_days: str, dt: datetime, is_holiday: bool) -> bool:
-    """Check if datetime matches the rule's day filter."""
-    if rule_days == "all":
-        return True
-    weekday = dt.weekday()  # 0=Mon, 6=Sun
-    if rule_days == "holidays":
-        return is_holiday
-    if rule_days == "weekends":
-        return weekday in (5, 6)
-    if rule_days == "workdays":
-        return weekday not in (5, 6) and not is_holiday
-    return True
-
-
-def resolve_zone(zones: dict, dt: datetime, is_holiday: bool) -> tuple:
-    """Resolve the active zone name and rate for a given datetime.
-
-    Args:
-        zones: Zone map from tariffs.json (zone_name -> {rate, schedule}).
-        dt: The datetime to evaluate.
-        is_holiday: Whether the date is a Polish public holiday.
-
-    Returns:
-        Tuple of (zone_name: str, rate: float).
-        Falls back to the default zone if no time-based rule matches.
-    """
-    default_zone = None
-    default_rate = 0.0
-    hour = dt.hour
-
-    for zone_name, zone_def in zones.items():
-        rate = zone_def.get("rate", 0.0)
-        for rule in zone_def.get("schedule", []):
-            if rule.get("default"):
-                default_zone = zone_name
-                default_rate = rate
-                continue
-
-            rule_hours = rule.get("hours", [])
-            rule_days = rule.get("days", "all")
-            rule_season = rule.get("season", "all")
-            rule_months = rule.get("months")
-
-            if hour not in rule_hours:
-                continue
-            if not _matches_days(rule_days, dt, is_holiday):
-                continue
-            if rule_months:
-                if dt.month not in rule_months:
-                    continue
-            elif not _matches_season(rule_season, dt):
-                continue
-
-            return (zone_name, rate)
-
-    return (default_zone or "all", default_rate)
-
 class DataNotAvailableError(Exception):
     """Custom exception for missing data."""
     pass
@@ -204,15 +107,28 @@ async def async_setup_entry(
     _LOGGER.info("✅ Web Table Parsing + DST Support Enabled")
     _LOGGER.info("💰 Price Source: Fixing I (primary)")
 
-    tariffs_data = await hass.async_add_executor_job(load_tariffs)
+    tariffs = await async_get_registry(hass)
 
-    coordinator = TGERDNDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = TGERDNDataUpdateCoordinator(hass, entry, tariffs)
+    hass.data[DOMAIN][entry.entry_id]["coordinator"] = coordinator
+    if await coordinator.async_restore():
+        # Sensors start from cached prices; tge.pl is contacted in the background
+        _LOGGER.info("✅ Prices restored from cache, refreshing in background")
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} background refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    if coordinator.backfill.pending:
+        entry.async_create_background_task(
+            hass, coordinator.backfill.async_resume(), f"{DOMAIN} backfill"
+        )
 
     entities = [
-        TGERDNSensor(coordinator, entry, "current_price", tariffs_data),
-        TGERDNSensor(coordinator, entry, "next_hour_price", tariffs_data),
-        TGERDNSensor(coordinator, entry, "daily_average", tariffs_data),
+        TGERDNSensor(coordinator, entry, "current_price", tariffs),
+        TGERDNSensor(coordinator, entry, "next_hour_price", tariffs),
+        TGERDNSensor(coordinator, entry, "daily_average", tariffs),
+        TGEPriceScheduleSensor(coordinator, entry, tariffs),
     ]
 
     # Fixed monthly fees
@@ -225,10 +141,27 @@ async def async_setup_entry(
     ]
 
     for fee_id, fee_name, conf_key, def_val in fees:
-        entities.append(TGEFixedFeeSensor(entry, fee_id, fee_name, conf_key, def_val, tariffs_data))
-
-    async_add_entities(entities, True)
-    async_track_time_interval(hass, coordinator.hourly_update_callback, timedelta(minutes=5))
+        entities.append(TGEFixedFeeSensor(entry, fee_id, fee_name, conf_key, def_val, tariffs))
+
+    async_add_entities(entities)
+    entry.async_on_unload(async_dispatcher_connect(
+        hass, SIGNAL_OPTIONS_UPDATED.format(entry.entry_id), coordinator.async_options_updated
+    ))
+    entry.async_on_unload(async_dispatcher_connect(
+        hass, SIGNAL_TARIFFS_RELOADED, coordinator.async_tariffs_reloaded
+    ))
+    # Days restored from cache may not have reached the recorder yet
+    coordinator.async_publish_statistics()
+    coordinator.async_schedule_slot_timer()
+    entry.async_on_unload(coordinator.async_cancel_slot_timer)
+
+    async def _async_check_tariffs(_now: datetime) -> None:
+        """Hot-reload tariffs.json when its mtime changed (signalled by the registry)."""
+        await async_get_registry(hass)
+
+    entry.async_on_unload(
+        async_track_time_interval(hass, _async_check_tariffs, timedelta(seconds=TARIFFS_CHECK_INTERVAL))
+    )
 
     if coordinator.data:
         today_ok = coordinator.data.get("today") is not None
@@ -239,274 +172,358 @@ async def async_setup_entry(
 class TGERDNDataUpdateCoordinator(DataUpdateCoordinator):
     """Coordinator for TGE RDN data."""
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, tariffs: TariffRegistry) -> None:
         """Initialize coordinator."""
         self.hass = hass
         self.entry = entry
-        self.tomorrow_data_available = False
-        self.last_tomorrow_check = None
-        self.last_hour_updated = datetime.now().hour
+        self._tariffs = as_registry(tariffs)
+        # Entry-level gross price rules; statistics are published with these
+        self.pricing = TariffPricing(entry.options, self._tariffs)
+        self.client = TGERDNClient(async_get_clientsession(hass))
+        self.day_cache = DayCache()
+        # Gross price vectors shared by this entry's price entities
+        self.price_book = PriceBook()
+        self._unsub_slot_timer = None
+        self._current_day = datetime.now(TGE_TIMEZONE).date()
+        self.scheduler = PublicationScheduler()
+        self._scheduler_store = Store(hass, PUBLICATION_STORAGE_VERSION, PUBLICATION_STORAGE_KEY)
+        self._cache_store = Store(hass, PRICE_CACHE_STORAGE_VERSION, PRICE_CACHE_STORAGE_KEY)
+        # Final days kept beyond the cache window; seeded by the backfill service
+        self.backfill = BackfillEngine(
+            hass,
+            self.client,
+            Store(hass, HISTORY_STORAGE_VERSION, HISTORY_STORAGE_KEY),
+            hass.config.path(STORAGE_DIR, HISTORY_ARCHIVE_FILE),
+        )
+        # Complete days imported into the recorder's long-term statistics
+        self.statistics = PriceStatistics(hass, entry.entry_id)
+        # Delivery date whose table was polled before it was published
+        self._tomorrow_seen_missing: Optional[date] = None
+        # Delivery date whose next poll was timed by the scheduler (not a startup refresh)
+        self._tomorrow_poll_scheduled: Optional[date] = None
+        # Stale-while-revalidate: last answer from tge.pl and failed refreshes since
+        self.last_success: Optional[datetime] = None
+        self._consecutive_failures = 0
+        self._refresh_failed = False
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=self._get_update_interval()),
+            update_interval=self._next_update_interval(),
+            # Unchanged pages return the previous data object, so no listener push
+            always_update=False,
         )
 
     @callback
-    async def hourly_update_callback(self, now: datetime) -> None:
-        """Check for hour changes."""
-        current_hour = now.hour
-        if self.last_hour_updated != current_hour:
-            _LOGGER.info(f"⏰ Hour boundary: {self.last_hour_updated}:XX → {current_hour}:XX")
-            self.last_hour_updated = current_hour
-            await self.async_request_refresh()
-
-    def _get_update_interval(self) -> int:
-        """Get update interval based on time."""
-        now = datetime.now()
-        current_time = now.time()
-
-        if time(0, 5) <= current_time <= time(1, 0):
-            return UPDATE_INTERVAL_CURRENT
-        elif time(11, 0) <= current_time <= time(12, 0):
-            return UPDATE_INTERVAL_FREQUENT
-        elif time(12, 0) <= current_time <= time(16, 0):
-            return UPDATE_INTERVAL_NEXT_DAY
-        else:
-            return 1800
+    def async_update_listeners(self) -> None:
+        """Import newly published days into statistics, then notify entities."""
+        self.async_publish_statistics()
+        super().async_update_listeners()
 
-    def _parse_html_table_for_date(self, target_date: datetime) -> Optional[Dict[str, Any]]:
-        """Parse TGE HTML table to extract price data for specific date."""
-        try:
-            date_str = target_date.strftime("%Y-%m-%d")
-            # IMPORTANT: The TGE website shows prices for the NEXT day after dateShow parameter
-            # To get prices for date X, we need to request dateShow=X-1 (previous day)
-            previous_day = target_date - timedelta(days=1)
-            date_param = previous_day.strftime("%d-%m-%Y")
-            url_with_date = f"{TGE_PAGE_URL}?dateShow={date_param}"
-            _LOGGER.debug(f"🔍 Fetching table data for: {date_str} from {url_with_date}")
-
-            response = requests.get(url_with_date, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            if response.status_code != 200:
-                _LOGGER.warning(f"Failed to access TGE page: HTTP {response.status_code}")
-                return None
+    @callback
+    def async_options_updated(self) -> None:
+        """Rebuild gross price rules from new entry options."""
+        self.pricing = TariffPricing(self.entry.options, self._tariffs)
+        self.async_publish_statistics()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find the main table
-            table = soup.find('table', {'id': 'rdn'})
-            if not table:
-                table = soup.find('table', class_='table-rdb')
-            
-            if not table:
-                _LOGGER.warning("Could not find price table")
-                return None
-            
-            # Parse rows
-            rows = table.find_all('tr')
-            hourly_data = []
-            negative_hours = 0
-            
-            for row in rows[2:]:  # Skip header rows
-                cells = row.find_all('td')
-                if len(cells) < 3:
-                    continue
-                
-                # First cell contains date and hour: "2025-11-22_H01"
-                date_hour_text = cells[0].get_text(strip=True)
-                
-                # Skip quarter-hour entries
-                if '_Q' in date_hour_text:
-                    continue
-                
-                # Parse date and hour: format 2025-11-22_H01 or 2025-11-22_H02a
-                match = re.match(r'(\d{4}-\d{2}-\d{2})_H(\d{2})([a-z]?)', date_hour_text)
-                if not match:
-                    continue
-                
-                row_date_str = match.group(1)
-                hour_num = int(match.group(2))
-                dst_marker = match.group(3)
-                
-                # Only process rows for target date
-                if row_date_str != date_str:
-                    continue
-                
-                # Parse price - try multiple columns
-                price = None
-                
-                # Try Fixing I price (column 2) - PRIMARY SOURCE
-                if len(cells) > 2:
-                    price_text = cells[2].get_text(strip=True)
-                    if price_text and price_text != '-':
-                        price_text = price_text.replace(',', '.').replace(' ', '')
-                        try:
-                            price = float(price_text)
-                        except ValueError:
-                            pass
-                
-                # If no Fixing I, try Fixing II price (column 7)
-                if price is None and len(cells) > 7:
-                    price_text = cells[7].get_text(strip=True)
-                    if price_text and price_text != '-':
-                        price_text = price_text.replace(',', '.').replace(' ', '')
-                        try:
-                            price = float(price_text)
-                        except ValueError:
-                            pass
-                
-                # If still no price, try weighted average from all trading (column 13)
-                if price is None and len(cells) > 13:
-                    price_text = cells[13].get_text(strip=True)
-                    if price_text and price_text != '-':
-                        price_text = price_text.replace(',', '.').replace(' ', '')
-                        try:
-                            price = float(price_text)
-                        except ValueError:
-                            pass
-                
-                if price is None:
-                    continue
-                
-                if price < 0:
-                    negative_hours += 1
-                
-                hour_datetime = target_date.replace(
-                    hour=hour_num - 1,  # H01 = 00:00-01:00
-                    minute=0,
-                    second=0,
-                    microsecond=0
-                )
-                
-                hourly_data.append({
-                    'time': hour_datetime.isoformat(),
-                    'hour': hour_num,
-                    'price': price,
-                    'is_negative': price < 0,
-                    'dst_marker': dst_marker
-                })
-            
-            if not hourly_data:
-                _LOGGER.debug(f"No data for {date_str}")
-                return None
-            
-            # Sort by hour
-            hourly_data.sort(key=lambda x: x['hour'])
-            
-            # Calculate statistics
-            prices = [item['price'] for item in hourly_data]
-            
-            result = {
-                "date": target_date.date().isoformat(),
-                "hourly_data": hourly_data,
-                "average_price": sum(prices) / len(prices) if prices else 0,
-                "min_price": min(prices) if prices else 0,
-                "max_price": max(prices) if prices else 0,
-                "total_hours": len(hourly_data),
-                "negative_hours": negative_hours,
-            }
-            
-            _LOGGER.debug(f"✅ Found {len(hourly_data)} hours for {date_str}")
-            return result
-            
-        except Exception as e:
-            _LOGGER.error(f"Error parsing table for {target_date.date()}: {e}")
-            return None
+    @callback
+    def async_tariffs_reloaded(self, tariffs: TariffRegistry) -> None:
+        """Rebuild gross price rules from the reloaded tariffs.json."""
+        self._tariffs = tariffs
+        self.async_options_updated()
 
-    async def async_config_entry_first_refresh(self) -> None:
-        """First refresh with immediate fetch."""
-        try:
-            now = datetime.now()
-            _LOGGER.info(f"📡 Initial fetch for {now.date()}")
+    @callback
+    def async_publish_statistics(self) -> None:
+        """Hand complete days' gross vectors to the statistics importer.
+
+        Runs from the coordinator, so statistics keep flowing whichever
+        entities are enabled; the vectors are shared with matching entities.
+        """
+        data = self.data or {}
+        for key in ("today", "tomorrow"):
+            day = data.get(key)
+            if day is not None:
+                self.statistics.publish(self.pricing.day_prices(self.price_book, day))
 
-            today_data = await self._fetch_day_data(now, "today")
-            tomorrow = now + timedelta(days=1)
-            tomorrow_data = await self._fetch_day_data(tomorrow, "tomorrow")
+    @callback
+    def async_schedule_slot_timer(self) -> None:
+        """Schedule a re-render at the next price slot boundary."""
+        self.async_cancel_slot_timer()
+        boundary = next_slot_boundary(datetime.now(TGE_TIMEZONE), self._slot_minutes())
+        self._unsub_slot_timer = async_track_point_in_time(
+            self.hass, self._async_slot_boundary, boundary
+        )
 
-            if tomorrow_data:
-                self.tomorrow_data_available = True
-                self.last_tomorrow_check = now
+    def _slot_minutes(self) -> int:
+        """Re-render every quarter-hour only while today has a quarter series."""
+        today = (self.data or {}).get("today")
+        if today and today.has_quarters:
+            return QUARTER_MINUTES
+        return SLOT_MINUTES
 
-            self.data = {
-                "today": today_data,
-                "tomorrow": tomorrow_data,
-                "last_update": now,
-            }
-        except Exception as err:
-            _LOGGER.error(f"Error during initial fetch: {err}")
+    @callback
+    def async_cancel_slot_timer(self) -> None:
+        """Cancel the pending slot timer."""
+        if self._unsub_slot_timer:
+            self._unsub_slot_timer()
+            self._unsub_slot_timer = None
+
+    @callback
+    def _async_slot_boundary(self, now: datetime) -> None:
+        """Re-render current/next prices from cached data — never fetches."""
+        self._unsub_slot_timer = None
+        day = now.astimezone(TGE_TIMEZONE).date()
+        if day != self._current_day:
+            self._current_day = day
+            self._async_rollover(now)
+        else:
+            self.async_update_listeners()
+        self.async_schedule_slot_timer()
 
-        await super().async_config_entry_first_refresh()
+    @callback
+    def _async_rollover(self, now: datetime) -> None:
+        """Shift day buffers at midnight: tomorrow → today → yesterday, no fetch."""
+        data = self.data or {}
+        today = now.astimezone(TGE_TIMEZONE).date()
+        promoted = data.get("tomorrow")
+        if promoted and promoted.day != today:
+            promoted = None
+
+        _LOGGER.info(f"⏰ Day rollover to {today}: today {'✅' if promoted else '❌'} from cache")
+        self.day_cache.prune(today - timedelta(days=1))
+        # Tomorrow is not final any more; resume the publication schedule
+        self._tomorrow_poll_scheduled = today + timedelta(days=1)
+        self.update_interval = self._next_update_interval()
+        self.async_set_updated_data({
+            "yesterday": data.get("today"),
+            "today": promoted,
+            "tomorrow": None,
+            "last_update": datetime.now(TGE_TIMEZONE),
+            "last_success": self.last_success,
+            "stale": self.stale,
+        })
+        if promoted is None:
+            # Tomorrow was never published before midnight; fetch today now
+            self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_restore(self) -> bool:
+        """Restore cached prices and learned publication times from `.storage`.
+
+        Returns True when today's prices were restored, so setup can skip
+        the blocking first refresh.
+        """
+        scheduler_data, cache_data, _ = await asyncio.gather(
+            self._scheduler_store.async_load(),
+            self._cache_store.async_load(),
+            self.backfill.async_load(),
+        )
+        self.scheduler = PublicationScheduler.from_dict(scheduler_data)
+        if self.scheduler.learned:
+            start, end = self.scheduler.window()
+            _LOGGER.info(
+                f"⏰ Learned publication window {start // 60:02d}:{start % 60:02d}"
+                f"–{end // 60:02d}:{end % 60:02d} ({self.scheduler.observations} samples)"
+            )
+
+        now = datetime.now(TGE_TIMEZONE)
+        self.day_cache = DayCache.from_dict(cache_data)
+        self.day_cache.prune(now.date() - timedelta(days=1))
+        self.update_interval = self._next_update_interval()
+
+        today_data = self.day_cache.get(now.date())
+        if today_data is None:
+            return False
+        self.data = {
+            "yesterday": self.day_cache.get(now.date() - timedelta(days=1)),
+            "today": today_data,
+            "tomorrow": self.day_cache.get(now.date() + timedelta(days=1)),
+            "last_update": now,
+            # Not revalidated against tge.pl yet in this run
+            "last_success": None,
+            "stale": False,
+        }
+        return True
+
+    async def async_flush_storage(self) -> None:
+        """Write pending cache, scheduler and history data immediately."""
+        await asyncio.gather(
+            self._cache_store.async_save(self.day_cache.as_dict()),
+            self._scheduler_store.async_save(self.scheduler.as_dict()),
+            self.backfill.async_flush(),
+        )
+
+    @property
+    def stale(self) -> bool:
+        """True while cached prices are served because tge.pl keeps failing."""
+        return self._consecutive_failures > 0
+
+    def _next_update_interval(self) -> Optional[timedelta]:
+        """Pick the next poll: retry until today is complete, then follow the scheduler.
+
+        Returns None (polling stops) once tomorrow is final; the midnight
+        rollover re-arms it. After failed refreshes the next attempt comes
+        sooner, backing off exponentially up to RETRY_INTERVAL_MAX.
+        """
+        now = datetime.now(TGE_TIMEZONE)
+        if not self.day_cache.is_final(now.date()):
+            delay = UPDATE_INTERVAL_CURRENT
+        else:
+            delay = self.scheduler.next_poll_delay(
+                now, self.day_cache.is_final(now.date() + timedelta(days=1))
+            )
+        if self._consecutive_failures:
+            retry = min(
+                RETRY_INTERVAL_MIN * 2 ** (self._consecutive_failures - 1),
+                RETRY_INTERVAL_MAX,
+            )
+            delay = retry if delay is None else min(delay, retry)
+        if delay is None:
+            return None
+        return timedelta(seconds=max(delay, 1))
+
+    def _record_refresh_outcome(self, now: datetime) -> None:
+        """Update failure bookkeeping after a refresh attempt."""
+        if self._refresh_failed:
+            self._consecutive_failures += 1
+            _LOGGER.warning(
+                f"⚠️ tge.pl unavailable ({self._consecutive_failures}x), serving cached prices"
+            )
+        else:
+            if self._consecutive_failures:
+                _LOGGER.info("✅ tge.pl reachable again")
+            self._consecutive_failures = 0
+            self.last_success = now
+        self._tomorrow_poll_scheduled = datetime.now(TGE_TIMEZONE).date() + timedelta(days=1)
+        self.update_interval = self._next_update_interval()
+
+    def _serve_stale(self, now: datetime) -> Optional[Dict[str, Any]]:
+        """Return the last good data marked stale, or None when it has expired.
+
+        Cached prices only expire when their delivery date has passed.
+        """
+        if not self.data:
+            return None
+        today = self.data.get("today")
+        if not today or today.day != now.date():
+            return None
+        if self.data.get("stale") and self.data.get("last_success") == self.last_success:
+            return self.data
+        return {**self.data, "last_success": self.last_success, "stale": True}
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from TGE."""
         if not REQUIRED_LIBRARIES_AVAILABLE:
             raise UpdateFailed(f"Libraries not available: {IMPORT_ERROR}")
 
+        now = datetime.now(TGE_TIMEZONE)
+        self._refresh_failed = False
         try:
-            now = datetime.now()
-            today_data = await self._fetch_day_data(now, "today")
-            tomorrow_data = await self._handle_tomorrow_data(now)
-
-            return {
-                "today": today_data,
-                "tomorrow": tomorrow_data,
-                "last_update": now,
-            }
+            # Both days in one round-trip; final days resolve from cache instantly
+            today_data, tomorrow_data = await asyncio.gather(
+                self._fetch_day_data(now, "today"),
+                self._handle_tomorrow_data(now),
+            )
         except Exception as err:
             _LOGGER.error(f"Update error: {err}")
-            raise UpdateFailed(str(err))
-
-    async def _handle_tomorrow_data(self, now: datetime) -> Optional[Dict[str, Any]]:
-        """Handle tomorrow data with preservation."""
-        current_time = now.time()
-
-        should_fetch = (
-            time(12, 0) <= current_time <= time(16, 0) or
-            (time(16, 0) < current_time < time(22, 0) and not self.tomorrow_data_available)
-        )
-
-        if should_fetch:
-            tomorrow = now + timedelta(days=1)
-            new_data = await self._fetch_day_data(tomorrow, "tomorrow")
-
-            if new_data:
-                if not self.tomorrow_data_available:
-                    _LOGGER.info(f"🎉 Tomorrow data available!")
-                self.tomorrow_data_available = True
-                self.last_tomorrow_check = now
-                return new_data
-            elif self.data and self.data.get("tomorrow"):
-                return self.data.get("tomorrow")
-            else:
-                if current_time.hour >= 12:
-                    _LOGGER.info(f"Tomorrow data not yet available")
-                return None
-        elif self.data and self.data.get("tomorrow"):
-            return self.data.get("tomorrow")
+            self._refresh_failed = True
+            self._record_refresh_outcome(now)
+            stale = self._serve_stale(now)
+            if stale is None:
+                raise UpdateFailed(str(err))
+            return stale
+
+        self._record_refresh_outcome(now)
+        stale = self.stale
+        if (
+            self.data
+            and today_data is self.data.get("today")
+            and tomorrow_data is self.data.get("tomorrow")
+            and self.data.get("stale", False) == stale
+        ):
+            if not stale:
+                # Revalidated but unchanged: refresh the age without a listener push
+                self.data["last_success"] = self.last_success
+            return self.data
+
+        yesterday_data = (self.data or {}).get("yesterday")
+        if yesterday_data and yesterday_data.day != (now - timedelta(days=1)).date():
+            yesterday_data = None
+
+        return {
+            "yesterday": yesterday_data,
+            "today": today_data,
+            "tomorrow": tomorrow_data,
+            "last_update": now,
+            "last_success": self.last_success,
+            "stale": stale,
+        }
 
+    async def _handle_tomorrow_data(self, now: datetime) -> Optional[DaySeries]:
+        """Poll tomorrow until final, learning when it first appears."""
+        tomorrow = now + timedelta(days=1)
+        tomorrow_day = tomorrow.date()
+        previous = (self.data or {}).get("tomorrow")
+        if previous and previous.day != tomorrow_day:
+            previous = None
+
+        new_data = await self._fetch_day_data(tomorrow, "tomorrow")
+        if new_data:
+            # Already there on the first scheduled poll: an upper bound on the
+            # publication time, so a window that starts too late moves earlier
+            first_scheduled = previous is None and self._tomorrow_poll_scheduled == tomorrow_day
+            if self._tomorrow_seen_missing == tomorrow_day or first_scheduled:
+                _LOGGER.info(f"🎉 Tomorrow data available!")
+                self.scheduler.record(datetime.now(TGE_TIMEZONE))
+                self._scheduler_store.async_delay_save(self.scheduler.as_dict, 60)
+            self._tomorrow_seen_missing = None
+            return new_data
+        if previous:
+            return previous
+
+        if self._tomorrow_seen_missing != tomorrow_day:
+            _LOGGER.info(f"Tomorrow data not yet available")
+        self._tomorrow_seen_missing = tomorrow_day
         return None
 
     async def _fetch_day_data(
         self, date: datetime, day_type: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[DaySeries]:
         """Fetch data for specific date from HTML table."""
+        delivery_day = date.date()
+        if self.day_cache.is_final(delivery_day):
+            return self.day_cache.get(delivery_day)
+
         try:
             _LOGGER.debug(f"📥 Fetching {day_type} from HTML table...")
-            
-            result = await self.hass.async_add_executor_job(
-                self._parse_html_table_for_date, date
-            )
+
+            page = await self.client.async_fetch_page(date)
+            if page is None:
+                # tge.pl error: keep serving what we had for this delivery date
+                self._refresh_failed = True
+                return self.day_cache.get(delivery_day)
+            if not page.changed:
+                # Same table as last time: reuse the parsed result as-is
+                return page.entry.data
+
+            # Table slice (or whole page without the rdn marker): parsed in the executor
+            result = await self.hass.async_add_executor_job(parse_rdn_table, page.html, date)
+            page.entry.data = result
+
+            if self.day_cache.store(delivery_day, result):
+                # Final days are never requested again
+                self.client.forget(date)
+                await self.backfill.async_record(result)
+                self.day_cache.prune(datetime.now(TGE_TIMEZONE).date() - timedelta(days=1))
+            if result:
+                self._cache_store.async_delay_save(self.day_cache.as_dict, PRICE_CACHE_SAVE_DELAY)
 
             if not result:
                 _LOGGER.debug(f"No data for {day_type} ({date.date()})")
                 return None
 
-            hours = len(result.get('hourly_data', []))
-            avg = result.get('average_price', 0)
+            hours = result.total_hours
+            avg = result.average_price
             _LOGGER.info(f"✅ {day_type.title()} ({date.date()}): {hours}h, avg {avg:.2f}")
 
             return result
@@ -514,7 +531,8 @@ class TGERDNDataUpdateCoordinator(DataUpdateCoordinator):
             return None
         except Exception as err:
             _LOGGER.error(f"Error fetching {day_type}: {err}")
-            return None
+            self._refresh_failed = True
+            return self.day_cache.get(delivery_day)
 
 
 
@@ -524,6 +542,7 @@ ENTITY_NAMES_PL = {
     "current_price": "Aktualna cena",
     "next_hour_price": "Cena w następnej godzinie",
     "daily_average": "Średnia dzienna",
+    "price_schedule": "Harmonogram cen",
     "fixed_transmission_fee": "Stała opłata przesyłowa",
     "transitional_fee": "Opłata przejściowa",
     "subscription_fee": "Opłata abonamentowa",
@@ -535,7 +554,7 @@ ENTITY_NAMES_PL = {
 class TGEFixedFeeSensor(SensorEntity):
     """Sensor for fixed monthly fees."""
 
-    def __init__(self, entry: ConfigEntry, fee_id: str, fee_name: str, config_key: str, default_val: float, tariffs_data: dict = None) -> None:
+    def __init__(self, entry: ConfigEntry, fee_id: str, fee_name: str, config_key: str, default_val: float, tariffs: TariffRegistry) -> None:
         """Initialize fee sensor."""
         self._entry = entry
         self._fee_id = fee_id
@@ -546,7 +565,26 @@ class TGEFixedFeeSensor(SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{fee_id}"
         self._attr_native_unit_of_measurement = "PLN"
         self._attr_icon = "mdi:cash"
-        self._tariffs_data = tariffs_data if tariffs_data is not None else load_tariffs()
+        self._tariffs = as_registry(tariffs)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to in-place option changes and tariff reloads."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_TARIFFS_RELOADED, self._async_tariffs_reloaded)
+        )
+
+    @callback
+    def _async_tariffs_reloaded(self, tariffs: TariffRegistry) -> None:
+        """Switch to the reloaded tariffs.json."""
+        self._tariffs = tariffs
+        self.async_write_ha_state()
 
     def _load_fee(self) -> float:
         """Load fee value from tariffs data based on selected distributor/seller."""
@@ -554,25 +592,13 @@ class TGEFixedFeeSensor(SensorEntity):
 
         # trade_fee comes from seller tariff
         if self._fee_id == "trade_fee":
-            dealer = opts.get(CONF_DEALER)
-            dealer_tariff = opts.get(CONF_DEALER_TARIFF)
-            if dealer and dealer_tariff:
-                for s in self._tariffs_data.get("sellers", []):
-                    if s["name"] == dealer:
-                        for t in s.get("tariffs", []):
-                            if t["name"] == dealer_tariff:
-                                return t.get("trade_fee", self._default_val)
-            return self._default_val
+            tariff = self._tariffs.seller_tariff(opts.get(CONF_DEALER), opts.get(CONF_DEALER_TARIFF))
+            return tariff.trade_fee if tariff else self._default_val
 
         # Other fixed fees come from distributor tariff
-        dist = opts.get(CONF_DISTRIBUTOR)
-        dist_tariff = opts.get(CONF_DIST_TARIFF)
-        if dist and dist_tariff:
-            for d in self._tariffs_data.get("distributors", []):
-                if d["name"] == dist:
-                    for t in d.get("tariffs", []):
-                        if t["name"] == dist_tariff:
-                            return t.get("fixed_fees", {}).get(self._fee_id, self._default_val)
+        tariff = self._tariffs.distribution_tariff(opts.get(CONF_DISTRIBUTOR), opts.get(CONF_DIST_TARIFF))
+        if tariff:
+            return tariff.fixed_fees.get(self._fee_id, self._default_val)
         return self._default_val
 
     @property
@@ -590,7 +616,12 @@ class TGEFixedFeeSensor(SensorEntity):
 class TGERDNSensor(CoordinatorEntity, SensorEntity):
     """TGE RDN sensor."""
 
-    def __init__(self, coord, entry: ConfigEntry, sensor_type: str, tariffs_data: dict = None) -> None:
+    # Constant or ever-changing keys would add a new attributes row per state write
+    _unrecorded_attributes = frozenset({
+        "version", "source", "dst_support", "price_source", "last_update", "data_age",
+    })
+
+    def __init__(self, coord, entry: ConfigEntry, sensor_type: str, tariffs: TariffRegistry) -> None:
         """Initialize sensor."""
         super().__init__(coord)
         self._coord = coord
@@ -600,51 +631,65 @@ class TGERDNSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = ENTITY_NAMES_PL.get(sensor_type, sensor_type)
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{sensor_type}"
         self._last_hour = None
+        # ((available, state), attributes token) of the last coordinator-driven write
+        self._written: Optional[tuple] = None
+        self._tariffs = as_registry(tariffs)
+        # Gross price rules; entities and the coordinator with the same key share vectors
+        self._pricing = TariffPricing(entry.options, self._tariffs)
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator updates and in-place option changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_OPTIONS_UPDATED.format(self._entry.entry_id),
+                self._async_options_updated,
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_TARIFFS_RELOADED, self._async_tariffs_reloaded)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if value, availability or attributes changed."""
+        written = self._written
+        # A failed refresh keeps value and data but flips availability
+        value = (self.available, self.state)
+        token = self._attributes_token()
+        if written is not None and written[0] == value and self._same_token(written[1], token):
+            # Slot ticks and unchanged refreshes: no event, recorder row or frontend push
+            return
+        self._written = (value, token)
+        super()._handle_coordinator_update()
+
+    def _attributes_token(self) -> tuple:
+        """Everything extra_state_attributes derives from.
+
+        The coordinator data dict is replaced whenever prices, staleness or
+        the last fetch change; options swap the tariff key; the date flips
+        `is_working_day`.
+        """
+        return (self.coordinator.data, self._pricing.key, datetime.now(TGE_TIMEZONE).date())
+
+    @staticmethod
+    def _same_token(old: tuple, new: tuple) -> bool:
+        """Data compared by identity (it is kept alive by the token), the rest by value."""
+        return old[0] is new[0] and old[1:] == new[1:]
 
-        opts = entry.options
-        self._unit = opts.get(CONF_UNIT, DEFAULT_UNIT)
-        self._vat = opts.get(CONF_VAT_RATE, DEFAULT_VAT_RATE)
-
-        if tariffs_data is None:
-            tariffs_data = load_tariffs()
-
-        # Load seller tariff info
-        self._is_dynamic = False
-        self._seller_prices: Dict[str, float] = {}
-        self._negative_prices_allowed = False
-        dealer_name = opts.get(CONF_DEALER)
-        dealer_tariff_name = opts.get(CONF_DEALER_TARIFF)
-        if dealer_name and dealer_tariff_name:
-            for s in tariffs_data.get("sellers", []):
-                if s["name"] == dealer_name:
-                    self._negative_prices_allowed = s.get("negative_prices_allowed", False)
-                    for t in s.get("tariffs", []):
-                        if t["name"] == dealer_tariff_name:
-                            self._is_dynamic = t.get("is_dynamic", False)
-                            self._seller_prices = t.get("energy_prices_netto_mwh", {})
-                            break
-                    break
-
-        # Exchange fee only applies for dynamic tariffs
-        self._fee = opts.get(CONF_EXCHANGE_FEE, DEFAULT_EXCHANGE_FEE) if self._is_dynamic else 0.0
-
-        # Load distribution zone schedule from tariffs.json
-        self._zones = None
-        dist_name = opts.get(CONF_DISTRIBUTOR)
-        dist_tariff_name = opts.get(CONF_DIST_TARIFF)
-        if dist_name and dist_tariff_name:
-            for d in tariffs_data.get("distributors", []):
-                if d["name"] == dist_name:
-                    for t in d.get("tariffs", []):
-                        if t["name"] == dist_tariff_name:
-                            self._zones = t.get("zones")
-                            break
-                    break
-
-        # Fallback for legacy configs without zones in JSON
-        if not self._zones:
-            dl = opts.get(CONF_DIST_LOW, DEFAULT_DIST_LOW)
-            self._zones = {"all": {"rate": dl, "schedule": [{"default": True}]}}
+    @callback
+    def _async_options_updated(self) -> None:
+        """Rebuild tariff-derived values from new options; cached TGE prices stay."""
+        self._pricing = TariffPricing(self._entry.options, self._tariffs)
+        self.async_write_ha_state()
+
+    @callback
+    def _async_tariffs_reloaded(self, tariffs: TariffRegistry) -> None:
+        """Rebuild tariff-derived values from the reloaded tariffs.json."""
+        self._tariffs = tariffs
+        self._pricing = TariffPricing(self._entry.options, self._tariffs)
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
@@ -654,7 +699,7 @@ class TGERDNSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_unit_of_measurement(self) -> str:
         """Return unit."""
-        return self._unit
+        return self._pricing.unit
 
     @property
     def state(self) -> Optional[float]:
@@ -662,7 +707,7 @@ class TGERDNSensor(CoordinatorEntity, SensorEntity):
         if not REQUIRED_LIBRARIES_AVAILABLE or not self.coordinator.data:
             return None
         try:
-            h = datetime.now().hour
+            h = datetime.now(TGE_TIMEZONE).hour
             if self._sensor_type == "current_price" and self._last_hour and self._last_hour != h:
                 _LOGGER.info(f"⏰ Current price: {self._last_hour}:XX → {h}:XX")
             self._last_hour = h
@@ -671,101 +716,57 @@ class TGERDNSensor(CoordinatorEntity, SensorEntity):
             _LOGGER.error(f"Error: {err}")
             return None
 
-    def _resolve(self, when) -> tuple:
-        """Resolve (zone_name, dist_rate, energy_price_netto) for given time."""
-        try:
-            local = when.astimezone() if hasattr(when, 'astimezone') else when
-        except Exception:
-            local = when
-        holiday = is_polish_holiday(local.date())
-        zone_name, dist_rate = resolve_zone(self._zones, local, holiday)
-        if self._is_dynamic or not self._seller_prices:
-            energy_price = None  # caller must use TGE price
-        else:
-            energy_price = self._seller_prices.get(zone_name)
-            if energy_price is None:
-                energy_price = self._seller_prices.get("all")
-        return zone_name, dist_rate, energy_price
-
-    def _compute_total(self, tge_price: float, when) -> float:
-        """Compute total price in PLN/MWh netto+VAT for given TGE price and time."""
-        zone_name, dist_rate, seller_price = self._resolve(when)
-        if seller_price is not None:
-            base = seller_price
-        else:
-            base = tge_price if self._negative_prices_allowed else max(0, tge_price)
-        subtotal_netto = base + self._fee + dist_rate
-        return subtotal_netto * (1 + self._vat)
-
-    def _apply_unit(self, mwh: float) -> float:
-        if self._unit == UNIT_PLN_KWH: return mwh / 1000
-        elif self._unit == UNIT_EUR_MWH: return mwh / 4.3
-        elif self._unit == UNIT_EUR_KWH: return mwh / 4300
-        return mwh
-
-    def _get_dist(self, when) -> float:
-        """Distribution rate logic — delegates to resolve_zone()."""
-        _zone_name, rate, _ep = self._resolve(when)
-        return rate
-
     def _is_holiday(self, d: date) -> bool:
         """Check if Polish holiday."""
-        return is_polish_holiday(d)
+        return is_polish_holiday(d, self._pricing.extra_holidays)
 
     def _is_working_day(self) -> bool:
         """Check if today is a normal working day (not weekend or holiday)."""
-        today = datetime.now().date()
+        today = datetime.now(TGE_TIMEZONE).date()
         if today.weekday() in (5, 6):
             return False
-        return not is_polish_holiday(today)
+        return not is_polish_holiday(today, self._pricing.extra_holidays)
+
+    @staticmethod
+    def _day_at(data: Dict[str, Any], when: datetime) -> Optional[DaySeries]:
+        """Cached day whose slot index covers `when`."""
+        for key in ("today", "tomorrow"):
+            day = data.get(key)
+            if day and day.price_at(when) is not None:
+                return day
+        return None
+
+    def _day_prices(self, day: DaySeries) -> DayPrices:
+        """Gross vectors of a day, shared with the entry's other price entities."""
+        return self._pricing.day_prices(self.coordinator.price_book, day)
 
     def _calc(self) -> Optional[float]:
         """Calculate value."""
         d = self.coordinator.data
-        n = datetime.now()
+        n = datetime.now(timezone.utc)
 
-        if self._sensor_type == "current_price":
-            td = d.get("today")
-            if not td or not td.get("hourly_data"):
+        if self._sensor_type in ("current_price", "next_hour_price"):
+            when = n if self._sensor_type == "current_price" else n + timedelta(hours=1)
+            day = self._day_at(d, when)
+            if day is None:
                 return None
-            h = n.hour + 1
-            for x in td["hourly_data"]:
-                if x["hour"] == h:
-                    total = self._compute_total(x["price"], n)
-                    return self._apply_unit(total)
-            return None
-
-        elif self._sensor_type == "next_hour_price":
-            nh = n.hour + 2
-            next_time = n + timedelta(hours=1)
-            if nh > 24:
-                tm = d.get("tomorrow")
-                if not tm: return None
-                for x in tm.get("hourly_data", []):
-                    if x["hour"] == nh - 24:
-                        total = self._compute_total(x["price"], next_time)
-                        return self._apply_unit(total)
-            else:
-                td = d.get("today")
-                if not td: return None
-                for x in td.get("hourly_data", []):
-                    if x["hour"] == nh:
-                        total = self._compute_total(x["price"], next_time)
-                        return self._apply_unit(total)
-            return None
+            return self._day_prices(day).value_at(when)
 
         elif self._sensor_type == "daily_average":
             td = d.get("today")
             if not td: return None
-            tots = []
-            for x in td.get("hourly_data", []):
-                hdt = n.replace(hour=(x["hour"]-1)%24, minute=0, second=0, microsecond=0)
-                tots.append(self._compute_total(x["price"], hdt))
-            if not tots: return None
-            return self._apply_unit(sum(tots) / len(tots))
+            return self._day_prices(td).average
 
         return None
 
+    @staticmethod
+    def _data_age(data: Dict[str, Any]) -> Optional[int]:
+        """Seconds since prices were last confirmed by tge.pl, None if not yet."""
+        last_success = data.get("last_success")
+        if last_success is None:
+            return None
+        return int((datetime.now(TGE_TIMEZONE) - last_success).total_seconds())
+
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return attributes."""
@@ -779,48 +780,75 @@ class TGERDNSensor(CoordinatorEntity, SensorEntity):
             "dst_support": True,
             "price_source": "Fixing I",
             "last_update": data.get("last_update"),
-            "unit": self._unit,
+            "stale": data.get("stale", False),
+            "data_age": self._data_age(data),
+            "unit": self._pricing.unit,
             "is_working_day": self._is_working_day(),
         }
 
         if data.get("today"):
             today = data["today"]
-            n = datetime.now()
             attrs["today"] = {
-                "date": today.get("date"),
-                "hours": today.get("total_hours"),
-                "average": today.get("average_price"),
+                "date": today.date,
+                "hours": today.total_hours,
+                "average": today.average_price,
+                "eur_rate": today.eur_rate,
+                "quarters": len(today.quarter_prices),
             }
-            attrs["prices_today_gross"] = []
-            for h in today.get("hourly_data", []):
-                when = n.replace(hour=(h["hour"]-1)%24, minute=0, second=0, microsecond=0)
-                total = self._compute_total(h["price"], when)
-                attrs["prices_today_gross"].append({
-                    "hour": h["hour"],
-                    "time": h["time"],
-                    "price_tge": h["price"],
-                    "price_gross_pln_mwh": round(total, 2),
-                    "price_gross": round(self._apply_unit(total), 6),
-                })
 
         if data.get("tomorrow"):
             tomorrow = data["tomorrow"]
-            n = datetime.now()
             attrs["tomorrow"] = {
-                "date": tomorrow.get("date"),
-                "hours": tomorrow.get("total_hours"),
-                "average": tomorrow.get("average_price"),
+                "date": tomorrow.date,
+                "hours": tomorrow.total_hours,
+                "average": tomorrow.average_price,
+                "eur_rate": tomorrow.eur_rate,
+                "quarters": len(tomorrow.quarter_prices),
             }
-            attrs["prices_tomorrow_gross"] = []
-            for h in tomorrow.get("hourly_data", []):
-                when = (n + timedelta(days=1)).replace(hour=(h["hour"]-1)%24, minute=0, second=0, microsecond=0)
-                total = self._compute_total(h["price"], when)
-                attrs["prices_tomorrow_gross"].append({
-                    "hour": h["hour"],
-                    "time": h["time"],
-                    "price_tge": h["price"],
-                    "price_gross_pln_mwh": round(total, 2),
-                    "price_gross": round(self._apply_unit(total), 6),
-                })
 
         return attrs
+
+
+class TGEPriceScheduleSensor(TGERDNSensor):
+    """Per-slot spot and gross prices of today and tomorrow.
+
+    The state is the latest published delivery date. Each day's slots are
+    one compact block per resolution (first start, step in minutes and
+    parallel `spot` / `gross` arrays) in attributes the recorder skips, so
+    the database keeps only the date.
+    """
+
+    _unrecorded_attributes = TGERDNSensor._unrecorded_attributes | {"today", "tomorrow"}
+
+    def __init__(self, coord, entry: ConfigEntry, tariffs: TariffRegistry) -> None:
+        """Initialize schedule sensor."""
+        super().__init__(coord, entry, "price_schedule", tariffs)
+
+    @property
+    def native_unit_of_measurement(self) -> Optional[str]:
+        """The state is a date; the price unit is an attribute."""
+        return None
+
+    @property
+    def state(self) -> Optional[str]:
+        """Return the latest published delivery date."""
+        data = self.coordinator.data
+        if not REQUIRED_LIBRARIES_AVAILABLE or not data:
+            return None
+        latest = data.get("tomorrow") or data.get("today")
+        return latest.date if latest else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the schedule payload."""
+        if not REQUIRED_LIBRARIES_AVAILABLE or not self.coordinator.data:
+            return {}
+        data = self.coordinator.data
+        attrs = {
+            "unit": self._pricing.unit,
+            "stale": data.get("stale", False),
+        }
+        for key in ("today", "tomorrow"):
+            day = data.get(key)
+            attrs[key] = self._day_prices(day).schedule if day else None
+        return attrs
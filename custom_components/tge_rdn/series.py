@@ -0,0 +1,214 @@
+"""Compact array-backed price series for one delivery day."""
+from __future__ import annotations
+
+import math
+from array import array
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from .const import QUARTER_MINUTES, SLOT_MINUTES
+from .slots import TGE_TIMEZONE, SlotIndex
+
+# Slot lookup tables: hour number 1..25 / quarter start minute // 15 → position
+_HOUR_TABLE_SIZE = 26
+_QUARTER_TABLE_SIZE = 24 * 60 // QUARTER_MINUTES
+
+
+def _position_table(keys: Iterable[int], size: int) -> array:
+    """Map each key to the position of its first occurrence, -1 when absent."""
+    table = array('h', [-1]) * size
+    for pos, key in enumerate(keys):
+        if 0 <= key < size and table[key] == -1:
+            table[key] = pos
+    return table
+
+
+def _columns_to_arrays(columns: Optional[Dict[str, Sequence[Optional[float]]]]) -> Dict[str, array]:
+    """Pack per-slot column values into arrays, NaN for missing cells."""
+    return {
+        name: array('d', (math.nan if v is None else v for v in values))
+        for name, values in (columns or {}).items()
+    }
+
+
+class DaySeries:
+    """Hourly and quarter-hour TGE prices of one delivery day.
+
+    Prices live in `array('d')` indexed by slot position, with hour numbers
+    (H01 = 00:00–01:00), quarter start minutes and DST markers ("a"/"b",
+    space for none) kept alongside. Lookups by hour or quarter go through
+    small position tables, so they are O(1); min/max/average and the
+    negative-hour count are computed once at construction.
+
+    Time-dependent lookups go through `hour_index` / `quarter_index`
+    (`slots.SlotIndex`), which hold each slot's UTC start, so the repeated
+    fall-back hour and the missing spring-forward hour resolve correctly.
+    """
+
+    __slots__ = (
+        "day",
+        "hour_prices",
+        "hour_numbers",
+        "hour_markers",
+        "quarter_prices",
+        "quarter_minutes",
+        "quarter_markers",
+        "columns",
+        "quarter_columns",
+        "eur_rate",
+        "hourly_source",
+        "average_price",
+        "min_price",
+        "max_price",
+        "negative_hours",
+        "hour_index",
+        "quarter_index",
+        "_hour_pos",
+        "_quarter_pos",
+    )
+
+    def __init__(
+        self,
+        day: date,
+        hour_prices: Sequence[float],
+        hour_numbers: Sequence[int],
+        hour_markers: str = "",
+        quarter_prices: Sequence[float] = (),
+        quarter_minutes: Sequence[int] = (),
+        quarter_markers: str = "",
+        columns: Optional[Dict[str, Sequence[Optional[float]]]] = None,
+        quarter_columns: Optional[Dict[str, Sequence[Optional[float]]]] = None,
+        eur_rate: Optional[float] = None,
+        hourly_source: str = "hours",
+    ) -> None:
+        """Initialize series; markers are one character per slot."""
+        self.day = day
+        self.hour_prices = array('d', hour_prices)
+        self.hour_numbers = array('b', hour_numbers)
+        self.hour_markers = hour_markers.ljust(len(self.hour_prices))
+        self.quarter_prices = array('d', quarter_prices)
+        self.quarter_minutes = array('H', quarter_minutes)
+        self.quarter_markers = quarter_markers.ljust(len(self.quarter_prices))
+        self.columns = _columns_to_arrays(columns)
+        self.quarter_columns = _columns_to_arrays(quarter_columns)
+        self.eur_rate = eur_rate
+        self.hourly_source = hourly_source
+
+        prices = self.hour_prices
+        self.average_price = sum(prices) / len(prices) if prices else 0
+        self.min_price = min(prices) if prices else 0
+        self.max_price = max(prices) if prices else 0
+        self.negative_hours = sum(1 for p in prices if p < 0)
+
+        self._hour_pos = _position_table(self.hour_numbers, _HOUR_TABLE_SIZE)
+        self._quarter_pos = _position_table(
+            (m // QUARTER_MINUTES for m in self.quarter_minutes), _QUARTER_TABLE_SIZE
+        )
+        self.hour_index = SlotIndex.from_wall_clock(
+            day, [(h - 1) * 60 for h in self.hour_numbers], self.hour_markers, SLOT_MINUTES
+        )
+        self.quarter_index = SlotIndex.from_wall_clock(
+            day, self.quarter_minutes, self.quarter_markers, QUARTER_MINUTES
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"DaySeries({self.day}, hours={self.total_hours}, "
+            f"quarters={len(self.quarter_prices)})"
+        )
+
+    @property
+    def date(self) -> str:
+        """Delivery date as ISO string."""
+        return self.day.isoformat()
+
+    @property
+    def total_hours(self) -> int:
+        """Number of hourly slots."""
+        return len(self.hour_prices)
+
+    @property
+    def has_quarters(self) -> bool:
+        """True when a quarter-hour series was published."""
+        return len(self.quarter_prices) > 0
+
+    def hour_price(self, hour: int) -> Optional[float]:
+        """Price of hour number `hour` (1-based); the first one on a repeated DST hour."""
+        if not 0 <= hour < _HOUR_TABLE_SIZE:
+            return None
+        pos = self._hour_pos[hour]
+        return self.hour_prices[pos] if pos >= 0 else None
+
+    def quarter_price(self, minute: int) -> Optional[float]:
+        """Price of the quarter holding wall-clock `minute` of the day."""
+        index = minute // QUARTER_MINUTES
+        if not 0 <= index < _QUARTER_TABLE_SIZE:
+            return None
+        pos = self._quarter_pos[index]
+        return self.quarter_prices[pos] if pos >= 0 else None
+
+    def price_at(self, when: datetime) -> Optional[float]:
+        """Price of the slot holding `when`: its quarter if published, else its hour."""
+        pos = self.quarter_index.position(when)
+        if pos is not None:
+            return self.quarter_prices[pos]
+        pos = self.hour_index.position(when)
+        return self.hour_prices[pos] if pos is not None else None
+
+    def hour_start(self, pos: int) -> datetime:
+        """Aware Warsaw start of the hourly slot at position `pos`."""
+        return self.hour_index.start(pos).astimezone(TGE_TIMEZONE)
+
+    def quarter_start(self, pos: int) -> datetime:
+        """Aware Warsaw start of the quarter slot at position `pos`."""
+        return self.quarter_index.start(pos).astimezone(TGE_TIMEZONE)
+
+    def hours(self) -> Iterator[Tuple[int, str, float]]:
+        """Yield (hour number, DST marker, price) in delivery order."""
+        for hour, marker, price in zip(self.hour_numbers, self.hour_markers, self.hour_prices):
+            yield hour, marker.strip(), price
+
+    def quarters(self) -> Iterator[Tuple[int, str, float]]:
+        """Yield (start minute of day, DST marker, price) in delivery order."""
+        for minute, marker, price in zip(self.quarter_minutes, self.quarter_markers, self.quarter_prices):
+            yield minute, marker.strip(), price
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialize for storage (plain JSON types)."""
+        def pack(columns: Dict[str, array]) -> Dict[str, list]:
+            return {
+                name: [None if math.isnan(v) else v for v in values]
+                for name, values in columns.items()
+            }
+
+        return {
+            "date": self.date,
+            "hour_prices": self.hour_prices.tolist(),
+            "hour_numbers": self.hour_numbers.tolist(),
+            "hour_markers": self.hour_markers,
+            "quarter_prices": self.quarter_prices.tolist(),
+            "quarter_minutes": self.quarter_minutes.tolist(),
+            "quarter_markers": self.quarter_markers,
+            "columns": pack(self.columns),
+            "quarter_columns": pack(self.quarter_columns),
+            "eur_rate": self.eur_rate,
+            "hourly_source": self.hourly_source,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DaySeries":
+        """Restore from storage."""
+        day = date.fromisoformat(data["date"])
+        return cls(
+            day,
+            data.get("hour_prices", []),
+            data.get("hour_numbers", []),
+            data.get("hour_markers", ""),
+            data.get("quarter_prices", []),
+            data.get("quarter_minutes", []),
+            data.get("quarter_markers", ""),
+            data.get("columns"),
+            data.get("quarter_columns"),
+            data.get("eur_rate"),
+            data.get("hourly_source", "hours"),
+        )
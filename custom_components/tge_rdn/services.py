@@ -0,0 +1,62 @@
+"""TGE RDN services."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_CONCURRENCY,
+    ATTR_END_DATE,
+    ATTR_START_DATE,
+    BACKFILL_CONCURRENCY,
+    BACKFILL_MAX_CONCURRENCY,
+    DOMAIN,
+    SERVICE_BACKFILL,
+)
+from .slots import TGE_TIMEZONE
+
+BACKFILL_SCHEMA = vol.Schema({
+    vol.Required(ATTR_START_DATE): cv.date,
+    vol.Optional(ATTR_END_DATE): cv.date,
+    vol.Optional(ATTR_CONCURRENCY, default=BACKFILL_CONCURRENCY): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=BACKFILL_MAX_CONCURRENCY)
+    ),
+})
+
+
+def _coordinator(hass: HomeAssistant):
+    """Coordinator of the loaded config entry."""
+    for runtime in hass.data.get(DOMAIN, {}).values():
+        if isinstance(runtime, dict) and "coordinator" in runtime:
+            return runtime["coordinator"]
+    raise HomeAssistantError("TGE RDN is not set up")
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _async_backfill(call: ServiceCall) -> ServiceResponse:
+        """Seed price history for a date range (end defaults to yesterday)."""
+        start = call.data[ATTR_START_DATE]
+        end = call.data.get(ATTR_END_DATE) or datetime.now(TGE_TIMEZONE).date() - timedelta(days=1)
+        if start > end:
+            raise HomeAssistantError(f"start_date {start} is after end_date {end}")
+
+        job = _coordinator(hass).backfill.async_backfill(start, end, call.data[ATTR_CONCURRENCY])
+        if not call.return_response:
+            # Seeding can take minutes; don't hold the caller
+            hass.async_create_background_task(job, f"{DOMAIN} backfill")
+            return None
+        return (await job).as_dict()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL,
+        _async_backfill,
+        schema=BACKFILL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,107 @@
+"""Delivery-day slot arithmetic in TGE market time (Europe/Warsaw)."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+# TGE delivery days follow Polish local time regardless of the HA time zone
+TGE_TIMEZONE = ZoneInfo("Europe/Warsaw")
+
+
+def day_bounds_utc(day: date) -> tuple:
+    """Return (start, end) UTC instants of a delivery day."""
+    start = datetime.combine(day, time(0), TGE_TIMEZONE).astimezone(timezone.utc)
+    end = datetime.combine(day + timedelta(days=1), time(0), TGE_TIMEZONE).astimezone(timezone.utc)
+    return start, end
+
+
+def hours_in_day(day: date) -> int:
+    """Number of delivery hours: 23 on spring-forward, 25 on fall-back, else 24."""
+    start, end = day_bounds_utc(day)
+    return int((end - start).total_seconds() // 3600)
+
+
+def next_slot_boundary(now: datetime, slot_minutes: int) -> datetime:
+    """Return the first slot start strictly after `now` (aware, UTC).
+
+    Warsaw offsets are whole hours, so slot edges align with UTC edges.
+    """
+    step = slot_minutes * 60
+    ts = now.timestamp()
+    return datetime.fromtimestamp((ts // step + 1) * step, tz=timezone.utc)
+
+
+def as_market_time(when: datetime) -> datetime:
+    """Aware Europe/Warsaw datetime; naive input is taken as Warsaw wall time."""
+    if when.tzinfo is None:
+        return when.replace(tzinfo=TGE_TIMEZONE)
+    return when.astimezone(TGE_TIMEZONE)
+
+
+class SlotIndex:
+    """UTC start instants of one delivery day's slots, in delivery order.
+
+    Built once per parsed day from wall-clock slot starts and DST markers
+    ("b" = second pass of the repeated hour). `position()` maps any aware
+    datetime to its slot by arithmetic from the first start, falling back
+    to bisect when the day has gaps; `start()` maps a slot back to its
+    UTC instant. Naive datetimes are read as Warsaw wall time.
+    """
+
+    __slots__ = ("starts", "step")
+
+    def __init__(self, starts: Sequence[int], slot_minutes: int) -> None:
+        """Initialize from strictly increasing UTC epoch seconds."""
+        self.starts = array('q', starts)
+        self.step = slot_minutes * 60
+
+    @classmethod
+    def from_wall_clock(
+        cls, day: date, minutes: Sequence[int], markers: str, slot_minutes: int
+    ) -> "SlotIndex":
+        """Build from start minutes of the local day and per-slot DST markers.
+
+        A complete day is laid out from local midnight in delivery order, so
+        it is right whichever way TGE labels the 23rd/25th hour. Partial days
+        convert each wall-clock start, keeping starts strictly increasing.
+        """
+        step = slot_minutes * 60
+        day_start, day_end = day_bounds_utc(day)
+        first = int(day_start.timestamp())
+        if len(minutes) * step == int((day_end - day_start).total_seconds()):
+            return cls(range(first, first + len(minutes) * step, step), slot_minutes)
+
+        starts: List[int] = []
+        for minute, marker in zip(minutes, markers.ljust(len(minutes))):
+            ts = first + minute * 60
+            if minute < 24 * 60:
+                local = datetime.combine(day, time(minute // 60, minute % 60), TGE_TIMEZONE)
+                ts = int(local.replace(fold=1 if marker == "b" else 0).timestamp())
+            if starts and ts <= starts[-1]:
+                # Marker on an unambiguous hour (or a gap row): keep delivery order
+                ts = starts[-1] + step
+            starts.append(ts)
+        return cls(starts, slot_minutes)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def position(self, when: datetime) -> Optional[int]:
+        """Slot position holding `when`, None outside the day."""
+        starts = self.starts
+        if not starts:
+            return None
+        ts = as_market_time(when).timestamp()
+        pos = int((ts - starts[0]) // self.step)
+        if not 0 <= pos < len(starts) or not starts[pos] <= ts < starts[pos] + self.step:
+            pos = bisect_right(starts, ts) - 1
+            if pos < 0 or ts >= starts[pos] + self.step:
+                return None
+        return pos
+
+    def start(self, pos: int) -> datetime:
+        """Aware UTC start of slot `pos`."""
+        return datetime.fromtimestamp(self.starts[pos], tz=timezone.utc)
@@ -0,0 +1,99 @@
+"""Long-term statistics: published prices imported into the recorder.
+
+Each complete delivery day goes into HA's external statistics in one batch
+per statistic, so history graphs and the energy dashboard read prices from
+the indexed statistics tables instead of state attribute JSON.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from datetime import date
+from typing import Any, Dict, List, Sequence
+
+from .cache import is_day_complete
+from .const import DOMAIN, UNIT_PLN_MWH
+from .pricing import DayPrices
+from .series import DaySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+# Days whose last import is remembered (yesterday, today, tomorrow)
+_KEEP_DAYS = 3
+
+
+def hourly_rows(
+    series: DaySeries, hour_values: Sequence[float], quarter_values: Sequence[float]
+) -> List[Dict[str, Any]]:
+    """Statistic rows of a day: one per delivery hour, UTC start.
+
+    The recorder keeps hourly long-term statistics, so quarter prices
+    become the min/max of their hour; mean is the hourly price.
+    """
+    spread: Dict[int, List[float]] = {}
+    for pos, value in enumerate(quarter_values):
+        hour = int(series.quarter_index.start(pos).timestamp()) // 3600
+        spread.setdefault(hour, []).append(value)
+
+    rows = []
+    for pos, value in enumerate(hour_values):
+        start = series.hour_index.start(pos)
+        values = spread.get(int(start.timestamp()) // 3600) or [value]
+        rows.append({"start": start, "mean": value, "min": min(values), "max": max(values)})
+    return rows
+
+
+class PriceStatistics:
+    """Imports each entry's spot and gross prices as external statistics.
+
+    Statistic ids are `tge_rdn:spot_price_<entry>` and
+    `tge_rdn:gross_price_<entry>`, both in PLN/MWh so a unit change in the
+    options never mixes units under one id. A day is imported once per
+    `DayPrices` object: again only when its prices or the tariff change,
+    and the recorder overwrites the earlier rows of those hours.
+    """
+
+    def __init__(self, hass, entry_id: str) -> None:
+        """Initialize publisher."""
+        self.hass = hass
+        slug = re.sub(r"[^a-z0-9]+", "_", entry_id.lower()).strip("_")
+        self.spot_id = f"{DOMAIN}:spot_price_{slug}"
+        self.gross_id = f"{DOMAIN}:gross_price_{slug}"
+        self._published: Dict[date, DayPrices] = {}
+
+    def _metadata(self, statistic_id: str, name: str) -> Dict[str, Any]:
+        """External statistic metadata in PLN/MWh."""
+        return {
+            "has_mean": True,
+            "has_sum": False,
+            "name": name,
+            "source": DOMAIN,
+            "statistic_id": statistic_id,
+            "unit_of_measurement": UNIT_PLN_MWH,
+        }
+
+    def publish(self, prices: DayPrices) -> bool:
+        """Import a complete day's prices; returns True when rows were queued."""
+        series = prices.series
+        if self._published.get(series.day) is prices or not is_day_complete(series.day, series):
+            return False
+        if "recorder" not in self.hass.config.components:
+            return False
+
+        # Recorder is optional; only touched once it is known to be loaded
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        spot = hourly_rows(series, series.hour_prices, series.quarter_prices)
+        gross = hourly_rows(series, prices.gross, prices.quarter_gross)
+        async_add_external_statistics(
+            self.hass, self._metadata(self.spot_id, "TGE RDN spot price"), spot
+        )
+        async_add_external_statistics(
+            self.hass, self._metadata(self.gross_id, "TGE RDN gross price"), gross
+        )
+        _LOGGER.debug(f"📈 Statistics for {series.date}: {len(spot)} hours imported")
+
+        self._published[series.day] = prices
+        for day in sorted(self._published)[:-_KEEP_DAYS]:
+            del self._published[day]
+        return True
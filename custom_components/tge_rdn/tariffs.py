@@ -0,0 +1,189 @@
+"""Indexed tariff registry compiled from tariffs.json."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    DATA_TARIFFS,
+    DEFAULT_EXCHANGE_FEE,
+    DEFAULT_TRADE_FEE,
+    DOMAIN,
+    SIGNAL_TARIFFS_RELOADED,
+)
+from .holidays import ExtraHoliday, parse_extra_holidays
+from .zones import ZoneTable, compile_zones
+
+_LOGGER = logging.getLogger(__name__)
+
+TARIFFS_PATH = os.path.join(os.path.dirname(__file__), "tariffs.json")
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def load_tariffs(path: str = TARIFFS_PATH) -> dict:
+    """Load the raw tariffs JSON (blocking I/O — call via executor)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {"sellers": [], "distributors": []}
+
+
+@dataclass(frozen=True, slots=True)
+class SellerTariff:
+    """One seller tariff: energy prices and seller-side fees (netto)."""
+
+    seller: str
+    name: str
+    is_dynamic: bool
+    negative_prices_allowed: bool
+    energy_prices: Mapping[str, float]
+    exchange_fee: float
+    trade_fee: float
+
+
+@dataclass(frozen=True, slots=True)
+class DistributionTariff:
+    """One distributor tariff: zone schedule, compiled zone table and fixed fees (netto)."""
+
+    distributor: str
+    name: str
+    zones: Mapping[str, Any]
+    zone_table: Optional[ZoneTable]
+    fixed_fees: Mapping[str, float]
+
+
+class TariffRegistry:
+    """tariffs.json compiled into frozen objects with (name, tariff) indexes.
+
+    One instance lives in `hass.data[DOMAIN][DATA_TARIFFS]`; it is loaded
+    in the executor and replaced when the file's mtime changes
+    (`async_get_registry`, which then sends `SIGNAL_TARIFFS_RELOADED`).
+    """
+
+    __slots__ = ("mtime", "extra_holidays", "_sellers", "_distributors", "_seller_index", "_dist_index")
+
+    def __init__(self, data: dict, mtime: Optional[int] = None) -> None:
+        """Compile raw JSON data."""
+        self.mtime = mtime
+        self.extra_holidays: Tuple[ExtraHoliday, ...] = parse_extra_holidays(
+            data.get("extra_holidays", [])
+        )
+        self._sellers: Dict[str, Tuple[str, ...]] = {}
+        self._distributors: Dict[str, Tuple[str, ...]] = {}
+        self._seller_index: Dict[Tuple[str, str], SellerTariff] = {}
+        self._dist_index: Dict[Tuple[str, str], DistributionTariff] = {}
+
+        for seller in data.get("sellers", []):
+            name = seller["name"]
+            tariffs = seller.get("tariffs", [])
+            self._sellers[name] = tuple(t["name"] for t in tariffs)
+            for t in tariffs:
+                self._seller_index.setdefault((name, t["name"]), SellerTariff(
+                    seller=name,
+                    name=t["name"],
+                    is_dynamic=t.get("is_dynamic", False),
+                    negative_prices_allowed=seller.get("negative_prices_allowed", False),
+                    energy_prices=MappingProxyType(dict(t.get("energy_prices_netto_mwh", {}))),
+                    exchange_fee=t.get("exchange_fee", DEFAULT_EXCHANGE_FEE),
+                    trade_fee=t.get("trade_fee", DEFAULT_TRADE_FEE),
+                ))
+
+        for dist in data.get("distributors", []):
+            name = dist["name"]
+            tariffs = dist.get("tariffs", [])
+            self._distributors[name] = tuple(t["name"] for t in tariffs)
+            for t in tariffs:
+                zones = t.get("zones") or {}
+                self._dist_index.setdefault((name, t["name"]), DistributionTariff(
+                    distributor=name,
+                    name=t["name"],
+                    zones=MappingProxyType(zones),
+                    zone_table=compile_zones(zones) if zones else None,
+                    fixed_fees=MappingProxyType(dict(t.get("fixed_fees", {}))),
+                ))
+
+    @classmethod
+    def load(cls, path: str = TARIFFS_PATH) -> "TariffRegistry":
+        """Read and compile the file (blocking I/O — call via executor)."""
+        mtime = _mtime(path)
+        registry = cls(load_tariffs(path), mtime)
+        _LOGGER.debug(
+            f"📚 Tariffs loaded: {len(registry._seller_index)} seller tariffs, "
+            f"{len(registry._dist_index)} distribution tariffs"
+        )
+        return registry
+
+    def sellers(self) -> List[str]:
+        """Seller names in file order."""
+        return list(self._sellers)
+
+    def distributors(self) -> List[str]:
+        """Distributor names in file order."""
+        return list(self._distributors)
+
+    def seller_tariffs(self, seller: Optional[str]) -> List[str]:
+        """Tariff names of a seller."""
+        return list(self._sellers.get(seller, ()))
+
+    def distribution_tariffs(self, distributor: Optional[str]) -> List[str]:
+        """Tariff names of a distributor."""
+        return list(self._distributors.get(distributor, ()))
+
+    def seller_tariff(self, seller: Optional[str], tariff: Optional[str]) -> Optional[SellerTariff]:
+        """Seller tariff by (seller, tariff) name, None if unknown."""
+        return self._seller_index.get((seller, tariff))
+
+    def distribution_tariff(
+        self, distributor: Optional[str], tariff: Optional[str]
+    ) -> Optional[DistributionTariff]:
+        """Distribution tariff by (distributor, tariff) name, None if unknown."""
+        return self._dist_index.get((distributor, tariff))
+
+
+def _mtime(path: str) -> Optional[int]:
+    """File modification time in ns, None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def bundled_registry() -> TariffRegistry:
+    """Registry of the bundled file, for use outside Home Assistant (tests, scripts)."""
+    return TariffRegistry.load()
+
+
+def as_registry(tariffs: Union[TariffRegistry, dict]) -> TariffRegistry:
+    """Accept a registry or raw tariffs JSON data."""
+    if isinstance(tariffs, TariffRegistry):
+        return tariffs
+    return TariffRegistry(tariffs)
+
+
+async def async_get_registry(hass, path: str = TARIFFS_PATH) -> TariffRegistry:
+    """Shared registry from hass.data, (re)loaded in the executor when the file changed.
+
+    Whichever caller notices the change first (config flow, platform setup
+    or the periodic check) tells every holder of the old registry.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    previous: Optional[TariffRegistry] = domain_data.get(DATA_TARIFFS)
+    mtime = await hass.async_add_executor_job(_mtime, path)
+    if previous is not None and previous.mtime == mtime:
+        return previous
+    registry = await hass.async_add_executor_job(TariffRegistry.load, path)
+    domain_data[DATA_TARIFFS] = registry
+    if previous is not None:
+        _LOGGER.info("♻️ tariffs.json changed, tariffs reloaded")
+        async_dispatcher_send(hass, SIGNAL_TARIFFS_RELOADED, registry)
+    return registry
@@ -0,0 +1,211 @@
+"""Distribution zone schedules from tariffs.json: rule matching and compiled tables."""
+from __future__ import annotations
+
+import json
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from .holidays import ExtraHoliday, holidays_for_year
+from .slots import as_market_time
+
+# Day types of the compiled table. A holiday on a weekend is its own type,
+# so rules naming only weekends or only holidays both still match it.
+DAY_WORKDAY = 0
+DAY_WEEKEND = 1
+DAY_HOLIDAY = 2
+DAY_WEEKEND_HOLIDAY = 3
+_DAY_TYPES = 4
+_HOURS = 24
+
+# Representative dates per weekday kind: 2024-01-01 was a Monday
+_REFERENCE_YEAR = 2024
+
+# Year timelines kept per table (about 8.7 KB each)
+_MAX_TIMELINES = 8
+
+# Compiled tables keyed by the zone map's JSON, shared by all entities
+_COMPILED: Dict[str, "ZoneTable"] = {}
+
+
+def _matches_season(rule_season: str, dt: datetime) -> bool:
+    """Check if datetime falls within the rule's season."""
+    if rule_season == "all":
+        return True
+    month = dt.month
+    if rule_season == "summer":
+        return 4 <= month <= 9
+    if rule_season == "winter":
+        return month <= 3 or month >= 10
+    return True
+
+
+def _matches_days(rule_days: str, dt: datetime, is_holiday: bool) -> bool:
+    """Check if datetime matches the rule's day filter."""
+    if rule_days == "all":
+        return True
+    weekday = dt.weekday()  # 0=Mon, 6=Sun
+    if rule_days == "holidays":
+        return is_holiday
+    if rule_days == "weekends":
+        return weekday in (5, 6)
+    if rule_days == "workdays":
+        return weekday not in (5, 6) and not is_holiday
+    return True
+
+
+def resolve_zone(zones: dict, dt: datetime, is_holiday: bool) -> tuple:
+    """Resolve the active zone name and rate for a given datetime.
+
+    Args:
+        zones: Zone map from tariffs.json (zone_name -> {rate, schedule}).
+        dt: The datetime to evaluate.
+        is_holiday: Whether the date is a Polish public holiday.
+
+    Returns:
+        Tuple of (zone_name: str, rate: float).
+        Falls back to the default zone if no time-based rule matches.
+    """
+    default_zone = None
+    default_rate = 0.0
+    hour = dt.hour
+
+    for zone_name, zone_def in zones.items():
+        rate = zone_def.get("rate", 0.0)
+        for rule in zone_def.get("schedule", []):
+            if rule.get("default"):
+                default_zone = zone_name
+                default_rate = rate
+                continue
+
+            rule_hours = rule.get("hours", [])
+            rule_days = rule.get("days", "all")
+            rule_season = rule.get("season", "all")
+            rule_months = rule.get("months")
+
+            if hour not in rule_hours:
+                continue
+            if not _matches_days(rule_days, dt, is_holiday):
+                continue
+            if rule_months:
+                if dt.month not in rule_months:
+                    continue
+            elif not _matches_season(rule_season, dt):
+                continue
+
+            return (zone_name, rate)
+
+    return (default_zone or "all", default_rate)
+
+
+def day_type(d: date, is_holiday: bool) -> int:
+    """Compiled-table day type of a date."""
+    weekend = d.weekday() in (5, 6)
+    if is_holiday:
+        return DAY_WEEKEND_HOLIDAY if weekend else DAY_HOLIDAY
+    return DAY_WEEKEND if weekend else DAY_WORKDAY
+
+
+def _reference_datetime(month: int, kind: int, hour: int) -> datetime:
+    """A datetime in `month` whose weekday matches the day type."""
+    first = date(_REFERENCE_YEAR, month, 1)
+    # Monday for workday types, Saturday for weekend types
+    target = 5 if kind in (DAY_WEEKEND, DAY_WEEKEND_HOLIDAY) else 0
+    d = first + timedelta(days=(target - first.weekday()) % 7)
+    return datetime(d.year, d.month, d.day, hour)
+
+
+class ZoneTable:
+    """A distributor tariff's zone schedule compiled to a dense table.
+
+    `slots[((month - 1) * 4 + day_type) * 24 + hour]` is an index into
+    `names` / `rates`, so resolving a zone is one array lookup. The table
+    is filled by evaluating `resolve_zone` once per (month, day type, hour),
+    which keeps rule precedence identical. Whole-year hourly timelines are
+    built on demand and cached per (year, extra holidays), a few at a time.
+    """
+
+    __slots__ = ("names", "rates", "slots", "_timelines")
+
+    def __init__(self, names: List[str], rates: List[float], slots: array) -> None:
+        """Initialize from zone names, their rates and the slot table."""
+        self.names = tuple(names)
+        self.rates = tuple(rates)
+        self.slots = slots
+        self._timelines: Dict[Tuple[int, Tuple[ExtraHoliday, ...]], array] = {}
+
+    @classmethod
+    def compile(cls, zones: dict) -> "ZoneTable":
+        """Evaluate the rule list for every (month, day type, hour)."""
+        names: List[str] = []
+        rates: List[float] = []
+        index: Dict[Tuple[str, float], int] = {}
+        slots = array('B')
+        for month in range(1, 13):
+            for kind in range(_DAY_TYPES):
+                holiday = kind in (DAY_HOLIDAY, DAY_WEEKEND_HOLIDAY)
+                for hour in range(_HOURS):
+                    zone = resolve_zone(zones, _reference_datetime(month, kind, hour), holiday)
+                    if zone not in index:
+                        index[zone] = len(names)
+                        names.append(zone[0])
+                        rates.append(zone[1])
+                    slots.append(index[zone])
+        return cls(names, rates, slots)
+
+    def resolve(self, dt: datetime, is_holiday: bool) -> Tuple[str, float]:
+        """(zone_name, rate) at local wall time `dt`; same result as `resolve_zone`."""
+        i = self.slots[((dt.month - 1) * _DAY_TYPES + day_type(dt, is_holiday)) * _HOURS + dt.hour]
+        return self.names[i], self.rates[i]
+
+    def timeline(self, year: int, extra_holidays: Tuple[ExtraHoliday, ...] = ()) -> array:
+        """Zone index per local hour of `year` (day of year * 24 + hour)."""
+        key = (year, extra_holidays)
+        cached = self._timelines.get(key)
+        if cached is not None:
+            return cached
+        holidays = holidays_for_year(year, extra_holidays)
+        line = array('B')
+        d = date(year, 1, 1)
+        while d.year == year:
+            base = ((d.month - 1) * _DAY_TYPES + day_type(d, d in holidays)) * _HOURS
+            line.extend(self.slots[base:base + _HOURS])
+            d += timedelta(days=1)
+        self._timelines[key] = line
+        while len(self._timelines) > _MAX_TIMELINES:
+            del self._timelines[next(iter(self._timelines))]
+        return line
+
+    def spans(
+        self, start: datetime, end: datetime, extra_holidays: Tuple[ExtraHoliday, ...] = ()
+    ) -> List[Tuple[datetime, datetime, str, float]]:
+        """Runs of equal zone between `start` and `end` in local wall time.
+
+        Returns (run_start, run_end, zone_name, rate) with naive local
+        datetimes, hour-aligned except for the clipped first and last run.
+        """
+        start = as_market_time(start).replace(tzinfo=None)
+        end = as_market_time(end).replace(tzinfo=None)
+        runs: List[Tuple[datetime, datetime, str, float]] = []
+        hour = start.replace(minute=0, second=0, microsecond=0)
+        while hour < end:
+            line = self.timeline(hour.year, extra_holidays)
+            i = line[(hour.timetuple().tm_yday - 1) * _HOURS + hour.hour]
+            run_start = max(hour, start)
+            run_end = min(hour + timedelta(hours=1), end)
+            if runs and runs[-1][2] == self.names[i] and runs[-1][1] == run_start:
+                runs[-1] = (runs[-1][0], run_end, self.names[i], self.rates[i])
+            else:
+                runs.append((run_start, run_end, self.names[i], self.rates[i]))
+            hour += timedelta(hours=1)
+        return runs
+
+
+def compile_zones(zones: dict) -> ZoneTable:
+    """Compiled table for a zone map, built once per distinct schedule."""
+    key = json.dumps(zones, sort_keys=True)
+    table = _COMPILED.get(key)
+    if table is None:
+        table = ZoneTable.compile(zones)
+        _COMPILED[key] = table
+    return table
@@ -0,0 +1,280 @@
+"""Tests for the async TGE HTTP client."""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+# aiohttp ships with Home Assistant; provide a stand-in when it is absent
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = sys.modules.setdefault("aiohttp", MagicMock())
+if isinstance(aiohttp, MagicMock):
+    aiohttp.ClientError = type("ClientError", (Exception,), {})
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.api import TGERDNClient, url_for_date  # noqa: E402
+from custom_components.tge_rdn.parser import extract_table_html, page_fingerprint  # noqa: E402
+from custom_components.tge_rdn.const import TGE_PAGE_URL  # noqa: E402
+
+
+PAGE = (
+    '<html><head><meta name="csrf" content="{token}"></head><body>'
+    '<table id="rdn" class="table table-rdb"><tr><td>{label}</td></tr></table>'
+    '<footer>{token}</footer></body></html>'
+)
+
+
+class FakeStream:
+    """aiohttp StreamReader stand-in counting how much of the body was read."""
+
+    def __init__(self, data: bytes, chunk: int):
+        self._data = data
+        self._chunk = chunk
+        self.bytes_read = 0
+
+    async def iter_chunked(self, n):
+        size = min(n, self._chunk)
+        for i in range(0, len(self._data), size):
+            piece = self._data[i:i + size]
+            self.bytes_read += len(piece)
+            yield piece
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in."""
+
+    def __init__(self, status: int = 200, body: str = "", headers: dict | None = None, chunk: int = 64):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+        self.charset = "utf-8"
+        self.content = FakeStream(body.encode("utf-8"), chunk)
+
+    async def text(self) -> str:
+        return self._body
+
+    async def read(self) -> bytes:
+        return self._body.encode("utf-8")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Session recording requests and replaying queued responses."""
+
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append({"url": url, "headers": dict(headers or {})})
+        response = self._responses.pop(0)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+
+class TestUrlForDate(unittest.TestCase):
+    """dateShow must point at the day before the delivery date."""
+
+    def test_previous_day_parameter(self):
+        self.assertEqual(
+            url_for_date(datetime(2025, 11, 22)),
+            f"{TGE_PAGE_URL}?dateShow=21-11-2025",
+        )
+
+    def test_month_boundary(self):
+        self.assertEqual(
+            url_for_date(datetime(2026, 3, 1)),
+            f"{TGE_PAGE_URL}?dateShow=28-02-2026",
+        )
+
+
+class TestTGERDNClient(unittest.TestCase):
+    """Test fetches over a shared session."""
+
+    def test_fetch_returns_body(self):
+        session = FakeSession([FakeResponse(200, "<table id='rdn'></table>")])
+        client = TGERDNClient(session)
+        page = asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        self.assertTrue(page.changed)
+        self.assertEqual(page.html, "<table id='rdn'></table>")
+        self.assertEqual(len(session.calls), 1)
+        self.assertIn("gzip", session.calls[0]["headers"]["Accept-Encoding"])
+        self.assertIn("User-Agent", session.calls[0]["headers"])
+
+    def test_session_is_reused(self):
+        session = FakeSession([FakeResponse(200, "a"), FakeResponse(200, "b")])
+        client = TGERDNClient(session)
+        asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        asyncio.run(client.async_fetch_page(datetime(2025, 11, 23)))
+        self.assertEqual(len(session.calls), 2)
+
+    def test_http_error_returns_none(self):
+        session = FakeSession([FakeResponse(503, "")])
+        client = TGERDNClient(session)
+        self.assertIsNone(asyncio.run(client.async_fetch_page(datetime(2025, 11, 22))))
+
+    def test_network_error_returns_none(self):
+        session = FakeSession([aiohttp.ClientError("connection reset")])
+        client = TGERDNClient(session)
+        self.assertIsNone(asyncio.run(client.async_fetch_page(datetime(2025, 11, 22))))
+
+    def test_timeout_returns_none(self):
+        session = FakeSession([asyncio.TimeoutError()])
+        client = TGERDNClient(session)
+        self.assertIsNone(asyncio.run(client.async_fetch_page(datetime(2025, 11, 22))))
+
+
+class TestConditionalFetch(unittest.TestCase):
+    """Test validators and the content-fingerprint short-circuit."""
+
+    def test_sends_validators_from_previous_response(self):
+        headers = {"ETag": '"abc"', "Last-Modified": "Fri, 21 Nov 2025 12:00:00 GMT"}
+        session = FakeSession([
+            FakeResponse(200, PAGE.format(token="1", label="H01"), headers),
+            FakeResponse(304, ""),
+        ])
+        client = TGERDNClient(session)
+        day = datetime(2025, 11, 22)
+        first = asyncio.run(client.async_fetch_page(day))
+        first.entry.data = {"date": "2025-11-22"}
+
+        second = asyncio.run(client.async_fetch_page(day))
+        sent = session.calls[1]["headers"]
+        self.assertEqual(sent["If-None-Match"], '"abc"')
+        self.assertEqual(sent["If-Modified-Since"], "Fri, 21 Nov 2025 12:00:00 GMT")
+        self.assertFalse(second.changed)
+        self.assertIsNone(second.html)
+        self.assertIs(second.entry.data, first.entry.data)
+
+    def test_first_request_is_unconditional(self):
+        session = FakeSession([FakeResponse(200, PAGE.format(token="1", label="H01"))])
+        client = TGERDNClient(session)
+        asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        self.assertNotIn("If-None-Match", session.calls[0]["headers"])
+        self.assertNotIn("If-Modified-Since", session.calls[0]["headers"])
+
+    def test_same_table_with_new_page_chrome_is_unchanged(self):
+        session = FakeSession([
+            FakeResponse(200, PAGE.format(token="1", label="H01")),
+            FakeResponse(200, PAGE.format(token="2", label="H01")),
+        ])
+        client = TGERDNClient(session)
+        day = datetime(2025, 11, 22)
+        asyncio.run(client.async_fetch_page(day))
+        second = asyncio.run(client.async_fetch_page(day))
+        self.assertFalse(second.changed)
+
+    def test_changed_table_is_reported(self):
+        session = FakeSession([
+            FakeResponse(200, PAGE.format(token="1", label="H01")),
+            FakeResponse(200, PAGE.format(token="1", label="H02")),
+        ])
+        client = TGERDNClient(session)
+        day = datetime(2025, 11, 22)
+        first = asyncio.run(client.async_fetch_page(day))
+        first.entry.data = {"stale": True}
+        second = asyncio.run(client.async_fetch_page(day))
+        self.assertTrue(second.changed)
+        self.assertIsNone(second.entry.data)
+
+    def test_cache_is_keyed_by_date(self):
+        session = FakeSession([
+            FakeResponse(200, PAGE.format(token="1", label="H01"), {"ETag": '"a"'}),
+            FakeResponse(200, PAGE.format(token="1", label="H01")),
+        ])
+        client = TGERDNClient(session)
+        asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        page = asyncio.run(client.async_fetch_page(datetime(2025, 11, 23)))
+        self.assertNotIn("If-None-Match", session.calls[1]["headers"])
+        self.assertTrue(page.changed)
+
+
+class TestStreamingFetch(unittest.TestCase):
+    """Only the table is kept while downloading; the body is still drained."""
+
+    def test_keeps_table_and_drains_body(self):
+        body = PAGE.format(token="1", label="2025-11-22_H01") + "<script>" + "x" * 5000 + "</script>"
+        response = FakeResponse(200, body, chunk=16)
+        client = TGERDNClient(FakeSession([response]))
+        page = asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        # Read to the end so the connection goes back to the keep-alive pool
+        self.assertEqual(response.content.bytes_read, len(body.encode("utf-8")))
+        self.assertEqual(page.html, extract_table_html(body))
+
+    def test_fingerprint_matches_full_page(self):
+        body = PAGE.format(token="1", label="H01")
+        client = TGERDNClient(FakeSession([FakeResponse(200, body, chunk=7)]))
+        page = asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        self.assertEqual(page.entry.fingerprint, page_fingerprint(body))
+
+    def test_multibyte_text_split_across_chunks(self):
+        body = PAGE.format(token="1", label="Łącznie ąę")
+        client = TGERDNClient(FakeSession([FakeResponse(200, body, chunk=3)]))
+        page = asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        self.assertIn("<td>Łącznie ąę</td>", page.html)
+
+    def test_page_without_table_is_read_whole(self):
+        body = "<html><body>maintenance</body></html>"
+        client = TGERDNClient(FakeSession([FakeResponse(200, body, chunk=5)]))
+        page = asyncio.run(client.async_fetch_page(datetime(2025, 11, 22)))
+        self.assertEqual(page.html, body)
+
+
+class TestFetchTable(unittest.TestCase):
+    """History fetches return raw table markup, uncached."""
+
+    def test_returns_table_markup(self):
+        body = PAGE.format(token="1", label="2025-11-22_H01") + "<script>" + "x" * 5000 + "</script>"
+        response = FakeResponse(200, body, chunk=16, headers={"ETag": '"v1"'})
+        session = FakeSession([response, FakeResponse(200, body)])
+        client = TGERDNClient(session)
+        html = asyncio.run(client.async_fetch_table(datetime(2025, 11, 22)))
+        self.assertEqual(html, extract_table_html(body))
+        self.assertEqual(response.content.bytes_read, len(body.encode("utf-8")))
+        asyncio.run(client.async_fetch_table(datetime(2025, 11, 22)))
+        self.assertNotIn("If-None-Match", session.calls[1]["headers"])
+
+    def test_error_returns_none(self):
+        client = TGERDNClient(FakeSession([FakeResponse(500)]))
+        self.assertIsNone(asyncio.run(client.async_fetch_table(datetime(2025, 11, 22))))
+
+
+class TestPageFingerprint(unittest.TestCase):
+    """Test table extraction used for fingerprints."""
+
+    def test_extract_table(self):
+        html = PAGE.format(token="x", label="H01")
+        table = extract_table_html(html)
+        self.assertTrue(table.startswith("<table"))
+        self.assertTrue(table.endswith("</table>"))
+        self.assertNotIn("footer", table)
+
+    def test_missing_table(self):
+        self.assertIsNone(extract_table_html("<html><body>maintenance</body></html>"))
+
+    def test_fingerprint_falls_back_to_whole_page(self):
+        self.assertNotEqual(page_fingerprint("<p>a</p>"), page_fingerprint("<p>b</p>"))
+
+
+if __name__ == '__main__':
+    unittest.main()
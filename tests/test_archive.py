@@ -0,0 +1,172 @@
+"""Tests for the memory-mapped price archive."""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.archive import RECORD_SIZE, PriceArchive  # noqa: E402
+from custom_components.tge_rdn.holidays import is_polish_holiday  # noqa: E402
+from custom_components.tge_rdn.series import DaySeries  # noqa: E402
+from custom_components.tge_rdn.slots import hours_in_day  # noqa: E402
+
+
+def hourly_day(day: date, base: float = 100.0) -> DaySeries:
+    """Complete day priced base + position."""
+    hours = hours_in_day(day)
+    markers = ""
+    numbers = list(range(1, hours + 1))
+    if hours == 25:
+        numbers = [1, 2, 3, 3] + list(range(4, 25))
+        markers = "  ab".ljust(25)
+    elif hours == 23:
+        numbers = [1, 2] + list(range(4, 25))
+    return DaySeries(day, [base + i for i in range(hours)], numbers, markers, eur_rate=4.25)
+
+
+def quarter_day(day: date) -> DaySeries:
+    quarters = [float(q) for q in range(96)]
+    return DaySeries(
+        day,
+        [sum(quarters[i:i + 4]) / 4 for i in range(0, 96, 4)],
+        range(1, 25),
+        quarter_prices=quarters,
+        quarter_minutes=[q * 15 for q in range(96)],
+        hourly_source="quarters",
+    )
+
+
+class ArchiveTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, ".storage", "tge_rdn.price_archive")
+        self.archive = PriceArchive.open(self.path)
+
+
+class TestPriceArchive(ArchiveTestCase):
+    """Fixed-width records round-trip through the mapping."""
+
+    def test_round_trip_and_reopen(self):
+        day = date(2025, 11, 22)
+        self.assertEqual(self.archive.append([hourly_day(day), quarter_day(day + timedelta(days=1))]), 2)
+        reopened = PriceArchive.open(self.path)
+        self.assertEqual(reopened.dates(), [day, day + timedelta(days=1)])
+
+        series = reopened.get(day)
+        self.assertEqual(list(series.hour_prices), [100.0 + i for i in range(24)])
+        self.assertEqual(series.eur_rate, 4.25)
+        quarters = reopened.get(day + timedelta(days=1))
+        self.assertEqual(quarters.hourly_source, "quarters")
+        self.assertEqual(quarters.quarter_price(30), 2.0)
+        self.assertIsNone(quarters.eur_rate)
+
+    def test_fixed_width_records(self):
+        self.archive.append([hourly_day(date(2025, 1, d)) for d in range(1, 11)])
+        size = os.path.getsize(self.path)
+        self.assertEqual((size - 16) % RECORD_SIZE, 0)
+        self.assertEqual((size - 16) // RECORD_SIZE, 10)
+
+    def test_zero_copy_views(self):
+        day = date(2025, 11, 22)
+        self.archive.append([hourly_day(day)])
+        view = self.archive.hour_prices(day)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.format, "d")
+        self.assertEqual(view[5], 105.0)
+        self.assertEqual(len(self.archive.quarter_prices(day)), 0)
+        self.assertIsNone(self.archive.hour_prices(date(2020, 1, 1)))
+        # Views stay valid after later appends remap the file
+        self.archive.append([hourly_day(day + timedelta(days=1))])
+        self.assertEqual(view[5], 105.0)
+
+    def test_reappended_day_supersedes(self):
+        day = date(2025, 11, 22)
+        self.archive.append([hourly_day(day)])
+        self.archive.append([hourly_day(day, base=200.0)])
+        self.assertEqual(len(self.archive), 1)
+        self.assertEqual(self.archive.price_at(day, 0), 200.0)
+        self.assertEqual(PriceArchive.open(self.path).price_at(day, 0), 200.0)
+
+    def test_partial_days_skipped(self):
+        self.assertEqual(self.archive.append([DaySeries(date(2025, 1, 1), [1.0], [1]), None]), 0)
+        self.assertEqual(len(self.archive), 0)
+
+    def test_missing(self):
+        self.archive.append([hourly_day(date(2025, 1, 2))])
+        self.assertEqual(
+            self.archive.missing(date(2025, 1, 1), date(2025, 1, 3)),
+            [date(2025, 1, 1), date(2025, 1, 3)],
+        )
+
+    def test_torn_record_is_truncated(self):
+        self.archive.append([hourly_day(date(2025, 1, 1))])
+        with open(self.path, "ab") as f:
+            f.write(b"\x00" * 100)
+        reopened = PriceArchive.open(self.path)
+        self.assertEqual(len(reopened), 1)
+        reopened.append([hourly_day(date(2025, 1, 2))])
+        self.assertEqual(PriceArchive.open(self.path).price_at(date(2025, 1, 2), 3), 103.0)
+
+    def test_foreign_file_set_aside(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not an archive")
+        archive = PriceArchive.open(self.path)
+        self.assertEqual(len(archive), 0)
+        self.assertTrue(os.path.exists(self.path + ".bad"))
+
+
+class TestArchiveQueries(ArchiveTestCase):
+    """Point queries by local wall-clock hour."""
+
+    def test_dst_days(self):
+        spring, autumn = date(2025, 3, 30), date(2025, 10, 26)
+        self.archive.append([hourly_day(spring), hourly_day(autumn)])
+        self.assertEqual(self.archive.price_at(spring, 1), 101.0)
+        self.assertIsNone(self.archive.price_at(spring, 2))
+        self.assertEqual(self.archive.price_at(spring, 18), 117.0)
+        self.assertEqual(self.archive.price_at(autumn, 2), 102.0)
+        self.assertEqual(self.archive.price_at(autumn, 18), 119.0)
+
+    def test_average_over_workdays(self):
+        # 150 days between the autumn and spring DST changes
+        start = date(2024, 10, 28)
+        self.archive.append([hourly_day(start + timedelta(days=i), base=float(i)) for i in range(150)])
+
+        def workday(d):
+            return d.weekday() < 5 and not is_polish_holiday(d)
+
+        expected_days = [d for d in (start + timedelta(days=i) for i in range(150)) if workday(d)][-90:]
+        self.assertEqual(len(expected_days), 90)
+        expected = sum((d - start).days + 18 for d in expected_days) / 90
+        self.assertAlmostEqual(self.archive.average_at(18, 90, include=workday), expected)
+
+    def test_average_before_and_empty(self):
+        self.archive.append([hourly_day(date(2025, 1, d), base=float(d)) for d in range(1, 6)])
+        self.assertEqual(self.archive.average_at(0, 2, before=date(2025, 1, 4)), 2.5)
+        self.assertIsNone(self.archive.average_at(0, 2, before=date(2025, 1, 1)))
+
+    def test_point_query_over_two_years(self):
+        days = [date(2024, 1, 1) + timedelta(days=i) for i in range(730)]
+        self.archive.append([hourly_day(d, base=float(i)) for i, d in enumerate(days)])
+        for i in (0, 365, 729):
+            with self.subTest(day=days[i]):
+                self.assertEqual(self.archive.price_at(days[i], 12), i + 12.0)
+        self.assertIsNone(self.archive.price_at(days[-1] + timedelta(days=1), 12))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+"""Tests for the price history backfill engine."""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.backfill import BackfillEngine  # noqa: E402
+from custom_components.tge_rdn.series import DaySeries  # noqa: E402
+from custom_components.tge_rdn.slots import hours_in_day  # noqa: E402
+
+
+def table(day: date) -> str:
+    """Price table markup for a full delivery day."""
+    rows = "".join(
+        f"<tr><td>{day.isoformat()}_H{h:02d}</td><td>60</td><td>{100 + h},00</td></tr>"
+        for h in range(1, hours_in_day(day) + 1)
+    )
+    return f'<table id="rdn"><tr><th>a</th></tr><tr><th>b</th></tr>{rows}</table>'
+
+
+def full_day(day: date) -> DaySeries:
+    hours = hours_in_day(day)
+    return DaySeries(day, [1.0] * hours, range(1, hours + 1))
+
+
+class FakeClient:
+    """Serves generated tables, tracking parallel requests."""
+
+    def __init__(self, unavailable=()):
+        self.unavailable = set(unavailable)
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def async_fetch_table(self, target: datetime):
+        self.requested.append(target.date())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.005)
+        self.in_flight -= 1
+        if target.date() in self.unavailable:
+            return None
+        return table(target.date())
+
+
+class FakeStore:
+    """Home Assistant Store stand-in keeping every save."""
+
+    def __init__(self, data=None):
+        self.data = data
+        self.saves = []
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.saves.append(data)
+        self.data = data
+
+
+class FakeHass:
+    async def async_add_executor_job(self, func, *args):
+        return func(*args)
+
+
+class EngineTestCase(unittest.TestCase):
+    """Engines archive into a temporary directory."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, ".storage", "tge_rdn.price_archive")
+
+    def make_engine(self, client=None, store=None, **kwargs) -> BackfillEngine:
+        kwargs.setdefault("request_interval", 0)
+        engine = BackfillEngine(
+            FakeHass(), client or FakeClient(), store or FakeStore(), self.path, **kwargs
+        )
+        asyncio.run(engine.async_load())
+        return engine
+
+
+class TestBackfill(EngineTestCase):
+    """Gaps are fetched in parallel; stored days are skipped."""
+
+    def test_fetches_range_and_skips_stored(self):
+        engine = self.make_engine()
+        engine.history.append([full_day(date(2024, 3, 2))])
+        result = asyncio.run(engine.async_backfill(date(2024, 3, 1), date(2024, 3, 5)))
+
+        self.assertEqual(sorted(engine._client.requested), [
+            date(2024, 3, 1), date(2024, 3, 3), date(2024, 3, 4), date(2024, 3, 5),
+        ])
+        self.assertEqual(len(result.stored), 4)
+        self.assertEqual(result.skipped, 1)
+        self.assertEqual(engine.history.get(date(2024, 3, 3)).hour_prices[0], 101.0)
+        self.assertEqual(len(engine.history), 5)
+
+    def test_dst_days_are_complete(self):
+        engine = self.make_engine()
+        asyncio.run(engine.async_backfill(date(2024, 3, 31), date(2024, 3, 31)))
+        self.assertEqual(engine.history.get(date(2024, 3, 31)).total_hours, 23)
+
+    def test_concurrency_limit(self):
+        engine = self.make_engine()
+        asyncio.run(engine.async_backfill(date(2024, 1, 1), date(2024, 1, 20), concurrency=3))
+        self.assertEqual(engine._client.max_in_flight, 3)
+
+    def test_request_pacing(self):
+        engine = self.make_engine(request_interval=0.03)
+        started = time.monotonic()
+        asyncio.run(engine.async_backfill(date(2024, 1, 1), date(2024, 1, 4), concurrency=4))
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_unavailable_days_are_reported(self):
+        engine = self.make_engine(FakeClient(unavailable={date(2024, 1, 2)}))
+        result = asyncio.run(engine.async_backfill(date(2024, 1, 1), date(2024, 1, 3)))
+        self.assertEqual(result.failed, [date(2024, 1, 2)])
+        self.assertNotIn(date(2024, 1, 2), engine.history)
+        self.assertEqual(result.as_dict()["failed"], ["2024-01-02"])
+
+    def test_large_ranges_use_worker_pool(self):
+        pools = []
+
+        def pool_factory(workers):
+            pools.append(workers)
+            return ThreadPoolExecutor(workers)
+
+        engine = self.make_engine(pool_min_days=5, pool_factory=pool_factory)
+        asyncio.run(engine.async_backfill(date(2024, 1, 1), date(2024, 1, 3), concurrency=2))
+        self.assertEqual(pools, [])
+        asyncio.run(engine.async_backfill(date(2024, 1, 1), date(2024, 1, 10), concurrency=2))
+        self.assertEqual(pools, [2])
+        self.assertEqual(len(engine.history), 10)
+
+
+class TestResume(EngineTestCase):
+    """The running range is persisted until the run ends."""
+
+    def test_pending_range_saved_then_cleared(self):
+        store = FakeStore()
+        engine = self.make_engine(store=store)
+        asyncio.run(engine.async_backfill(date(2024, 1, 1), date(2024, 1, 2)))
+        self.assertEqual(store.saves[0]["pending"], {"start": "2024-01-01", "end": "2024-01-02"})
+        self.assertIsNone(store.saves[-1]["pending"])
+
+    def test_cancelled_run_keeps_pending(self):
+        store = FakeStore()
+        engine = self.make_engine(store=store, pool_min_days=1000)
+
+        async def run():
+            task = asyncio.ensure_future(engine.async_backfill(date(2024, 1, 1), date(2024, 1, 31)))
+            await asyncio.sleep(0.02)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        self.assertEqual(store.data["pending"], {"start": "2024-01-01", "end": "2024-01-31"})
+        self.assertEqual(engine.pending, store.data["pending"])
+        # Days parsed before the cancel were archived, so a resume only fetches the rest
+        self.assertLess(len(engine.history.missing(date(2024, 1, 1), date(2024, 1, 31))), 31)
+
+    def test_resume_after_restart(self):
+        self.make_engine().history.append([full_day(date(2024, 1, 1))])
+        store = FakeStore({"pending": {"start": "2024-01-01", "end": "2024-01-03"}})
+        engine = self.make_engine(store=store)
+        result = asyncio.run(engine.async_resume())
+
+        self.assertEqual(sorted(engine._client.requested), [date(2024, 1, 2), date(2024, 1, 3)])
+        self.assertEqual(result.skipped, 1)
+        self.assertIsNone(engine.pending)
+        self.assertIsNone(asyncio.run(engine.async_resume()))
+
+
+class TestRecord(EngineTestCase):
+    """Days that become final during polling are archived."""
+
+    def test_complete_day_recorded_once(self):
+        engine = self.make_engine()
+        asyncio.run(engine.async_record(full_day(date(2025, 11, 22))))
+        asyncio.run(engine.async_record(full_day(date(2025, 11, 22))))
+        self.assertIn(date(2025, 11, 22), engine.history)
+        self.assertEqual(os.path.getsize(self.path) % 8, 0)
+        self.assertEqual(len(self.make_engine().history), 1)
+
+    def test_partial_day_ignored(self):
+        engine = self.make_engine()
+        asyncio.run(engine.async_record(DaySeries(date(2025, 11, 22), [1.0] * 12, range(1, 13))))
+        asyncio.run(engine.async_record(None))
+        self.assertEqual(len(engine.history), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
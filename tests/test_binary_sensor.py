@@ -13,6 +13,7 @@ sys.modules["homeassistant.config_entries"] = MagicMock()
 sys.modules["homeassistant.const"] = MagicMock()
 sys.modules["homeassistant.core"] = MagicMock()
 sys.modules["homeassistant.helpers"] = MagicMock()
+sys.modules["homeassistant.helpers.dispatcher"] = MagicMock()
 sys.modules["homeassistant.helpers.entity_platform"] = MagicMock()
 
 # Define dummy base class for BinarySensorEntity
@@ -0,0 +1,141 @@
+"""Tests for the delivery-day cache and DST-aware day lengths."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from datetime import date
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.cache import DayCache, is_day_complete  # noqa: E402
+from custom_components.tge_rdn.series import DaySeries  # noqa: E402
+from custom_components.tge_rdn.slots import hours_in_day  # noqa: E402
+
+
+def day_data(day: date, hours: int) -> DaySeries:
+    """Build a minimal parsed day with `hours` hourly entries."""
+    return DaySeries(day, [100.0] * hours, range(1, hours + 1))
+
+
+class TestHoursInDay(unittest.TestCase):
+    """Day length follows Europe/Warsaw DST transitions."""
+
+    def test_regular_day(self):
+        self.assertEqual(hours_in_day(date(2025, 11, 22)), 24)
+
+    def test_spring_forward(self):
+        self.assertEqual(hours_in_day(date(2025, 3, 30)), 23)
+
+    def test_fall_back(self):
+        self.assertEqual(hours_in_day(date(2025, 10, 26)), 25)
+
+    def test_days_around_transition(self):
+        self.assertEqual(hours_in_day(date(2025, 3, 29)), 24)
+        self.assertEqual(hours_in_day(date(2025, 10, 27)), 24)
+
+
+class TestDayCompleteness(unittest.TestCase):
+    """Test completeness check."""
+
+    def test_full_day_complete(self):
+        d = date(2025, 11, 22)
+        self.assertTrue(is_day_complete(d, day_data(d, 24)))
+
+    def test_partial_day_incomplete(self):
+        d = date(2025, 11, 22)
+        self.assertFalse(is_day_complete(d, day_data(d, 20)))
+
+    def test_short_dst_day_complete_with_23(self):
+        d = date(2025, 3, 30)
+        self.assertTrue(is_day_complete(d, day_data(d, 23)))
+
+    def test_long_dst_day_needs_25(self):
+        d = date(2025, 10, 26)
+        self.assertFalse(is_day_complete(d, day_data(d, 24)))
+        self.assertTrue(is_day_complete(d, day_data(d, 25)))
+
+    def test_missing_data(self):
+        self.assertFalse(is_day_complete(date(2025, 11, 22), None))
+
+
+class TestDayCache(unittest.TestCase):
+    """Test final-day bookkeeping."""
+
+    def test_complete_day_becomes_final(self):
+        cache = DayCache()
+        d = date(2025, 11, 22)
+        data = day_data(d, 24)
+        self.assertTrue(cache.store(d, data))
+        self.assertTrue(cache.is_final(d))
+        self.assertIs(cache.get(d), data)
+
+    def test_final_reported_once(self):
+        cache = DayCache()
+        d = date(2025, 11, 22)
+        cache.store(d, day_data(d, 24))
+        self.assertFalse(cache.store(d, day_data(d, 24)))
+
+    def test_partial_day_not_final(self):
+        cache = DayCache()
+        d = date(2025, 11, 22)
+        self.assertFalse(cache.store(d, day_data(d, 12)))
+        self.assertFalse(cache.is_final(d))
+        self.assertIsNotNone(cache.get(d))
+
+    def test_empty_result_ignored(self):
+        cache = DayCache()
+        d = date(2025, 11, 22)
+        self.assertFalse(cache.store(d, None))
+        self.assertIsNone(cache.get(d))
+
+    def test_prune(self):
+        cache = DayCache()
+        old, today = date(2025, 11, 20), date(2025, 11, 22)
+        cache.store(old, day_data(old, 24))
+        cache.store(today, day_data(today, 24))
+        cache.prune(today)
+        self.assertIsNone(cache.get(old))
+        self.assertFalse(cache.is_final(old))
+        self.assertTrue(cache.is_final(today))
+
+
+class TestDayCacheStorage(unittest.TestCase):
+    """Test (de)serialization used by the persistent store."""
+
+    def test_round_trip_keeps_finality(self):
+        cache = DayCache()
+        full, partial = date(2025, 11, 22), date(2025, 11, 23)
+        cache.store(full, day_data(full, 24))
+        cache.store(partial, day_data(partial, 10))
+
+        restored = DayCache.from_dict(cache.as_dict())
+        self.assertTrue(restored.is_final(full))
+        self.assertFalse(restored.is_final(partial))
+        self.assertEqual(restored.get(partial).total_hours, 10)
+
+    def test_keys_are_iso_dates(self):
+        cache = DayCache()
+        d = date(2025, 11, 22)
+        cache.store(d, day_data(d, 24))
+        self.assertEqual(list(cache.as_dict()["days"]), ["2025-11-22"])
+
+    def test_empty_storage(self):
+        self.assertIsNone(DayCache.from_dict(None).get(date(2025, 11, 22)))
+
+    def test_invalid_key_ignored(self):
+        restored = DayCache.from_dict({"days": {"garbage": {"total_hours": 24}}})
+        self.assertEqual(restored.as_dict(), {"days": {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
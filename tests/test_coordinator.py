@@ -0,0 +1,730 @@
+"""Tests for TGERDNDataUpdateCoordinator scheduling and caching."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules["homeassistant"] = MagicMock()
+sys.modules["homeassistant.components"] = MagicMock()
+sys.modules["homeassistant.components.sensor"] = MagicMock()
+sys.modules["homeassistant.config_entries"] = MagicMock()
+sys.modules["homeassistant.const"] = MagicMock()
+sys.modules["homeassistant.core"] = MagicMock()
+sys.modules["homeassistant.helpers"] = MagicMock()
+sys.modules["homeassistant.helpers.aiohttp_client"] = MagicMock()
+sys.modules["homeassistant.helpers.dispatcher"] = MagicMock()
+sys.modules["homeassistant.helpers.entity_platform"] = MagicMock()
+sys.modules["homeassistant.helpers.update_coordinator"] = MagicMock()
+sys.modules["homeassistant.helpers.event"] = MagicMock()
+sys.modules["homeassistant.helpers.storage"] = MagicMock()
+sys.modules["homeassistant.util"] = MagicMock()
+sys.modules["voluptuous"] = MagicMock()
+sys.modules.setdefault("aiohttp", MagicMock())
+
+# `callback` must leave the decorated function intact
+sys.modules["homeassistant.core"].callback = lambda func: func
+# One independent mock per Store(...) so stores can be told apart
+sys.modules["homeassistant.helpers.storage"].Store = lambda *args, **kwargs: MagicMock()
+sys.modules["homeassistant.helpers.storage"].STORAGE_DIR = ".storage"
+sys.modules["homeassistant.helpers.update_coordinator"].UpdateFailed = type("UpdateFailed", (Exception,), {})
+
+
+class MockSensorEntity: pass
+
+
+class MockCoordinatorEntity:
+    def __init__(self, coord):
+        self.coordinator = coord
+
+    @property
+    def available(self):
+        return self.coordinator.last_update_success
+
+    def _handle_coordinator_update(self):
+        self.async_write_ha_state()
+
+
+class MockDataUpdateCoordinator:
+    """Just enough of DataUpdateCoordinator to drive the subclass."""
+
+    def __init__(self, hass, logger, name=None, update_interval=None, always_update=True):
+        self.hass = hass
+        self.update_interval = update_interval
+        self.always_update = always_update
+        self.data = None
+        self.last_update_success = True
+        self.pushed = []
+        self.refresh_requests = 0
+
+    def async_set_updated_data(self, data):
+        self.data = data
+        self.pushed.append(data)
+
+    def async_update_listeners(self):
+        self.pushed.append(self.data)
+
+    async def async_request_refresh(self):
+        self.refresh_requests += 1
+
+    async def async_config_entry_first_refresh(self):
+        self.data = await self._async_update_data()
+
+
+sys.modules["homeassistant.components.sensor"].SensorEntity = MockSensorEntity
+sys.modules["homeassistant.helpers.update_coordinator"].CoordinatorEntity = MockCoordinatorEntity
+sys.modules["homeassistant.helpers.update_coordinator"].DataUpdateCoordinator = MockDataUpdateCoordinator
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Re-import so the coordinator subclasses the stub above
+sys.modules.pop("custom_components.tge_rdn.sensor", None)
+sensor_module = importlib.import_module("custom_components.tge_rdn.sensor")
+TGERDNDataUpdateCoordinator = sensor_module.TGERDNDataUpdateCoordinator
+from custom_components.tge_rdn.archive import PriceArchive  # noqa: E402
+from custom_components.tge_rdn.const import CONF_UNIT, UNIT_PLN_KWH  # noqa: E402
+from custom_components.tge_rdn.series import DaySeries  # noqa: E402
+from custom_components.tge_rdn.slots import TGE_TIMEZONE, hours_in_day  # noqa: E402
+from custom_components.tge_rdn.tariffs import bundled_registry  # noqa: E402
+
+
+class MockConfig:
+    """hass.config with paths under a fresh temporary directory."""
+
+    def __init__(self):
+        self.config_dir = tempfile.mkdtemp()
+        # No recorder: statistics imports are skipped
+        self.components = {"tge_rdn"}
+
+    def path(self, *parts):
+        return os.path.join(self.config_dir, *parts)
+
+
+class MockHass:
+    """Minimal hass: records tasks and runs executor jobs inline."""
+
+    def __init__(self):
+        self.tasks = []
+        self.config = MockConfig()
+
+    def async_create_task(self, coro):
+        self.tasks.append(coro)
+        coro.close()
+
+    async def async_add_executor_job(self, func, *args):
+        return func(*args)
+
+
+class MockEntry:
+    def __init__(self, options=None):
+        self.entry_id = "test_entry"
+        self.data = {}
+        self.options = options or {}
+
+
+def day_data(day: date, hours: int = 24) -> DaySeries:
+    return DaySeries(day, [100.0 + h for h in range(1, hours + 1)], range(1, hours + 1))
+
+
+def make_coordinator() -> TGERDNDataUpdateCoordinator:
+    return TGERDNDataUpdateCoordinator(MockHass(), MockEntry(), bundled_registry())
+
+
+class TestRollover(unittest.TestCase):
+    """Midnight promotes cached tomorrow to today without fetching."""
+
+    def test_tomorrow_promoted_to_today(self):
+        coord = make_coordinator()
+        today, tomorrow = date(2025, 11, 22), date(2025, 11, 23)
+        coord.data = {"today": day_data(today), "tomorrow": day_data(tomorrow)}
+        midnight = datetime(2025, 11, 23, 0, 0, tzinfo=TGE_TIMEZONE)
+
+        coord._async_rollover(midnight)
+
+        self.assertEqual(coord.data["today"].date, "2025-11-23")
+        self.assertEqual(coord.data["yesterday"].date, "2025-11-22")
+        self.assertIsNone(coord.data["tomorrow"])
+        self.assertEqual(coord.refresh_requests, 0)
+        self.assertEqual(coord.hass.tasks, [])
+
+    def test_rollover_without_tomorrow_requests_fetch(self):
+        coord = make_coordinator()
+        coord.data = {"today": day_data(date(2025, 11, 22)), "tomorrow": None}
+        coord._async_rollover(datetime(2025, 11, 23, 0, 0, tzinfo=TGE_TIMEZONE))
+        self.assertIsNone(coord.data["today"])
+        self.assertEqual(len(coord.hass.tasks), 1)
+
+    def test_rollover_ignores_wrong_date(self):
+        coord = make_coordinator()
+        coord.data = {"today": None, "tomorrow": day_data(date(2025, 11, 20))}
+        coord._async_rollover(datetime(2025, 11, 23, 0, 0, tzinfo=TGE_TIMEZONE))
+        self.assertIsNone(coord.data["today"])
+
+    def test_rollover_does_not_fetch_when_promoted(self):
+        coord = make_coordinator()
+        coord.data = {"today": None, "tomorrow": day_data(date(2025, 11, 23))}
+        coord._async_rollover(datetime(2025, 11, 23, 0, 0, tzinfo=TGE_TIMEZONE))
+        self.assertEqual(coord.hass.tasks, [])
+
+
+class TestSlotTimer(unittest.TestCase):
+    """Slot boundaries re-render entities from cache and never fetch."""
+
+    def setUp(self):
+        self.track = sensor_module.async_track_point_in_time
+        self.track.reset_mock()
+
+    def test_schedules_next_hour_boundary(self):
+        coord = make_coordinator()
+        coord.async_schedule_slot_timer()
+        self.assertEqual(self.track.call_count, 1)
+        when = self.track.call_args[0][2]
+        self.assertEqual((when.minute, when.second, when.microsecond), (0, 0, 0))
+        self.assertGreater(when, datetime.now(TGE_TIMEZONE))
+        self.assertLessEqual(when - datetime.now(TGE_TIMEZONE), timedelta(hours=1))
+
+    def test_boundary_pushes_listeners_without_refresh(self):
+        coord = make_coordinator()
+        coord.data = {"today": day_data(coord._current_day), "tomorrow": None}
+        now = datetime.now(TGE_TIMEZONE)
+        coord._async_slot_boundary(now)
+        self.assertEqual(len(coord.pushed), 1)
+        self.assertEqual(coord.refresh_requests, 0)
+        self.assertEqual(coord.hass.tasks, [])
+        self.assertEqual(self.track.call_count, 1)
+
+    def test_boundary_on_new_day_rolls_over(self):
+        coord = make_coordinator()
+        today = coord._current_day
+        tomorrow = today + timedelta(days=1)
+        coord.data = {"today": day_data(today), "tomorrow": day_data(tomorrow)}
+        midnight = datetime.combine(tomorrow, datetime.min.time(), TGE_TIMEZONE)
+        coord._async_slot_boundary(midnight)
+        self.assertEqual(coord.data["today"].date, tomorrow.isoformat())
+        self.assertEqual(coord._current_day, tomorrow)
+
+    def test_quarter_series_ticks_every_15_minutes(self):
+        coord = make_coordinator()
+        self.assertEqual(coord._slot_minutes(), 60)
+        coord.data = {"today": DaySeries(date(2025, 11, 22), [1.0], [1], "", [1.0], [0])}
+        self.assertEqual(coord._slot_minutes(), 15)
+
+    def test_cancel(self):
+        coord = make_coordinator()
+        coord.async_schedule_slot_timer()
+        unsub = coord._unsub_slot_timer
+        coord.async_cancel_slot_timer()
+        unsub.assert_called_once()
+        self.assertIsNone(coord._unsub_slot_timer)
+
+
+class TestPollingSchedule(unittest.TestCase):
+    """update_interval follows cache state and the publication scheduler."""
+
+    def test_retry_while_today_incomplete(self):
+        coord = make_coordinator()
+        self.assertEqual(coord._next_update_interval(), timedelta(seconds=300))
+
+    def test_stops_when_tomorrow_final(self):
+        coord = make_coordinator()
+        today = datetime.now(TGE_TIMEZONE).date()
+        tomorrow = today + timedelta(days=1)
+        coord.day_cache.store(today, day_data(today, hours_in_day(today)))
+        coord.day_cache.store(tomorrow, day_data(tomorrow, hours_in_day(tomorrow)))
+        self.assertIsNone(coord._next_update_interval())
+
+    def test_follows_scheduler_when_only_today_final(self):
+        coord = make_coordinator()
+        today = datetime.now(TGE_TIMEZONE).date()
+        coord.day_cache.store(today, day_data(today, hours_in_day(today)))
+        interval = coord._next_update_interval()
+        self.assertIsNotNone(interval)
+        self.assertGreater(interval.total_seconds(), 0)
+
+    def test_rollover_rearms_polling(self):
+        coord = make_coordinator()
+        coord.update_interval = None
+        coord.data = {"today": None, "tomorrow": None}
+        coord._async_rollover(datetime.now(TGE_TIMEZONE))
+        self.assertIsNotNone(coord.update_interval)
+
+
+class TestPublicationLearning(unittest.TestCase):
+    """First-seen publication times feed the scheduler."""
+
+    def _fake_fetch(self, coord, results):
+        results = list(results)
+
+        async def fetch(target, day_type):
+            return results.pop(0)
+
+        coord._fetch_day_data = fetch
+
+    def test_records_when_published_after_miss(self):
+        coord = make_coordinator()
+        now = datetime.now()
+        tomorrow = (now + timedelta(days=1)).date()
+        self._fake_fetch(coord, [None, day_data(tomorrow)])
+        self.assertIsNone(asyncio.run(coord._handle_tomorrow_data(now)))
+        self.assertIsNotNone(asyncio.run(coord._handle_tomorrow_data(now)))
+        self.assertEqual(coord.scheduler.observations, 1)
+        coord._scheduler_store.async_delay_save.assert_called_once()
+
+    def test_no_record_when_already_published_at_startup(self):
+        coord = make_coordinator()
+        now = datetime.now()
+        tomorrow = (now + timedelta(days=1)).date()
+        self._fake_fetch(coord, [day_data(tomorrow)])
+        asyncio.run(coord._handle_tomorrow_data(now))
+        self.assertEqual(coord.scheduler.observations, 0)
+
+    def test_records_upper_bound_on_first_scheduled_poll(self):
+        coord = make_coordinator()
+        now = datetime.now()
+        tomorrow = (now + timedelta(days=1)).date()
+        coord._tomorrow_poll_scheduled = tomorrow
+        self._fake_fetch(coord, [day_data(tomorrow), day_data(tomorrow)])
+        first = asyncio.run(coord._handle_tomorrow_data(now))
+        self.assertEqual(coord.scheduler.observations, 1)
+        # Later polls of the same day add no further samples
+        coord.data = {"today": None, "tomorrow": first}
+        asyncio.run(coord._handle_tomorrow_data(now))
+        self.assertEqual(coord.scheduler.observations, 1)
+
+    def test_refresh_and_rollover_arm_scheduled_poll(self):
+        coord = make_coordinator()
+        self.assertIsNone(coord._tomorrow_poll_scheduled)
+        coord._record_refresh_outcome(datetime.now())
+        self.assertEqual(
+            coord._tomorrow_poll_scheduled,
+            datetime.now(TGE_TIMEZONE).date() + timedelta(days=1),
+        )
+
+    def test_keeps_previous_tomorrow_on_failed_fetch(self):
+        coord = make_coordinator()
+        now = datetime.now()
+        previous = day_data((now + timedelta(days=1)).date())
+        coord.data = {"today": None, "tomorrow": previous}
+        self._fake_fetch(coord, [None])
+        self.assertIs(asyncio.run(coord._handle_tomorrow_data(now)), previous)
+
+
+
+class TestConcurrentRefresh(unittest.TestCase):
+    """A refresh fetches today and tomorrow in parallel, once each."""
+
+    def setUp(self):
+        self._libs = sensor_module.REQUIRED_LIBRARIES_AVAILABLE
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = True
+
+    def tearDown(self):
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = self._libs
+
+    def test_days_fetched_concurrently_once(self):
+        coord = make_coordinator()
+        calls = []
+
+        async def run():
+            both_started = asyncio.Event()
+
+            async def fetch(target, day_type):
+                calls.append(day_type)
+                if len(calls) == 2:
+                    both_started.set()
+                # Deadlocks (and times out) if the fetches were sequential
+                await asyncio.wait_for(both_started.wait(), 1)
+                return day_data(target.date())
+
+            coord._fetch_day_data = fetch
+            return await coord._async_update_data()
+
+        data = asyncio.run(run())
+        self.assertEqual(sorted(calls), ["today", "tomorrow"])
+        self.assertIsNotNone(data["today"])
+        self.assertIsNotNone(data["tomorrow"])
+
+    def test_no_first_refresh_override(self):
+        self.assertNotIn("async_config_entry_first_refresh", TGERDNDataUpdateCoordinator.__dict__)
+
+
+
+class TestSetupEntry(unittest.TestCase):
+    """Platform setup fetches tge.pl once on a cold start."""
+
+    def setUp(self):
+        self._libs = sensor_module.REQUIRED_LIBRARIES_AVAILABLE
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = True
+
+    def tearDown(self):
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = self._libs
+
+    def test_cold_start_refreshes_once(self):
+        hass = MockHass()
+        entry = MockEntry()
+        entry.async_on_unload = MagicMock()
+        entry.async_create_background_task = MagicMock()
+        hass.data = {sensor_module.DOMAIN: {entry.entry_id: {}}}
+        today = datetime.now(TGE_TIMEZONE).date()
+        update = AsyncMock(return_value={"today": day_data(today), "tomorrow": None})
+        added = []
+
+        def add_entities(entities, update_before_add=False):
+            added.append((entities, update_before_add))
+
+        with patch.object(TGERDNDataUpdateCoordinator, "async_restore", AsyncMock(return_value=False)), \
+                patch.object(TGERDNDataUpdateCoordinator, "_async_update_data", update):
+            asyncio.run(sensor_module.async_setup_entry(hass, entry, add_entities))
+
+        update.assert_awaited_once()
+        entities, update_before_add = added[0]
+        self.assertFalse(update_before_add)
+        self.assertEqual(len(entities), 9)
+        entry.async_create_background_task.assert_not_called()
+
+
+class TestPersistentCache(unittest.TestCase):
+    """Restarts restore prices from storage without touching the network."""
+
+    def _coordinator_with_storage(self, cache_data, scheduler_data=None):
+        coord = make_coordinator()
+        coord._cache_store.async_load = AsyncMock(return_value=cache_data)
+        coord._scheduler_store.async_load = AsyncMock(return_value=scheduler_data)
+        coord.backfill._store.async_load = AsyncMock(return_value=None)
+        return coord
+
+    def test_restore_today_and_tomorrow(self):
+        today = datetime.now(TGE_TIMEZONE).date()
+        tomorrow = today + timedelta(days=1)
+        stored = {"days": {
+            today.isoformat(): day_data(today, hours_in_day(today)).as_dict(),
+            tomorrow.isoformat(): day_data(tomorrow, hours_in_day(tomorrow)).as_dict(),
+        }}
+        coord = self._coordinator_with_storage(stored)
+        self.assertTrue(asyncio.run(coord.async_restore()))
+        self.assertEqual(coord.data["today"].date, today.isoformat())
+        self.assertEqual(coord.data["tomorrow"].date, tomorrow.isoformat())
+        self.assertTrue(coord.day_cache.is_final(today))
+        self.assertIsNone(coord._next_update_interval())
+
+    def test_restore_uses_warsaw_date_on_utc_host(self):
+        # 00:30 in Warsaw is still the previous day on a UTC host clock
+        instant = datetime(2025, 11, 22, 23, 30, tzinfo=timezone.utc)
+
+        class HostUTC(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return instant.astimezone(tz) if tz else instant.replace(tzinfo=None)
+
+        today = date(2025, 11, 23)
+        coord = self._coordinator_with_storage({"days": {
+            day.isoformat(): day_data(day).as_dict() for day in (today - timedelta(days=1), today)
+        }})
+        with patch.object(sensor_module, "datetime", HostUTC):
+            self.assertTrue(asyncio.run(coord.async_restore()))
+        self.assertEqual(coord.data["today"].day, today)
+        self.assertEqual(coord.data["yesterday"].day, today - timedelta(days=1))
+
+    def test_restore_without_today_needs_first_refresh(self):
+        old = datetime.now(TGE_TIMEZONE).date() - timedelta(days=5)
+        coord = self._coordinator_with_storage({"days": {old.isoformat(): day_data(old).as_dict()}})
+        self.assertFalse(asyncio.run(coord.async_restore()))
+        self.assertIsNone(coord.day_cache.get(old))
+
+    def test_restore_empty_storage(self):
+        coord = self._coordinator_with_storage(None)
+        self.assertFalse(asyncio.run(coord.async_restore()))
+
+    def test_restore_scheduler(self):
+        scheduler_data = {"histogram": {"765": 5}}
+        coord = self._coordinator_with_storage(None, scheduler_data)
+        asyncio.run(coord.async_restore())
+        self.assertEqual(coord.scheduler.observations, 5)
+
+    def test_flush_writes_all_stores(self):
+        coord = make_coordinator()
+        coord._cache_store.async_save = AsyncMock()
+        coord._scheduler_store.async_save = AsyncMock()
+        coord.backfill._store.async_save = AsyncMock()
+        asyncio.run(coord.async_flush_storage())
+        coord._cache_store.async_save.assert_awaited_once()
+        coord._scheduler_store.async_save.assert_awaited_once()
+        coord.backfill._store.async_save.assert_awaited_once()
+
+    def test_restore_history(self):
+        old = date(2024, 1, 1)
+        coord = self._coordinator_with_storage(None)
+        PriceArchive.open(coord.backfill._archive_path).append([day_data(old)])
+        asyncio.run(coord.async_restore())
+        self.assertIn(old, coord.backfill.history)
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """tge.pl errors keep the last good prices instead of failing the update."""
+
+    def setUp(self):
+        self._libs = sensor_module.REQUIRED_LIBRARIES_AVAILABLE
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = True
+        self.coord = make_coordinator()
+        self.coord.client = MagicMock()
+        self.now = datetime.now(TGE_TIMEZONE)
+        self.today = day_data(self.now.date(), 20)  # incomplete, still polled
+        self.coord.day_cache.store(self.now.date(), self.today)
+        self.coord.data = {"today": self.today, "tomorrow": None, "stale": False}
+
+    def tearDown(self):
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = self._libs
+
+    def _fail_fetches(self):
+        self.coord.client.async_fetch_page = AsyncMock(return_value=None)
+
+    def test_failed_fetch_serves_cached_today_as_stale(self):
+        self._fail_fetches()
+        data = asyncio.run(self.coord._async_update_data())
+        self.assertIs(data["today"], self.today)
+        self.assertTrue(data["stale"])
+        self.assertTrue(self.coord.stale)
+
+    def test_retry_backs_off_and_is_bounded(self):
+        self._fail_fetches()
+        intervals = []
+        for _ in range(8):
+            self.coord.data = asyncio.run(self.coord._async_update_data())
+            intervals.append(self.coord.update_interval.total_seconds())
+        self.assertEqual(intervals[:3], [60, 120, 240])
+        self.assertEqual(max(intervals), 300)  # never slower than the normal poll
+
+    def test_success_clears_stale(self):
+        self._fail_fetches()
+        self.coord.data = asyncio.run(self.coord._async_update_data())
+        self.coord.client.async_fetch_page = AsyncMock(
+            return_value=MagicMock(changed=False, entry=MagicMock(data=self.today))
+        )
+        data = asyncio.run(self.coord._async_update_data())
+        self.assertFalse(data["stale"])
+        self.assertIsNotNone(data["last_success"])
+        self.assertEqual(self.coord.update_interval.total_seconds(), 300)
+
+    def test_unexpected_error_serves_stale(self):
+        async def boom(now):
+            raise RuntimeError("parser exploded")
+
+        self.coord._handle_tomorrow_data = boom
+        data = asyncio.run(self.coord._async_update_data())
+        self.assertIs(data["today"], self.today)
+        self.assertTrue(data["stale"])
+
+    def test_expired_day_is_not_served(self):
+        yesterday = self.now.date() - timedelta(days=1)
+        self.coord.data = {"today": day_data(yesterday), "tomorrow": None}
+
+        async def boom(now):
+            raise RuntimeError("down")
+
+        self.coord._handle_tomorrow_data = boom
+        with self.assertRaises(sensor_module.UpdateFailed):
+            asyncio.run(self.coord._async_update_data())
+
+
+class TestTableParse(unittest.TestCase):
+    """The streamed table slice is parsed in the executor, off the event loop."""
+
+    def test_table_slice_parsed_in_executor(self):
+        coord = make_coordinator()
+        jobs = []
+
+        async def executor_job(func, *args):
+            jobs.append(func)
+            return func(*args)
+
+        coord.hass.async_add_executor_job = executor_job
+        day = datetime(2025, 11, 22)
+        html = (
+            '<table id="rdn"><tr><td>h</td></tr><tr><td>h</td></tr>'
+            '<tr><td>2025-11-22_H01</td><td>60</td><td>479,99</td></tr></table>'
+        )
+        coord.client = MagicMock()
+        coord.client.async_fetch_page = AsyncMock(
+            return_value=MagicMock(changed=True, html=html, entry=MagicMock(data=None))
+        )
+        result = asyncio.run(coord._fetch_day_data(day, "today"))
+        self.assertEqual(result.hour_prices[0], 479.99)
+        self.assertEqual(jobs, [sensor_module.parse_rdn_table])
+
+
+class TestOptionsInPlace(unittest.TestCase):
+    """Option changes rebuild derived values without touching the coordinator."""
+
+    def test_options_update_recomputes_without_refresh(self):
+        coord = make_coordinator()
+        entry = MockEntry({
+            sensor_module.CONF_DISTRIBUTOR: "PGE Dystrybucja",
+            sensor_module.CONF_DIST_TARIFF: "G11",
+        })
+        entity = sensor_module.TGERDNSensor(coord, entry, "current_price", bundled_registry())
+        entity.async_write_ha_state = MagicMock()
+        noon = datetime(2025, 1, 1, 12, 0)
+        g11_rate = entity._pricing.resolve(noon)[1]
+
+        entry.options = {
+            sensor_module.CONF_DISTRIBUTOR: "PGE Dystrybucja",
+            sensor_module.CONF_DIST_TARIFF: "G12",
+            CONF_UNIT: UNIT_PLN_KWH,
+        }
+        entity._async_options_updated()
+
+        self.assertNotEqual(entity._pricing.resolve(noon)[1], g11_rate)
+        self.assertEqual(entity._pricing.unit, UNIT_PLN_KWH)
+        entity.async_write_ha_state.assert_called_once()
+        self.assertEqual(coord.refresh_requests, 0)
+        self.assertEqual(coord.hass.tasks, [])
+
+
+    def test_tariffs_reload_rebuilds_pricing(self):
+        coord = make_coordinator()
+        entry = MockEntry({sensor_module.CONF_DISTRIBUTOR: "Dist", sensor_module.CONF_DIST_TARIFF: "G11"})
+        entity = sensor_module.TGERDNSensor(coord, entry, "current_price", bundled_registry())
+        entity.async_write_ha_state = MagicMock()
+        zones = {"all": {"rate": 123.0, "schedule": [{"default": True}]}}
+        entity._async_tariffs_reloaded(sensor_module.TariffRegistry(
+            {"distributors": [{"name": "Dist", "tariffs": [{"name": "G11", "zones": zones}]}]}
+        ))
+        self.assertEqual(entity._pricing.resolve(datetime(2025, 1, 1, 10, 0))[1], 123.0)
+        entity.async_write_ha_state.assert_called_once()
+
+
+class TestSharedGrossPrices(unittest.TestCase):
+    """All price entities of an entry read one set of gross vectors."""
+
+    def setUp(self):
+        self._libs = sensor_module.REQUIRED_LIBRARIES_AVAILABLE
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = True
+        self.coord = make_coordinator()
+        self.entry = MockEntry({
+            sensor_module.CONF_DISTRIBUTOR: "PGE Dystrybucja",
+            sensor_module.CONF_DIST_TARIFF: "G12",
+        })
+        self.today = day_data(datetime.now(TGE_TIMEZONE).date(), 24)
+        self.coord.data = {"today": self.today, "tomorrow": None}
+        self.entities = [
+            sensor_module.TGERDNSensor(self.coord, self.entry, kind, bundled_registry())
+            for kind in ("current_price", "next_hour_price", "daily_average")
+        ]
+
+    def tearDown(self):
+        sensor_module.REQUIRED_LIBRARIES_AVAILABLE = self._libs
+
+    def test_vectors_built_once_for_all_entities(self):
+        attrs = [entity.extra_state_attributes for entity in self.entities]
+        for entity in self.entities:
+            entity._calc()
+        self.assertEqual(len(self.coord.price_book), 1)
+        schedule = sensor_module.TGEPriceScheduleSensor(self.coord, self.entry, bundled_registry())
+        self.assertIs(
+            schedule.extra_state_attributes["today"],
+            self.entities[0]._day_prices(self.today).schedule,
+        )
+        self.assertEqual(len(self.coord.price_book), 1)
+        for entity_attrs in attrs:
+            self.assertNotIn("prices_today_gross", entity_attrs)
+
+    def test_vectors_match_per_slot_computation(self):
+        entity = self.entities[0]
+        prices = entity._day_prices(self.today)
+        for pos, price in enumerate(self.today.hour_prices):
+            expected = entity._pricing.zone_total(price, self.today.hour_start(pos))[1]
+            self.assertAlmostEqual(prices.gross[pos], expected)
+        expected_avg = entity._pricing.apply_unit(sum(prices.gross) / len(prices.gross))
+        self.assertAlmostEqual(self.entities[2]._calc(), expected_avg)
+
+    def test_option_change_rebuilds(self):
+        before = self.entities[0]._day_prices(self.today)
+        self.entry.options = {**self.entry.options, sensor_module.CONF_VAT_RATE: 0.08}
+        for entity in self.entities:
+            entity.async_write_ha_state = MagicMock()
+            entity._async_options_updated()
+        after = self.entities[0]._day_prices(self.today)
+        self.assertIsNot(after, before)
+        self.assertIs(self.entities[1]._day_prices(self.today), after)
+        self.assertLess(after.gross[12], before.gross[12])
+
+    def test_schedule_entity(self):
+        schedule = sensor_module.TGEPriceScheduleSensor(self.coord, self.entry, bundled_registry())
+        self.assertEqual(schedule.state, self.today.date)
+        self.assertIsNone(schedule.native_unit_of_measurement)
+        attrs = schedule.extra_state_attributes
+        self.assertEqual(attrs["today"]["hours"]["spot"], list(self.today.hour_prices))
+        self.assertIsNone(attrs["tomorrow"])
+        self.assertLessEqual({"today", "tomorrow"}, schedule._unrecorded_attributes)
+        self.assertIn("data_age", self.entities[0]._unrecorded_attributes)
+
+        tomorrow = day_data(self.today.day + timedelta(days=1), 24)
+        self.coord.data = {"today": self.today, "tomorrow": tomorrow}
+        self.assertEqual(schedule.state, tomorrow.date)
+
+    def test_unchanged_updates_skip_state_writes(self):
+        for entity in self.entities:
+            entity.async_write_ha_state = MagicMock()
+        for _ in range(3):
+            for entity in self.entities:
+                entity._handle_coordinator_update()
+        for entity in self.entities:
+            entity.async_write_ha_state.assert_called_once()
+
+        # New data with the same prices: attributes (last_update) may differ
+        self.coord.data = {**self.coord.data, "last_update": datetime.now()}
+        self.entities[2]._handle_coordinator_update()
+        self.assertEqual(self.entities[2].async_write_ha_state.call_count, 2)
+
+    def test_failed_refresh_writes_unavailable(self):
+        entity = self.entities[2]
+        entity.async_write_ha_state = MagicMock()
+        entity._handle_coordinator_update()
+        self.coord.last_update_success = False
+        entity._handle_coordinator_update()
+        self.assertEqual(entity.async_write_ha_state.call_count, 2)
+        self.assertFalse(entity.available)
+
+    def test_value_change_writes_state(self):
+        entity = self.entities[0]
+        entity.async_write_ha_state = MagicMock()
+        entity._handle_coordinator_update()
+        with patch.object(sensor_module.TGERDNSensor, "_calc", return_value=123.0):
+            entity._handle_coordinator_update()
+        self.assertEqual(entity.async_write_ha_state.call_count, 2)
+
+    def test_option_change_writes_on_next_update(self):
+        entity = self.entities[2]
+        entity.async_write_ha_state = MagicMock()
+        entity._handle_coordinator_update()
+        self.entry.options = {**self.entry.options, sensor_module.CONF_VAT_RATE: 0.08}
+        entity._pricing = sensor_module.TariffPricing(self.entry.options, entity._tariffs)
+        entity._handle_coordinator_update()
+        self.assertEqual(entity.async_write_ha_state.call_count, 2)
+
+    def test_coordinator_publishes_statistics(self):
+        self.coord.entry = self.entry
+        self.coord.async_options_updated()
+        self.coord.statistics.publish = MagicMock()
+        self.coord.async_update_listeners()
+        # Entities with matching options read the very same vectors
+        self.coord.statistics.publish.assert_called_once_with(
+            self.entities[0]._day_prices(self.today)
+        )
+
+    def test_statistics_follow_option_changes_without_entities(self):
+        self.coord.statistics.publish = MagicMock()
+        self.coord.entry.options = {sensor_module.CONF_VAT_RATE: 0.08}
+        self.coord.async_options_updated()
+        prices = self.coord.statistics.publish.call_args[0][0]
+        self.assertEqual(self.coord.pricing.vat, 0.08)
+        self.assertIs(prices, self.coord.pricing.day_prices(self.coord.price_book, self.today))
+
+
+if __name__ == '__main__':
+    unittest.main()
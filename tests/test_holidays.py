@@ -0,0 +1,94 @@
+"""Tests for the Polish holiday calendar."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from datetime import date
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.holidays import (  # noqa: E402
+    holidays_for_year,
+    holidays_in_range,
+    is_polish_holiday,
+    parse_extra_holidays,
+)
+
+
+class TestHolidayCalendar(unittest.TestCase):
+    """Per-year frozenset calendars."""
+
+    def test_thirteen_statutory_days(self):
+        days = holidays_for_year(2026)
+        self.assertIsInstance(days, frozenset)
+        self.assertEqual(len(days), 13)
+        self.assertIn(date(2026, 6, 4), days)  # Corpus Christi
+
+    def test_year_is_computed_once(self):
+        self.assertIs(holidays_for_year(2027), holidays_for_year(2027))
+
+    def test_christmas_eve_not_statutory_by_default(self):
+        self.assertFalse(is_polish_holiday(date(2025, 12, 24)))
+
+
+class TestExtraHolidays(unittest.TestCase):
+    """User- and JSON-supplied non-working days."""
+
+    def test_recurring_with_start_year(self):
+        extra = parse_extra_holidays([{"date": "12-24", "from": 2025}])
+        self.assertFalse(is_polish_holiday(date(2024, 12, 24), extra))
+        self.assertTrue(is_polish_holiday(date(2025, 12, 24), extra))
+        self.assertTrue(is_polish_holiday(date(2030, 12, 24), extra))
+
+    def test_bounded_range(self):
+        extra = parse_extra_holidays([{"date": "03-08", "from": 2025, "until": 2026}])
+        self.assertTrue(is_polish_holiday(date(2026, 3, 8), extra))
+        self.assertFalse(is_polish_holiday(date(2027, 3, 8), extra))
+
+    def test_one_off_and_string_input(self):
+        extra = parse_extra_holidays("2025-05-02, 11-10")
+        self.assertTrue(is_polish_holiday(date(2025, 5, 2), extra))
+        self.assertFalse(is_polish_holiday(date(2026, 5, 2), extra))
+        self.assertTrue(is_polish_holiday(date(2026, 11, 10), extra))
+
+    def test_invalid_entries_are_skipped(self):
+        with self.assertLogs("custom_components.tge_rdn.holidays", level="WARNING"):
+            extra = parse_extra_holidays(["13-45", "tomorrow", {"from": 2025}, "2025-05-02"])
+        self.assertEqual(extra, ((5, 2, 2025, 2025),))
+
+    def test_leap_day(self):
+        extra = parse_extra_holidays(["02-29"])
+        self.assertTrue(is_polish_holiday(date(2028, 2, 29), extra))
+        self.assertEqual(len(holidays_for_year(2027, extra)), 13)
+
+    def test_empty_input(self):
+        self.assertEqual(parse_extra_holidays(""), ())
+        self.assertEqual(parse_extra_holidays(None), ())
+
+
+class TestHolidaysInRange(unittest.TestCase):
+    """Bulk range queries for history computations."""
+
+    def test_half_open_range(self):
+        days = holidays_in_range(date(2025, 12, 24), date(2026, 1, 6))
+        self.assertEqual(days, [date(2025, 12, 25), date(2025, 12, 26), date(2026, 1, 1)])
+
+    def test_spans_years_with_extra(self):
+        extra = parse_extra_holidays([{"date": "12-24", "from": 2025}])
+        days = holidays_in_range(date(2024, 1, 1), date(2027, 1, 1), extra)
+        self.assertEqual(len(days), 3 * 13 + 2)
+        self.assertEqual(days, sorted(days))
+
+
+if __name__ == '__main__':
+    unittest.main()
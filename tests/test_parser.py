@@ -0,0 +1,328 @@
+"""Tests for the table parser and its row-extraction backends."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn import parser  # noqa: E402
+from custom_components.tge_rdn.parser import (  # noqa: E402
+    DEFAULT_BACKEND,
+    DEFAULT_COLUMN_MAP,
+    ROW_BACKENDS,
+    TableStream,
+    column_map,
+    extract_table_html,
+    extract_table_rows,
+    parse_rdn_table,
+    parse_table_rows,
+)
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), "tge_page_sample.html")
+
+FULL_HEADER = (
+    '<table id="rdn"><thead><tr>'
+    '<th>&nbsp;</th><th>&nbsp;</th><th colspan="2">Fixing I</th>'
+    '<th colspan="2">Notowania ciągłe</th><th colspan="5">Fixing II</th>'
+    '<th colspan="6">Łącznie notowania</th></tr><tr>'
+    '<th>Data dostawy</th><th>Typ instrumentu</th>'
+    '<th>Kurs [PLN/MWh]</th><th>Wolumen [MW]</th>'
+    '<th>Kurs (średnioważony) [PLN/MWh]</th><th>Wolumen [MW]</th>'
+    '<th>Kurs jednolity [EUR/MWh]</th><th>Kurs jednolity [PLN/MWh]</th>'
+    '<th>Wolumen [MW]</th><th>Wolumen kupna [MW]</th><th>Wolumen sprzedaży [MW]</th>'
+    '<th>Kurs min. [PLN/MWh]</th><th>Kurs max. [PLN/MWh]</th>'
+    '<th>Kurs (średnioważony) [PLN/MWh]</th><th>Wolumen [MWh]</th>'
+    '<th>Wolumen kupna [MWh]</th><th>Wolumen sprzedaży [MWh]</th>'
+    '</tr></thead><tbody>'
+)
+HEADER = '<html><body><div class="table-rdb-holder">' + FULL_HEADER
+FOOTER = '</tbody></table><script>var x = "<tr><td>2025-11-22_H05</td>";</script></body></html>'
+
+
+def row(label: str, fixing1: str = "-", fixing2: str = "-", weighted: str = "-") -> str:
+    """Build a 17-column table row like tge.pl renders it."""
+    cells = [label, "60", fixing1, "1,0", "-", "-", "-", fixing2] + ["-"] * 5 + [weighted] + ["-"] * 3
+    return "<tr>" + "".join(f"<td align=\"right\">\n  {c}\n</td>" for c in cells) + "</tr>"
+
+
+def page(*rows: str) -> str:
+    return HEADER + "".join(rows) + FOOTER
+
+
+class TestTokenizerBackend(unittest.TestCase):
+    """The stdlib tokenizer is always available and matches bs4 semantics."""
+
+    def test_always_registered(self):
+        self.assertIn("tokenizer", ROW_BACKENDS)
+        self.assertIn(DEFAULT_BACKEND, ROW_BACKENDS)
+
+    def test_rows_include_header_rows(self):
+        rows = extract_table_rows(page(row("2025-11-22_H01", "479,99")), "tokenizer")
+        self.assertEqual(rows[0], [])
+        self.assertEqual(rows[1], [])
+        self.assertEqual(rows[2][0], "2025-11-22_H01")
+        self.assertEqual(rows[2][2], "479,99")
+
+    def test_ignores_markup_after_table(self):
+        rows = extract_table_rows(page(row("2025-11-22_H01", "1")), "tokenizer")
+        self.assertEqual(len(rows), 3)
+
+    def test_unclosed_cells(self):
+        html = '<table id="rdn"><tr><td>a<td> b <b>c</b><tr><td>d</table>'
+        self.assertEqual(extract_table_rows(html, "tokenizer"), [["a", "bc"], ["d"]])
+
+    def test_entities_and_thousands_separator(self):
+        result = parse_rdn_table(
+            page(row("2025-11-22_H01", "1&nbsp;234,56")), datetime(2025, 11, 22), "tokenizer"
+        )
+        self.assertEqual(result.hour_prices[0], 1234.56)
+
+    def test_missing_table(self):
+        self.assertIsNone(extract_table_rows("<html><body>maintenance</body></html>"))
+        self.assertIsNone(parse_rdn_table("<html></html>", datetime(2025, 11, 22)))
+
+
+class TestParseRdnTable(unittest.TestCase):
+    """Day parsing on top of the row backends."""
+
+    def test_full_day(self):
+        html = page(*[row(f"2025-11-22_H{h:02d}", f"{100 + h},00") for h in range(1, 25)])
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        self.assertEqual(result.total_hours, 24)
+        self.assertEqual(result.min_price, 101.0)
+        self.assertEqual(result.max_price, 124.0)
+
+    def test_column_priority_and_quarters(self):
+        html = page(
+            row("2025-11-22_H01", fixing2="200,00"),
+            row("2025-11-22_H02", weighted="-5,50"),
+            row("2025-11-22_Q00:15", "999,00"),
+            row("2025-11-23_H01", "1,00"),
+        )
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        prices = list(result.hour_prices)
+        self.assertEqual(prices, [200.0, -5.5])
+        self.assertEqual(result.negative_hours, 1)
+
+    def test_dst_marker(self):
+        html = page(row("2025-10-26_H02a", "10,00"), row("2025-10-26_H02b", "20,00"))
+        result = parse_rdn_table(html, datetime(2025, 10, 26))
+        self.assertEqual([m for _h, m, _p in result.hours()], ["a", "b"])
+
+    def test_sample_page(self):
+        with open(SAMPLE_PATH, encoding="utf-8") as f:
+            html = f.read()
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        self.assertEqual(result.hour_numbers[0], 1)
+        self.assertEqual(result.hour_prices[0], 479.99)
+
+
+class TestBackendSelection(unittest.TestCase):
+    """All installed backends agree; failures fall back to bs4."""
+
+    def test_backends_agree_on_sample(self):
+        with open(SAMPLE_PATH, encoding="utf-8") as f:
+            html = f.read()
+        expected = extract_table_rows(html, "tokenizer")
+        for name in ROW_BACKENDS:
+            with self.subTest(backend=name):
+                self.assertEqual(extract_table_rows(html, name), expected)
+
+    @unittest.skipUnless("bs4" in ROW_BACKENDS, "beautifulsoup4 not installed")
+    def test_failing_backend_falls_back_to_bs4(self):
+        broken = MagicMock(side_effect=ValueError("bad markup"))
+        with patch.dict(parser.ROW_BACKENDS, {"tokenizer": broken}):
+            rows = extract_table_rows(page(row("2025-11-22_H01", "1")), "tokenizer")
+        self.assertEqual(rows[2][0], "2025-11-22_H01")
+
+
+
+
+class TestColumnMap(unittest.TestCase):
+    """Columns come from the <thead>, cached per layout fingerprint."""
+
+    def test_sample_header_matches_default(self):
+        with open(SAMPLE_PATH, encoding="utf-8") as f:
+            html = f.read()
+        self.assertEqual(column_map(extract_table_html(html)), DEFAULT_COLUMN_MAP)
+
+    def test_full_header(self):
+        self.assertEqual(column_map(FULL_HEADER + "</tbody></table>"), DEFAULT_COLUMN_MAP)
+
+    def test_partial_header_maps_only_known_columns(self):
+        header = (
+            '<table id="rdn"><thead><tr><th></th><th></th><th colspan="2">Fixing I</th></tr>'
+            '<tr><th>Data</th><th>Typ</th><th>Kurs [PLN/MWh]</th><th>Wolumen [MW]</th></tr></thead></table>'
+        )
+        self.assertEqual(column_map(header), {"fixing1": 2, "fixing1_volume": 3})
+
+    def test_reordered_layout(self):
+        header = (
+            '<table id="rdn"><thead><tr><th></th><th colspan="2">Fixing II</th>'
+            '<th colspan="2">Fixing I</th></tr><tr><th>Data</th>'
+            '<th>Kurs jednolity [PLN/MWh]</th><th>Kurs jednolity [EUR/MWh]</th>'
+            '<th>Kurs [PLN/MWh]</th><th>Wolumen [MW]</th></tr></thead></table>'
+        )
+        columns = column_map(header)
+        self.assertEqual(columns, {"fixing2": 1, "fixing2_eur": 2, "fixing1": 3, "fixing1_volume": 4})
+        self.assertIs(column_map(header), columns)
+
+    def test_unknown_header_falls_back(self):
+        self.assertEqual(column_map('<table><thead><tr><th>x</th></tr></thead></table>'), DEFAULT_COLUMN_MAP)
+        self.assertEqual(column_map(None), DEFAULT_COLUMN_MAP)
+
+    def test_all_columns_and_eur_rate(self):
+        cells = ["2025-11-22_H01", "60", "480,00", "100,0", "470,00", "5,0",
+                 "100,00", "430,00", "50,0", "1,0", "2,0", "420,00", "490,00", "475,00", "155,0", "0", "0"]
+        html = FULL_HEADER + "<tr>" + "".join(f"<td>{c}</td>" for c in cells) + "</tr></tbody></table>"
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        self.assertEqual(result.hour_prices[0], 480.0)
+        self.assertEqual(result.columns["fixing2"][0], 430.0)
+        self.assertEqual(result.columns["continuous"][0], 470.0)
+        self.assertEqual(result.columns["volume"][0], 155.0)
+        self.assertEqual(result.eur_rate, 4.3)
+
+    def test_no_eur_quote(self):
+        result = parse_rdn_table(page(row("2025-11-22_H01", "1,00")), datetime(2025, 11, 22))
+        self.assertIsNone(result.eur_rate)
+
+
+def quarter_rows(day: str, hours: range, price=lambda minute: f"{minute},00", repeat=()):
+    """Build end-labelled quarter rows; hours in `repeat` get a/b DST copies."""
+    rows = []
+    for hour in hours:
+        markers = ("a", "b") if hour in repeat else ("",)
+        for marker in markers:
+            for q in range(4):
+                end = hour * 60 + (q + 1) * 15
+                label = f"{day}_Q{end // 60:02d}:{end % 60:02d}{marker}"
+                rows.append(row(label, price(hour * 60 + q * 15)))
+    return rows
+
+
+class TestQuarterHours(unittest.TestCase):
+    """15-minute MTU rows are parsed into quarter slots; hours aggregate them."""
+
+    def test_end_labelled_quarters(self):
+        html = page(*quarter_rows("2025-11-22", range(24)))
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        self.assertEqual(len(result.quarter_prices), 96)
+        self.assertEqual(result.quarter_minutes[0], 0)
+        self.assertEqual(result.quarter_price(0), 0.0)
+        self.assertEqual(result.quarter_minutes[-1], 23 * 60 + 45)
+
+    def test_hours_are_quarter_means(self):
+        html = page(
+            row("2025-11-22_H01", "999,00"),
+            *quarter_rows("2025-11-22", range(24)),
+        )
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        self.assertEqual(result.hourly_source, "quarters")
+        self.assertEqual(result.total_hours, 24)
+        # minutes 0, 15, 30, 45 → mean 22.5
+        self.assertEqual(result.hour_prices[0], 22.5)
+        self.assertEqual(result.hour_numbers[0], 1)
+
+    def test_hour_columns_from_quarter_only_table(self):
+        cells = ["60", "{p},00", "10,0", "470,00", "5,0", "100,00", "430,00", "50,0",
+                 "1,0", "2,0", "{lo},00", "{hi},00", "475,00", "{vol},0", "0", "0"]
+        rows = []
+        for q in range(96):
+            end = (q + 1) * 15
+            label = f"2025-11-22_Q{end // 60:02d}:{end % 60:02d}"
+            values = [c.format(p=400 + q, lo=300 + q, hi=500 + q, vol=q) for c in cells]
+            rows.append("<tr>" + "".join(f"<td>{c}</td>" for c in [label] + values) + "</tr>")
+        html = FULL_HEADER + "".join(rows) + "</tbody></table>"
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        self.assertEqual(result.hourly_source, "quarters")
+        self.assertEqual(len(result.columns["fixing2"]), 24)
+        # Quarters 4-7 make up the second hour
+        self.assertEqual(result.columns["fixing1"][1], 405.5)
+        self.assertEqual(result.columns["fixing2"][1], 430.0)
+        self.assertEqual(result.columns["continuous"][1], 470.0)
+        self.assertEqual(result.columns["fixing1_volume"][1], 10.0)
+        self.assertEqual(result.columns["min"][1], 304.0)
+        self.assertEqual(result.columns["max"][1], 507.0)
+        self.assertEqual(result.columns["volume"][1], 4.0 + 5.0 + 6.0 + 7.0)
+
+    def test_incomplete_quarters_keep_hour_rows(self):
+        html = page(row("2025-11-22_H01", "100,00"), *quarter_rows("2025-11-22", range(2)))
+        result = parse_rdn_table(html, datetime(2025, 11, 22))
+        self.assertEqual(result.hourly_source, "hours")
+        self.assertEqual(result.hour_prices[0], 100.0)
+        self.assertEqual(len(result.quarter_prices), 8)
+
+    def test_fall_back_day_has_100_quarters(self):
+        html = page(*quarter_rows("2025-10-26", range(24), repeat=(2,)))
+        result = parse_rdn_table(html, datetime(2025, 10, 26))
+        self.assertEqual(len(result.quarter_prices), 100)
+        self.assertEqual(result.total_hours, 25)
+        repeated = [m for _q, m, _p in result.quarters()][8:16]
+        self.assertEqual(repeated, ["a"] * 4 + ["b"] * 4)
+        self.assertEqual([m for _h, m, _p in result.hours()][2:4], ["a", "b"])
+
+    def test_spring_forward_day_has_92_quarters(self):
+        hours = [h for h in range(24) if h != 2]
+        html = page(*quarter_rows("2025-03-30", hours))
+        result = parse_rdn_table(html, datetime(2025, 3, 30))
+        self.assertEqual(len(result.quarter_prices), 92)
+        self.assertEqual(result.hourly_source, "quarters")
+        self.assertEqual(result.total_hours, 23)
+
+
+class TestTableStream(unittest.TestCase):
+    """Incremental collection gives the same table slice for any chunking."""
+
+    def _stream(self, html: str, size: int) -> TableStream:
+        stream = TableStream()
+        for i in range(0, len(html), size):
+            stream.feed(html[i:i + size])
+        return stream
+
+    def test_any_chunk_size_matches_full_parse(self):
+        with open(SAMPLE_PATH, encoding="utf-8") as f:
+            html = f.read()
+        # The sample is truncated inside the table, so it never closes
+        expected = extract_table_html(html)
+        for size in (1, 7, 8, 4096, len(html)):
+            with self.subTest(size=size):
+                stream = self._stream(html, size)
+                self.assertTrue(stream.found)
+                self.assertFalse(stream.done)
+                self.assertEqual(stream.html, expected)
+
+    def test_end_tag_split_across_chunks(self):
+        html = page(row("2025-11-22_H01", "1 234,56"))
+        for size in (1, 3, 5):
+            with self.subTest(size=size):
+                stream = self._stream(html, size)
+                self.assertTrue(stream.done)
+                self.assertEqual(stream.html, extract_table_html(html))
+
+    def test_ignores_text_after_table(self):
+        stream = self._stream(page(row("2025-11-22_H01", "1,00")) + "<table id=\"rdn\"></table>", 10)
+        result = parse_rdn_table(stream.html, datetime(2025, 11, 22))
+        self.assertEqual(result.total_hours, 1)
+        self.assertTrue(stream.html.endswith("</table>"))
+        self.assertEqual(stream.html.count("<table"), 1)
+
+    def test_without_marker_keeps_page(self):
+        stream = self._stream("<p>maintenance</p>", 4)
+        self.assertFalse(stream.found)
+        self.assertEqual(stream.html, "<p>maintenance</p>")
+
+
+if __name__ == '__main__':
+    unittest.main()
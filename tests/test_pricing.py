@@ -0,0 +1,124 @@
+"""Tests for shared gross price vectors."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.pricing import PriceBook, build_day_prices  # noqa: E402
+from custom_components.tge_rdn.series import DaySeries  # noqa: E402
+from custom_components.tge_rdn.slots import TGE_TIMEZONE  # noqa: E402
+
+
+def night_zone(price, when):
+    """Flat +100 distribution, 'night' before 06:00 local."""
+    zone = "night" if when.astimezone(TGE_TIMEZONE).hour < 6 else "day"
+    return zone, price + 100.0
+
+
+def per_kwh(mwh, eur_rate=None):
+    return mwh / 1000
+
+
+class TestBuildDayPrices(unittest.TestCase):
+    """Vectors are aligned with the series' slots."""
+
+    def setUp(self):
+        self.day = DaySeries(
+            date(2025, 11, 22),
+            [float(h) for h in range(24)],
+            range(1, 25),
+            quarter_prices=[10.0, 20.0, 30.0, 40.0],
+            quarter_minutes=[420, 435, 450, 465],
+        )
+        self.prices = build_day_prices(self.day, night_zone, per_kwh)
+
+    def test_hour_vectors(self):
+        self.assertEqual(len(self.prices.gross), 24)
+        self.assertEqual(self.prices.gross[3], 103.0)
+        self.assertEqual(self.prices.values[3], 0.103)
+        self.assertEqual(self.prices.zones[5], "night")
+        self.assertEqual(self.prices.zones[6], "day")
+        self.assertAlmostEqual(self.prices.average, (11.5 + 100.0) / 1000)
+
+    def test_schedule_payload(self):
+        hours = self.prices.schedule["hours"]
+        self.assertEqual(self.prices.schedule["date"], "2025-11-22")
+        self.assertEqual(hours["start"], "2025-11-22T00:00:00+01:00")
+        self.assertEqual(hours["step"], 60)
+        self.assertEqual(hours["spot"][3], 3.0)
+        self.assertEqual(hours["gross"][3], 0.103)
+        quarters = self.prices.schedule["quarters"]
+        self.assertEqual(quarters["start"], "2025-11-22T07:00:00+01:00")
+        self.assertEqual(quarters["step"], 15)
+        self.assertEqual(quarters["gross"], [0.11, 0.12, 0.13, 0.14])
+
+    def test_schedule_fills_gaps(self):
+        day = DaySeries(date(2025, 11, 22), [1.0, 2.0, 4.0], [1, 2, 4])
+        hours = build_day_prices(day, night_zone, per_kwh).schedule["hours"]
+        self.assertEqual(hours["spot"], [1.0, 2.0, None, 4.0])
+        self.assertEqual(hours["gross"], [0.101, 0.102, None, 0.104])
+
+    def test_schedule_on_fall_back_day(self):
+        day = DaySeries(date(2025, 10, 26), [float(h) for h in range(25)], range(1, 26))
+        hours = build_day_prices(day, night_zone, per_kwh).schedule["hours"]
+        self.assertEqual(hours["start"], "2025-10-26T00:00:00+02:00")
+        self.assertEqual(len(hours["spot"]), 25)
+        self.assertNotIn("quarters", build_day_prices(day, night_zone, per_kwh).schedule)
+
+    def test_value_at_prefers_quarters(self):
+        self.assertEqual(self.prices.value_at(datetime(2025, 11, 22, 7, 20)), 0.12)
+        self.assertEqual(self.prices.value_at(datetime(2025, 11, 22, 8, 20)), 0.108)
+        self.assertIsNone(self.prices.value_at(datetime(2025, 11, 23, 0, 0, tzinfo=timezone.utc)))
+
+    def test_empty_day(self):
+        prices = build_day_prices(DaySeries(date(2025, 11, 22), [], []), night_zone, per_kwh)
+        self.assertIsNone(prices.average)
+        self.assertEqual(prices.schedule["hours"]["spot"], [])
+
+
+class TestPriceBook(unittest.TestCase):
+    """Vectors are built once per series and tariff key."""
+
+    def setUp(self):
+        self.book = PriceBook()
+        self.builds = 0
+
+    def _build(self, series):
+        self.builds += 1
+        return build_day_prices(series, night_zone, per_kwh)
+
+    def test_shared_between_readers(self):
+        day = DaySeries(date(2025, 11, 22), [1.0, 2.0], [1, 2])
+        first = self.book.get(day, "g11", self._build)
+        for _ in range(3):
+            self.assertIs(self.book.get(day, "g11", self._build), first)
+        self.assertEqual(self.builds, 1)
+
+    def test_new_series_or_tariff_rebuilds(self):
+        day = DaySeries(date(2025, 11, 22), [1.0], [1])
+        self.book.get(day, "g11", self._build)
+        self.book.get(day, "g12", self._build)
+        self.book.get(DaySeries(date(2025, 11, 22), [1.0], [1]), "g11", self._build)
+        self.assertEqual(self.builds, 3)
+
+    def test_bounded(self):
+        for day in range(1, 20):
+            self.book.get(DaySeries(date(2025, 11, day), [1.0], [1]), "g11", self._build)
+        self.assertLessEqual(len(self.book), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Tests for the learned publication-time scheduler."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.const import (  # noqa: E402
+    POLL_INTERVAL_BACKOFF_MAX,
+    POLL_INTERVAL_BACKOFF_MIN,
+    POLL_INTERVAL_DENSE,
+    POLL_INTERVAL_PRIOR,
+    PUBLICATION_PRIOR_WINDOW,
+)
+from custom_components.tge_rdn.scheduler import PublicationScheduler  # noqa: E402
+from custom_components.tge_rdn.slots import TGE_TIMEZONE  # noqa: E402
+
+
+def at(hour: int, minute: int = 0, day: int = 22) -> datetime:
+    return datetime(2025, 11, day, hour, minute, tzinfo=TGE_TIMEZONE)
+
+
+def learned_scheduler() -> PublicationScheduler:
+    """Scheduler that saw publications between 12:40 and 12:55."""
+    scheduler = PublicationScheduler()
+    for minute in (40, 42, 45, 47, 50, 55):
+        scheduler.record(at(12, minute))
+    return scheduler
+
+
+class TestPriorSchedule(unittest.TestCase):
+    """Before learning, keep the old 11:00–16:00 polling."""
+
+    def test_not_learned_uses_prior_window(self):
+        scheduler = PublicationScheduler()
+        self.assertFalse(scheduler.learned)
+        self.assertEqual(scheduler.window(), PUBLICATION_PRIOR_WINDOW)
+
+    def test_prior_interval_inside_window(self):
+        scheduler = PublicationScheduler()
+        self.assertEqual(scheduler.next_poll_delay(at(12), False), POLL_INTERVAL_PRIOR)
+
+    def test_sleeps_until_window(self):
+        scheduler = PublicationScheduler()
+        self.assertAlmostEqual(scheduler.next_poll_delay(at(9), False), 2 * 3600)
+
+
+class TestLearnedSchedule(unittest.TestCase):
+    """After learning, poll densely only around the predicted instant."""
+
+    def test_window_narrows_around_observations(self):
+        start, end = learned_scheduler().window()
+        self.assertLessEqual(start, 12 * 60 + 40)
+        self.assertGreaterEqual(end, 12 * 60 + 55)
+        self.assertLess(end - start, 60)
+
+    def test_dense_inside_window(self):
+        self.assertEqual(learned_scheduler().next_poll_delay(at(12, 45), False), POLL_INTERVAL_DENSE)
+
+    def test_sleep_before_window(self):
+        scheduler = learned_scheduler()
+        start, _end = scheduler.window()
+        delay = scheduler.next_poll_delay(at(11), False)
+        self.assertAlmostEqual(delay, (start - 11 * 60) * 60)
+
+    def test_exponential_backoff_after_window(self):
+        scheduler = learned_scheduler()
+        _start, end = scheduler.window()
+        first = scheduler.next_poll_delay(at(end // 60, end % 60 + 1), False)
+        self.assertEqual(first, POLL_INTERVAL_BACKOFF_MIN)
+        later = scheduler.next_poll_delay(at(end // 60 + 1, end % 60), False)
+        self.assertGreater(later, first)
+        late = scheduler.next_poll_delay(at(23, 0), False)
+        self.assertEqual(late, POLL_INTERVAL_BACKOFF_MAX)
+
+    def test_stop_when_final(self):
+        self.assertIsNone(learned_scheduler().next_poll_delay(at(12, 45), True))
+
+    def test_fewer_requests_than_fixed_intervals(self):
+        """Simulate a day published at 12:48: count polls until it is seen."""
+        scheduler = learned_scheduler()
+        published = 12 * 60 + 48
+        t = 0.0
+        polls = 0
+        while t < published:
+            hour, minute = divmod(int(t), 60)
+            t += scheduler.next_poll_delay(at(hour, minute, day=23), False) / 60
+            polls += 1
+        # Old schedule: every 30 min until 11:00, 15 min until 12:00, 10 min after
+        self.assertLess(polls, 22 + 4 + 5)
+        self.assertLess(t - published, 1.01)
+
+
+class TestHistogram(unittest.TestCase):
+    """Test persistence and aging of the histogram."""
+
+    def test_round_trip(self):
+        scheduler = learned_scheduler()
+        restored = PublicationScheduler.from_dict(scheduler.as_dict())
+        self.assertEqual(restored.window(), scheduler.window())
+        self.assertEqual(restored.observations, scheduler.observations)
+
+    def test_from_empty_storage(self):
+        self.assertEqual(PublicationScheduler.from_dict(None).observations, 0)
+
+    def test_buckets_are_five_minutes(self):
+        scheduler = PublicationScheduler()
+        scheduler.record(at(12, 43))
+        self.assertEqual(scheduler.as_dict(), {"histogram": {str(12 * 60 + 40): 1}})
+
+    def test_aging_bounds_samples(self):
+        scheduler = PublicationScheduler()
+        for _ in range(200):
+            scheduler.record(at(13, 0))
+        self.assertLessEqual(scheduler.observations, 60)
+        self.assertTrue(scheduler.learned)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for the array-backed day price series."""
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.series import DaySeries  # noqa: E402
+from custom_components.tge_rdn.slots import TGE_TIMEZONE  # noqa: E402
+
+
+class TestDaySeries(unittest.TestCase):
+    """Lookups, precomputed statistics and DST markers."""
+
+    def setUp(self):
+        self.day = DaySeries(
+            date(2025, 11, 22),
+            [-10.0, 20.0, 30.0],
+            [1, 2, 3],
+            quarter_prices=[1.0, 2.0, 3.0, 4.0],
+            quarter_minutes=[60, 75, 90, 105],
+        )
+
+    def test_hour_lookup(self):
+        self.assertEqual(self.day.hour_price(1), -10.0)
+        self.assertEqual(self.day.hour_price(3), 30.0)
+        self.assertIsNone(self.day.hour_price(4))
+        self.assertIsNone(self.day.hour_price(99))
+
+    def test_quarter_lookup_by_minute(self):
+        self.assertEqual(self.day.quarter_price(60), 1.0)
+        self.assertEqual(self.day.quarter_price(89), 2.0)
+        self.assertEqual(self.day.quarter_price(119), 4.0)
+        self.assertIsNone(self.day.quarter_price(0))
+        self.assertIsNone(self.day.quarter_price(24 * 60))
+
+    def test_precomputed_stats(self):
+        self.assertAlmostEqual(self.day.average_price, 40.0 / 3)
+        self.assertEqual(self.day.min_price, -10.0)
+        self.assertEqual(self.day.max_price, 30.0)
+        self.assertEqual(self.day.negative_hours, 1)
+        self.assertEqual(self.day.total_hours, 3)
+        self.assertTrue(self.day.has_quarters)
+        self.assertEqual(self.day.date, "2025-11-22")
+
+    def test_hour_start_is_aware_local(self):
+        start = self.day.hour_start(2)
+        self.assertEqual(start, datetime(2025, 11, 22, 2, 0, tzinfo=TGE_TIMEZONE))
+        self.assertEqual(start.utcoffset(), timedelta(hours=1))
+
+    def test_price_at_prefers_quarters(self):
+        at = datetime(2025, 11, 22, 1, 20, tzinfo=TGE_TIMEZONE)
+        self.assertEqual(self.day.price_at(at), 2.0)
+        self.assertEqual(self.day.price_at(at.astimezone(timezone.utc)), 2.0)
+        self.assertEqual(self.day.price_at(datetime(2025, 11, 22, 0, 30)), -10.0)
+        self.assertIsNone(self.day.price_at(datetime(2025, 11, 22, 5, 0)))
+
+    def test_repeated_dst_hour(self):
+        prices = [float(h) for h in range(25)]
+        numbers = [1, 2, 3, 3] + list(range(4, 25))
+        series = DaySeries(date(2025, 10, 26), prices, numbers, "  ab")
+        self.assertEqual(series.total_hours, 25)
+        self.assertEqual(series.hour_price(3), 2.0)
+        self.assertEqual([m for _h, m, _p in series.hours()][2:4], ["a", "b"])
+        # 02:30 CEST (first pass) and 02:30 CET (second pass) are different slots
+        first = datetime(2025, 10, 26, 0, 30, tzinfo=timezone.utc)
+        second = datetime(2025, 10, 26, 1, 30, tzinfo=timezone.utc)
+        self.assertEqual(series.price_at(first), 2.0)
+        self.assertEqual(series.price_at(second), 3.0)
+        self.assertEqual(series.hour_start(3).fold, 1)
+        self.assertEqual(series.price_at(datetime(2025, 10, 26, 23, 30, tzinfo=TGE_TIMEZONE)), 24.0)
+
+    def test_short_dst_day(self):
+        numbers = [1, 2] + list(range(4, 25))
+        series = DaySeries(date(2025, 3, 30), [float(h) for h in numbers], numbers)
+        self.assertEqual(series.total_hours, 23)
+        self.assertEqual(series.price_at(datetime(2025, 3, 30, 3, 30, tzinfo=TGE_TIMEZONE)), 4.0)
+        self.assertEqual(series.hour_start(2), datetime(2025, 3, 30, 3, 0, tzinfo=TGE_TIMEZONE))
+
+    def test_empty_series(self):
+        series = DaySeries(date(2025, 11, 22), [], [])
+        self.assertEqual(series.total_hours, 0)
+        self.assertFalse(series.has_quarters)
+        self.assertIsNone(series.hour_price(1))
+
+    def test_uses_slots(self):
+        with self.assertRaises(AttributeError):
+            self.day.extra = 1
+
+
+class TestDaySeriesStorage(unittest.TestCase):
+    """Serialization to and from the Store JSON layout."""
+
+    def test_round_trip(self):
+        series = DaySeries(
+            date(2025, 10, 26), [1.0, 2.0], [3, 3], "ab",
+            [5.0], [0],
+            columns={"volume": [10.0, None]},
+            eur_rate=4.25,
+        )
+        restored = DaySeries.from_dict(json.loads(json.dumps(series.as_dict())))
+        self.assertEqual(list(restored.hour_prices), [1.0, 2.0])
+        self.assertEqual([m for _h, m, _p in restored.hours()], ["a", "b"])
+        self.assertEqual(restored.quarter_price(0), 5.0)
+        self.assertEqual(restored.eur_rate, 4.25)
+        self.assertEqual(restored.columns["volume"][0], 10.0)
+        self.assertTrue(math.isnan(restored.columns["volume"][1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
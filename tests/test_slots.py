@@ -0,0 +1,86 @@
+"""Tests for delivery-day slot arithmetic."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.slots import TGE_TIMEZONE, SlotIndex, next_slot_boundary  # noqa: E402
+
+
+class TestNextSlotBoundary(unittest.TestCase):
+    """Test boundary computation for timers."""
+
+    def test_next_full_hour(self):
+        now = datetime(2025, 11, 22, 13, 42, 10, tzinfo=TGE_TIMEZONE)
+        boundary = next_slot_boundary(now, 60)
+        self.assertEqual(boundary.astimezone(TGE_TIMEZONE), datetime(2025, 11, 22, 14, 0, tzinfo=TGE_TIMEZONE))
+
+    def test_exact_boundary_moves_forward(self):
+        now = datetime(2025, 11, 22, 14, 0, tzinfo=TGE_TIMEZONE)
+        boundary = next_slot_boundary(now, 60)
+        self.assertEqual(boundary.astimezone(TGE_TIMEZONE).hour, 15)
+
+    def test_quarter_hour(self):
+        now = datetime(2025, 11, 22, 13, 46, tzinfo=TGE_TIMEZONE)
+        boundary = next_slot_boundary(now, 15)
+        self.assertEqual(boundary.astimezone(TGE_TIMEZONE), datetime(2025, 11, 22, 14, 0, tzinfo=TGE_TIMEZONE))
+
+    def test_result_is_utc_aware(self):
+        boundary = next_slot_boundary(datetime(2025, 11, 22, 13, 5, tzinfo=TGE_TIMEZONE), 15)
+        self.assertEqual(boundary.tzinfo, timezone.utc)
+
+    def test_fall_back_hour_is_a_boundary(self):
+        # 2025-10-26 02:30 CEST (first pass) → next boundary is 02:00 CET
+        now = datetime(2025, 10, 26, 0, 30, tzinfo=timezone.utc)
+        boundary = next_slot_boundary(now, 60)
+        self.assertEqual(boundary, datetime(2025, 10, 26, 1, 0, tzinfo=timezone.utc))
+        local = boundary.astimezone(TGE_TIMEZONE)
+        self.assertEqual((local.hour, local.fold), (2, 1))
+
+
+class TestSlotIndex(unittest.TestCase):
+    """UTC slot index maps instants to slots and back."""
+
+    def test_round_trip_every_slot(self):
+        index = SlotIndex.from_wall_clock(date(2025, 11, 22), range(0, 24 * 60, 15), "", 15)
+        self.assertEqual(len(index), 96)
+        for pos in range(len(index)):
+            self.assertEqual(index.position(index.start(pos)), pos)
+
+    def test_outside_day_is_none(self):
+        index = SlotIndex.from_wall_clock(date(2025, 11, 22), range(0, 24 * 60, 60), "", 60)
+        self.assertIsNone(index.position(datetime(2025, 11, 21, 23, 59, tzinfo=TGE_TIMEZONE)))
+        self.assertIsNone(index.position(datetime(2025, 11, 23, 0, 0, tzinfo=TGE_TIMEZONE)))
+
+    def test_fall_back_markers_split_repeated_hour(self):
+        minutes = [0, 60, 120, 120] + list(range(180, 24 * 60, 60))
+        index = SlotIndex.from_wall_clock(date(2025, 10, 26), minutes[:5], "  ab ", 60)
+        self.assertEqual(index.start(2), datetime(2025, 10, 26, 0, 0, tzinfo=timezone.utc))
+        self.assertEqual(index.start(3), datetime(2025, 10, 26, 1, 0, tzinfo=timezone.utc))
+        self.assertEqual(index.position(datetime(2025, 10, 26, 1, 59, tzinfo=timezone.utc)), 3)
+
+    def test_partial_day_uses_bisect(self):
+        index = SlotIndex.from_wall_clock(date(2025, 11, 22), [0, 120, 180], "", 60)
+        self.assertEqual(index.position(datetime(2025, 11, 22, 2, 30, tzinfo=TGE_TIMEZONE)), 1)
+        self.assertIsNone(index.position(datetime(2025, 11, 22, 1, 30, tzinfo=TGE_TIMEZONE)))
+
+    def test_naive_datetime_is_warsaw_wall_time(self):
+        index = SlotIndex.from_wall_clock(date(2025, 11, 22), range(0, 24 * 60, 60), "", 60)
+        self.assertEqual(index.position(datetime(2025, 11, 22, 13, 5)), 13)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for the long-term statistics import."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import MagicMock, patch
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.pricing import build_day_prices  # noqa: E402
+from custom_components.tge_rdn.series import DaySeries  # noqa: E402
+from custom_components.tge_rdn.statistics import PriceStatistics, hourly_rows  # noqa: E402
+
+
+def plus_hundred(price, when):
+    return "all", price + 100.0
+
+
+def per_kwh(mwh, eur_rate=None):
+    return mwh / 1000
+
+
+def quarter_day(day: date) -> DaySeries:
+    quarters = [float(q) for q in range(96)]
+    return DaySeries(
+        day,
+        [sum(quarters[i:i + 4]) / 4 for i in range(0, 96, 4)],
+        range(1, 25),
+        quarter_prices=quarters,
+        quarter_minutes=[q * 15 for q in range(96)],
+        hourly_source="quarters",
+    )
+
+
+class TestHourlyRows(unittest.TestCase):
+    """Rows are hourly, UTC, with quarter spread as min/max."""
+
+    def test_quarters_become_min_max(self):
+        series = quarter_day(date(2025, 11, 22))
+        rows = hourly_rows(series, series.hour_prices, series.quarter_prices)
+        self.assertEqual(len(rows), 24)
+        self.assertEqual(rows[0]["start"], datetime(2025, 11, 21, 23, 0, tzinfo=timezone.utc))
+        self.assertEqual((rows[2]["mean"], rows[2]["min"], rows[2]["max"]), (9.5, 8.0, 11.0))
+
+    def test_hourly_only_day(self):
+        series = DaySeries(date(2025, 10, 26), [float(h) for h in range(25)], range(1, 26))
+        rows = hourly_rows(series, series.hour_prices, series.quarter_prices)
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[24]["start"], datetime(2025, 10, 26, 22, 0, tzinfo=timezone.utc))
+        self.assertEqual((rows[3]["min"], rows[3]["max"]), (3.0, 3.0))
+
+
+class TestPriceStatistics(unittest.TestCase):
+    """One batch per statistic and published day, only with the recorder."""
+
+    def setUp(self):
+        self.add = MagicMock()
+        recorder_statistics = MagicMock(async_add_external_statistics=self.add)
+        patcher = patch.dict(sys.modules, {
+            "homeassistant.components": MagicMock(),
+            "homeassistant.components.recorder": MagicMock(),
+            "homeassistant.components.recorder.statistics": recorder_statistics,
+        })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.hass = MagicMock()
+        self.hass.config.components = {"recorder", "tge_rdn"}
+        self.stats = PriceStatistics(self.hass, "01JABC-Entry")
+        self.prices = build_day_prices(quarter_day(date(2025, 11, 22)), plus_hundred, per_kwh)
+
+    def test_spot_and_gross_batches(self):
+        self.assertTrue(self.stats.publish(self.prices))
+        self.assertEqual(self.add.call_count, 2)
+        (_, spot_meta, spot), _ = self.add.call_args_list[0]
+        (_, gross_meta, gross), _ = self.add.call_args_list[1]
+        self.assertEqual(spot_meta["statistic_id"], "tge_rdn:spot_price_01jabc_entry")
+        self.assertEqual(gross_meta["statistic_id"], "tge_rdn:gross_price_01jabc_entry")
+        self.assertEqual(gross_meta["unit_of_measurement"], "PLN/MWh")
+        self.assertEqual(spot[5]["mean"], 21.5)
+        self.assertEqual(gross[5]["mean"], 121.5)
+        self.assertEqual(gross[5]["max"], 123.0)
+
+    def test_same_prices_imported_once(self):
+        self.stats.publish(self.prices)
+        self.assertFalse(self.stats.publish(self.prices))
+        # New tariff vectors for the same day replace the earlier rows
+        rebuilt = build_day_prices(self.prices.series, plus_hundred, per_kwh)
+        self.assertTrue(self.stats.publish(rebuilt))
+        self.assertEqual(self.add.call_count, 4)
+
+    def test_partial_day_skipped(self):
+        partial = build_day_prices(
+            DaySeries(date(2025, 11, 22), [1.0] * 12, range(1, 13)), plus_hundred, per_kwh
+        )
+        self.assertFalse(self.stats.publish(partial))
+        self.add.assert_not_called()
+
+    def test_without_recorder(self):
+        self.hass.config.components = {"tge_rdn"}
+        self.assertFalse(self.stats.publish(self.prices))
+        self.add.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
-"""Test the tariff logic in sensor.py."""
+"""Test the tariff logic in pricing.TariffPricing and the fee sensors."""
 import sys
 import os
 import unittest
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from unittest.mock import MagicMock
 
 # Mock Home Assistant modules BEFORE importing from custom_components
@@ -14,11 +14,15 @@ sys.modules["homeassistant.config_entries"] = MagicMock()
 sys.modules["homeassistant.const"] = MagicMock()
 sys.modules["homeassistant.core"] = MagicMock()
 sys.modules["homeassistant.helpers"] = MagicMock()
+sys.modules["homeassistant.helpers.aiohttp_client"] = MagicMock()
+sys.modules["homeassistant.helpers.dispatcher"] = MagicMock()
 sys.modules["homeassistant.helpers.entity_platform"] = MagicMock()
 sys.modules["homeassistant.helpers.update_coordinator"] = MagicMock()
 sys.modules["homeassistant.helpers.event"] = MagicMock()
+sys.modules["homeassistant.helpers.storage"] = MagicMock()
 sys.modules["homeassistant.util"] = MagicMock()
 sys.modules["voluptuous"] = MagicMock()
+sys.modules.setdefault("aiohttp", MagicMock())
 
 # Define dummy base classes for Sensor components
 class MockSensorEntity: pass
@@ -33,6 +37,9 @@ sys.modules["homeassistant.helpers.update_coordinator"].CoordinatorEntity = Mock
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from custom_components.tge_rdn.sensor import TGEFixedFeeSensor, TGERDNSensor, load_tariffs
+from custom_components.tge_rdn.pricing import TariffPricing, to_unit
+from custom_components.tge_rdn.series import DaySeries
+from custom_components.tge_rdn.tariffs import TariffRegistry, bundled_registry
 from custom_components.tge_rdn.const import *
 
 class MockCoordinator:
@@ -49,6 +56,7 @@ class TestTariffLogic(unittest.TestCase):
 
     def setUp(self):
         self.coord = MockCoordinator()
+        self.tariffs = bundled_registry()
 
     def test_load_tariffs(self):
         """Test that tariffs.json loads correctly with new schema."""
@@ -64,15 +72,14 @@ class TestTariffLogic(unittest.TestCase):
             CONF_DISTRIBUTOR: "PGE Dystrybucja",
             CONF_DIST_TARIFF: "G11",
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
         # PGE G11 "all" zone rate = 349.59 netto PLN/MWh
         dt = datetime(2025, 1, 1, 10, 0)  # Wednesday morning
-        self.assertEqual(sensor._get_dist(dt), 349.59)
+        self.assertEqual(pricing.resolve(dt)[1], 349.59)
 
         dt = datetime(2025, 1, 1, 20, 0)  # Wednesday evening
-        self.assertEqual(sensor._get_dist(dt), 349.59)
+        self.assertEqual(pricing.resolve(dt)[1], 349.59)
 
     def test_dual_standard_g12(self):
         """Test PGE G12 — dual zones from JSON (low=73.17, high=398.37)."""
@@ -80,19 +87,18 @@ class TestTariffLogic(unittest.TestCase):
             CONF_DISTRIBUTOR: "PGE Dystrybucja",
             CONF_DIST_TARIFF: "G12",
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
         # Low: 22-05 all days
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 1, 23, 0)), 73.17)
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 1, 3, 0)), 73.17)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 1, 23, 0))[1], 73.17)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 1, 3, 0))[1], 73.17)
 
         # Low: 13-14 workday winter
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 2, 14, 0)), 73.17)  # Thursday
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 2, 14, 0))[1], 73.17)  # Thursday
 
         # High: otherwise
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 2, 10, 0)), 398.37)
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 2, 18, 0)), 398.37)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 2, 10, 0))[1], 398.37)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 2, 18, 0))[1], 398.37)
 
     def test_dual_weekend_g12w(self):
         """Test PGE G12w — dual zones with weekend/holiday override (low=81.3, high=430.89)."""
@@ -100,20 +106,19 @@ class TestTariffLogic(unittest.TestCase):
             CONF_DISTRIBUTOR: "PGE Dystrybucja",
             CONF_DIST_TARIFF: "G12w",
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
         # Weekend (Saturday 2025-01-04) - Should be low
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 4, 12, 0)), 81.3)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 4, 12, 0))[1], 81.3)
 
         # Holiday (Jan 1st) - Should be low
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 1, 12, 0)), 81.3)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 1, 12, 0))[1], 81.3)
 
         # Weekday peak - high
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 2, 10, 0)), 430.89)  # Thursday 10am
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 2, 10, 0))[1], 430.89)  # Thursday 10am
 
         # Weekday off-peak winter 13-14 - low
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 2, 14, 0)), 81.3)  # Thursday 2pm
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 2, 14, 0))[1], 81.3)  # Thursday 2pm
 
     def test_pge_static_seller_prices_are_loaded_as_netto(self):
         """Test that PGE fixed seller tariffs expose netto seller prices from tariffs.json."""
@@ -123,15 +128,14 @@ class TestTariffLogic(unittest.TestCase):
             CONF_DISTRIBUTOR: "PGE Dystrybucja",
             CONF_DIST_TARIFF: "G12",
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
-        zone_name, dist_rate, seller_price = sensor._resolve(datetime(2025, 1, 2, 14, 0))
+        zone_name, dist_rate, seller_price = pricing.resolve(datetime(2025, 1, 2, 14, 0))
         self.assertEqual(zone_name, "low")
         self.assertEqual(dist_rate, 73.17)
         self.assertEqual(seller_price, 373.98)
 
-        zone_name, dist_rate, seller_price = sensor._resolve(datetime(2025, 1, 2, 10, 0))
+        zone_name, dist_rate, seller_price = pricing.resolve(datetime(2025, 1, 2, 10, 0))
         self.assertEqual(zone_name, "high")
         self.assertEqual(dist_rate, 398.37)
         self.assertEqual(seller_price, 569.11)
@@ -142,39 +146,38 @@ class TestTariffLogic(unittest.TestCase):
             CONF_DISTRIBUTOR: "Tauron Dystrybucja",
             CONF_DIST_TARIFF: "G13",
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
         # Weekend - off_peak
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 4, 12, 0)), 82.70)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 4, 12, 0))[1], 82.70)
 
         # Summer (July) Weekday
         # 7-12: mid_peak, 19-21: peak, else off_peak
         dt_summer = datetime(2025, 7, 2, 10, 0)  # Wednesday 10am
-        self.assertEqual(sensor._get_dist(dt_summer), 263.82)
+        self.assertEqual(pricing.resolve(dt_summer)[1], 263.82)
 
         dt_summer_evening = datetime(2025, 7, 2, 20, 0)  # Wednesday 8pm
-        self.assertEqual(sensor._get_dist(dt_summer_evening), 433.33)
+        self.assertEqual(pricing.resolve(dt_summer_evening)[1], 433.33)
 
         dt_summer_night = datetime(2025, 7, 2, 23, 0)  # Wednesday 11pm
-        self.assertEqual(sensor._get_dist(dt_summer_night), 82.70)
+        self.assertEqual(pricing.resolve(dt_summer_night)[1], 82.70)
 
         # Winter (January) Weekday
         # 7-12: mid_peak, 16-20: peak, else off_peak
         dt_winter = datetime(2025, 1, 2, 10, 0)  # Thursday 10am
-        self.assertEqual(sensor._get_dist(dt_winter), 263.82)
+        self.assertEqual(pricing.resolve(dt_winter)[1], 263.82)
 
         dt_winter_evening = datetime(2025, 1, 2, 17, 0)  # Thursday 5pm
-        self.assertEqual(sensor._get_dist(dt_winter_evening), 433.33)
+        self.assertEqual(pricing.resolve(dt_winter_evening)[1], 433.33)
 
         dt_winter_late = datetime(2025, 1, 2, 22, 0)  # Thursday 10pm
-        self.assertEqual(sensor._get_dist(dt_winter_late), 82.70)
+        self.assertEqual(pricing.resolve(dt_winter_late)[1], 82.70)
 
     def test_is_holiday(self):
         """Test holiday detection."""
         options = {}
         entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        sensor = TGERDNSensor(self.coord, entry, "current_price", self.tariffs)
 
         self.assertTrue(sensor._is_holiday(date(2025, 1, 1)))  # New Year
         self.assertTrue(sensor._is_holiday(date(2025, 5, 3)))  # Constitution Day
@@ -187,17 +190,48 @@ class TestTariffLogic(unittest.TestCase):
         # Not a holiday
         self.assertFalse(sensor._is_holiday(date(2025, 1, 2)))
 
+    def test_extra_holidays_from_json_and_options(self):
+        """Christmas Eve from tariffs.json (2025+) and user-supplied days count as holidays."""
+        entry = MockEntry({
+            CONF_DISTRIBUTOR: "PGE Dystrybucja",
+            CONF_DIST_TARIFF: "G12w",
+            CONF_EXTRA_HOLIDAYS: "2025-06-20, 11-10",
+        })
+        sensor = TGERDNSensor(self.coord, entry, "current_price", self.tariffs)
+        pricing = TariffPricing(entry.options, self.tariffs)
+        self.assertTrue(sensor._is_holiday(date(2025, 12, 24)))
+        self.assertFalse(sensor._is_holiday(date(2024, 12, 24)))
+        self.assertTrue(sensor._is_holiday(date(2025, 6, 20)))
+        self.assertFalse(sensor._is_holiday(date(2026, 6, 20)))
+        self.assertTrue(sensor._is_holiday(date(2026, 11, 10)))
+        # G12w weekday peak hour is low on an extra holiday
+        self.assertEqual(pricing.resolve(datetime(2025, 6, 20, 10, 0))[1], 81.3)
+        self.assertEqual(pricing.resolve(datetime(2025, 6, 18, 10, 0))[1], 430.89)
+
+    def test_tariffs_reload_rebuilds_options(self):
+        """A reloaded registry replaces zone rates without recreating the sensor."""
+        entry = MockEntry({CONF_DISTRIBUTOR: "PGE Dystrybucja", CONF_DIST_TARIFF: "G11"})
+        data = load_tariffs()
+        for dist in data["distributors"]:
+            if dist["name"] == "PGE Dystrybucja":
+                for tariff in dist["tariffs"]:
+                    if tariff["name"] == "G11":
+                        tariff["zones"] = {"all": {"rate": 123.0, "schedule": [{"default": True}]}}
+
+        # What _async_tariffs_reloaded rebuilds before writing state
+        pricing = TariffPricing(entry.options, TariffRegistry(data))
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 1, 10, 0))[1], 123.0)
+
     def test_legacy_fallback_no_zones(self):
         """Test that legacy configs without distributor/tariff fall back to CONF_DIST_LOW."""
         options = {
             CONF_DIST_LOW: 100.0,
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
         # Should always return the fallback rate
-        self.assertEqual(sensor._get_dist(datetime(2025, 1, 1, 10, 0)), 100.0)
-        self.assertEqual(sensor._get_dist(datetime(2025, 7, 2, 20, 0)), 100.0)
+        self.assertEqual(pricing.resolve(datetime(2025, 1, 1, 10, 0))[1], 100.0)
+        self.assertEqual(pricing.resolve(datetime(2025, 7, 2, 20, 0))[1], 100.0)
 
     def test_pstryk_negative_prices_allowed(self):
         """Test that Pstryk seller allows negative TGE prices (no max(0) clamping)."""
@@ -209,17 +243,16 @@ class TestTariffLogic(unittest.TestCase):
             CONF_VAT_RATE: 0.23,
             CONF_EXCHANGE_FEE: 80.0,
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
-        self.assertTrue(sensor._is_dynamic)
-        self.assertTrue(sensor._negative_prices_allowed)
+        self.assertTrue(pricing.is_dynamic)
+        self.assertTrue(pricing.negative_prices_allowed)
 
         dt = datetime(2025, 6, 15, 14, 0)  # Sunday afternoon
         # Negative TGE price: -50 PLN/MWh
         # base = -50 (not clamped), dist = 349.59, exchange_fee = 80.0, vat = 0.23
         # total = (-50.0 + 80.0 + 349.59) * 1.23 = 379.59 * 1.23 = 466.8957
-        result = sensor._compute_total(-50.0, dt)
+        result = pricing.zone_total(-50.0, dt)[1]
         self.assertAlmostEqual(result, 466.8957, places=4)
 
     def test_tauron_negative_prices_clamped(self):
@@ -232,17 +265,16 @@ class TestTariffLogic(unittest.TestCase):
             CONF_VAT_RATE: 0.23,
             CONF_EXCHANGE_FEE: 89.2,
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
-        self.assertTrue(sensor._is_dynamic)
-        self.assertFalse(sensor._negative_prices_allowed)
+        self.assertTrue(pricing.is_dynamic)
+        self.assertFalse(pricing.negative_prices_allowed)
 
         dt = datetime(2025, 6, 15, 14, 0)
         # Negative TGE price: -50 PLN/MWh
         # base = max(0, -50) = 0, dist = 349.59, exchange_fee = 89.2, vat = 0.23
         # total = (0.0 + 89.2 + 349.59) * 1.23 = 539.7117
-        result = sensor._compute_total(-50.0, dt)
+        result = pricing.zone_total(-50.0, dt)[1]
         self.assertAlmostEqual(result, 539.7117, places=4)
 
     def test_pstryk_positive_prices(self):
@@ -255,14 +287,13 @@ class TestTariffLogic(unittest.TestCase):
             CONF_VAT_RATE: 0.23,
             CONF_EXCHANGE_FEE: 80.0,
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
         dt = datetime(2025, 6, 15, 14, 0)
         # Positive TGE price: 300 PLN/MWh
         # base = 300, dist = 349.59, exchange_fee = 80.0, vat = 0.23
         # total = (300.0 + 80.0 + 349.59) * 1.23 = 729.59 * 1.23 = 897.3957
-        result = sensor._compute_total(300.0, dt)
+        result = pricing.zone_total(300.0, dt)[1]
         self.assertAlmostEqual(result, 897.3957, places=4)
 
     def test_non_dynamic_prices_apply_vat_to_distribution_too(self):
@@ -274,13 +305,12 @@ class TestTariffLogic(unittest.TestCase):
             CONF_DIST_TARIFF: "G13",
             CONF_VAT_RATE: 0.23,
         }
-        entry = MockEntry(options)
-        sensor = TGERDNSensor(self.coord, entry, "current_price")
+        pricing = TariffPricing(options, self.tariffs)
 
         dt = datetime(2025, 7, 2, 10, 0)  # Workday, summer, mid_peak
         # seller = 471.79, dist = 263.82, both netto
         # total = (471.79 + 263.82) * 1.23 = 904.8003
-        result = sensor._compute_total(0.0, dt)
+        result = pricing.zone_total(0.0, dt)[1]
         self.assertAlmostEqual(result, 904.8003, places=4)
 
     def test_negative_prices_allowed_attribute_in_tariffs(self):
@@ -311,6 +341,7 @@ class TestTariffLogic(unittest.TestCase):
             "Fixed Transmission Fee",
             CONF_FIXED_TRANSMISSION_FEE,
             DEFAULT_FIXED_TRANSMISSION_FEE,
+            self.tariffs,
         )
 
         # tariffs.json: Tauron Dystrybucja G13 fixed_transmission_fee = 10.86 netto
@@ -330,10 +361,41 @@ class TestTariffLogic(unittest.TestCase):
             "Trade Fee",
             CONF_TRADE_FEE,
             DEFAULT_TRADE_FEE,
+            self.tariffs,
         )
 
         # tariffs.json: PGE Dynamic trade_fee = 5.0 netto
         self.assertAlmostEqual(sensor.state, 6.15, places=2)
 
+    def test_slot_price_prefers_quarters(self):
+        """Prices resolve at quarter-hour granularity when a quarter series exists."""
+        day = DaySeries(
+            date(2025, 1, 1), [100.0], [11], "",
+            [90.0, 95.0, 105.0, 110.0], [600, 615, 630, 645],
+        )
+        self.assertEqual(day.price_at(datetime(2025, 1, 1, 10, 20)), 95.0)
+        self.assertEqual(day.price_at(datetime(2025, 1, 1, 10, 59)), 110.0)
+        hourly = DaySeries(date(2025, 1, 1), [100.0], [11])
+        self.assertEqual(hourly.price_at(datetime(2025, 1, 1, 10, 20)), 100.0)
+        self.assertIsNone(hourly.price_at(datetime(2025, 1, 1, 11, 20)))
+
+    def test_day_at_crosses_midnight(self):
+        """The next-hour lookup picks tomorrow's series after local midnight."""
+        today = DaySeries(date(2025, 1, 1), [float(h) for h in range(24)], range(1, 25))
+        tomorrow = DaySeries(date(2025, 1, 2), [100.0 + h for h in range(24)], range(1, 25))
+        data = {"today": today, "tomorrow": tomorrow}
+        late = datetime(2025, 1, 1, 23, 30, tzinfo=timezone.utc)  # 00:30 CET on Jan 2
+        self.assertIs(TGERDNSensor._day_at(data, late), tomorrow)
+        self.assertEqual(tomorrow.price_at(late), 100.0)
+        self.assertIs(TGERDNSensor._day_at(data, datetime(2025, 1, 1, 12, 0)), today)
+        self.assertIsNone(TGERDNSensor._day_at({"today": today}, late))
+
+    def test_eur_unit_uses_day_rate(self):
+        """EUR conversion uses the rate parsed from the page, 4.3 without one."""
+        pricing = TariffPricing({CONF_UNIT: UNIT_EUR_MWH}, self.tariffs)
+        self.assertAlmostEqual(pricing.apply_unit(430.0, 4.25), 101.17647, places=4)
+        self.assertAlmostEqual(pricing.apply_unit(430.0), 100.0)
+        self.assertAlmostEqual(to_unit(430.0, UNIT_EUR_KWH, 4.3), 0.1)
+
 if __name__ == '__main__':
     unittest.main()
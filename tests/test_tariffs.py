@@ -0,0 +1,174 @@
+"""Tests for the indexed tariff registry."""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.const import DATA_TARIFFS, DOMAIN, SIGNAL_TARIFFS_RELOADED  # noqa: E402
+from custom_components.tge_rdn.tariffs import (  # noqa: E402
+    TariffRegistry,
+    as_registry,
+    async_get_registry,
+    bundled_registry,
+    load_tariffs,
+)
+
+SAMPLE = {
+    "extra_holidays": ["12-24"],
+    "sellers": [
+        {
+            "name": "Seller A",
+            "negative_prices_allowed": True,
+            "tariffs": [
+                {"name": "Dynamic", "is_dynamic": True, "exchange_fee": 1.5, "trade_fee": 9.0},
+                {"name": "G11", "energy_prices_netto_mwh": {"all": 500.0}},
+            ],
+        },
+    ],
+    "distributors": [
+        {
+            "name": "Dist B",
+            "tariffs": [
+                {
+                    "name": "G11",
+                    "zones": {"all": {"rate": 300.0, "schedule": [{"default": True}]}},
+                    "fixed_fees": {"meter_fee": 4.0},
+                },
+                {"name": "Legacy"},
+            ],
+        },
+    ],
+}
+
+
+class FakeHass:
+    """Just enough of hass for async_get_registry."""
+
+    def __init__(self):
+        self.data = {}
+        self.executor_jobs = 0
+
+    async def async_add_executor_job(self, func, *args):
+        self.executor_jobs += 1
+        return func(*args)
+
+
+class TestTariffRegistry(unittest.TestCase):
+    """Lookups go through (name, tariff) indexes."""
+
+    def setUp(self):
+        self.registry = TariffRegistry(SAMPLE)
+
+    def test_name_lists(self):
+        self.assertEqual(self.registry.sellers(), ["Seller A"])
+        self.assertEqual(self.registry.distributors(), ["Dist B"])
+        self.assertEqual(self.registry.seller_tariffs("Seller A"), ["Dynamic", "G11"])
+        self.assertEqual(self.registry.distribution_tariffs("Dist B"), ["G11", "Legacy"])
+        self.assertEqual(self.registry.seller_tariffs("Unknown"), [])
+
+    def test_seller_tariff(self):
+        tariff = self.registry.seller_tariff("Seller A", "Dynamic")
+        self.assertTrue(tariff.is_dynamic)
+        self.assertTrue(tariff.negative_prices_allowed)
+        self.assertEqual((tariff.exchange_fee, tariff.trade_fee), (1.5, 9.0))
+        self.assertEqual(self.registry.seller_tariff("Seller A", "G11").energy_prices["all"], 500.0)
+        self.assertIsNone(self.registry.seller_tariff("Seller A", "Missing"))
+        self.assertIsNone(self.registry.seller_tariff(None, None))
+
+    def test_distribution_tariff(self):
+        tariff = self.registry.distribution_tariff("Dist B", "G11")
+        self.assertEqual(tariff.fixed_fees["meter_fee"], 4.0)
+        self.assertIsNotNone(tariff.zone_table)
+        self.assertIsNone(self.registry.distribution_tariff("Dist B", "Legacy").zone_table)
+
+    def test_entries_are_frozen(self):
+        tariff = self.registry.seller_tariff("Seller A", "G11")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            tariff.trade_fee = 0.0
+        with self.assertRaises(TypeError):
+            tariff.energy_prices["all"] = 0.0
+
+    def test_extra_holidays(self):
+        self.assertEqual(self.registry.extra_holidays, ((12, 24, 0, 0),))
+
+    def test_as_registry(self):
+        self.assertIs(as_registry(self.registry), self.registry)
+        self.assertEqual(as_registry(SAMPLE).sellers(), ["Seller A"])
+
+    def test_bundled_file_indexes_every_tariff(self):
+        data = load_tariffs()
+        registry = bundled_registry()
+        for seller in data["sellers"]:
+            for tariff in seller["tariffs"]:
+                self.assertIsNotNone(registry.seller_tariff(seller["name"], tariff["name"]))
+        for dist in data["distributors"]:
+            for tariff in dist["tariffs"]:
+                self.assertIsNotNone(registry.distribution_tariff(dist["name"], tariff["name"]))
+
+
+class TestAsyncGetRegistry(unittest.TestCase):
+    """One registry in hass.data, replaced when the file changes."""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(SAMPLE, f)
+        self.hass = FakeHass()
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def _get(self):
+        return asyncio.run(async_get_registry(self.hass, self.path))
+
+    def test_shared_until_file_changes(self):
+        first = self._get()
+        self.assertIs(self.hass.data[DOMAIN][DATA_TARIFFS], first)
+        self.assertIs(self._get(), first)
+
+        data = dict(SAMPLE, sellers=[])
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.utime(self.path, ns=(first.mtime + 10**9, first.mtime + 10**9))
+
+        with patch("custom_components.tge_rdn.tariffs.async_dispatcher_send") as send:
+            reloaded = self._get()
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.sellers(), [])
+        self.assertIs(self.hass.data[DOMAIN][DATA_TARIFFS], reloaded)
+        # Any caller that swaps the registry notifies its holders
+        send.assert_called_once_with(self.hass, SIGNAL_TARIFFS_RELOADED, reloaded)
+
+    def test_first_load_sends_nothing(self):
+        with patch("custom_components.tge_rdn.tariffs.async_dispatcher_send") as send:
+            self._get()
+            self._get()
+        send.assert_not_called()
+
+    def test_missing_file_gives_empty_registry(self):
+        os.unlink(self.path)
+        registry = self._get()
+        self.assertEqual(registry.sellers(), [])
+        self.assertIsNone(registry.mtime)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(SAMPLE, f)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Tests for compiled distribution-zone tables."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import unittest
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+# Mock Home Assistant modules BEFORE importing from custom_components
+sys.modules.setdefault("homeassistant", MagicMock())
+sys.modules.setdefault("homeassistant.config_entries", MagicMock())
+sys.modules.setdefault("homeassistant.const", MagicMock())
+sys.modules.setdefault("homeassistant.core", MagicMock())
+sys.modules.setdefault("homeassistant.helpers", MagicMock())
+sys.modules.setdefault("homeassistant.helpers.dispatcher", MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from custom_components.tge_rdn.zones import compile_zones, resolve_zone  # noqa: E402
+
+# 2026 holidays incl. two on a Sunday (3 May, 1 November)
+HOLIDAYS_2026 = {
+    date(2026, 1, 1), date(2026, 1, 6), date(2026, 4, 5), date(2026, 4, 6),
+    date(2026, 5, 1), date(2026, 5, 3), date(2026, 5, 24), date(2026, 6, 4),
+    date(2026, 8, 15), date(2026, 11, 1), date(2026, 11, 11),
+    date(2026, 12, 25), date(2026, 12, 26),
+}
+
+
+def is_holiday(d: date) -> bool:
+    return d in HOLIDAYS_2026
+
+
+def distributor_tariffs():
+    """Yield (label, zones) for every distributor tariff in tariffs.json."""
+    path = os.path.join(
+        os.path.dirname(__file__), "..", "custom_components", "tge_rdn", "tariffs.json"
+    )
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    for dist in data["distributors"]:
+        for tariff in dist["tariffs"]:
+            if tariff.get("zones"):
+                yield f"{dist['name']} {tariff['name']}", tariff["zones"]
+
+
+class TestCompiledZones(unittest.TestCase):
+    """The compiled table agrees with rule scanning everywhere."""
+
+    def test_equivalent_to_resolve_zone_for_whole_year(self):
+        for label, zones in distributor_tariffs():
+            table = compile_zones(zones)
+            with self.subTest(tariff=label):
+                when = datetime(2026, 1, 1)
+                while when.year == 2026:
+                    holiday = is_holiday(when.date())
+                    self.assertEqual(
+                        table.resolve(when, holiday), resolve_zone(zones, when, holiday),
+                        f"{label} at {when}",
+                    )
+                    when += timedelta(hours=1)
+
+    def test_weekend_only_rule_matches_weekend_holiday(self):
+        zones = {
+            "low": {"rate": 1.0, "schedule": [{"hours": [12], "days": "weekends"}]},
+            "high": {"rate": 2.0, "schedule": [{"default": True}]},
+        }
+        table = compile_zones(zones)
+        sunday_holiday = datetime(2026, 5, 3, 12)
+        weekday_holiday = datetime(2026, 5, 1, 12)
+        self.assertEqual(table.resolve(sunday_holiday, True), ("low", 1.0))
+        self.assertEqual(table.resolve(weekday_holiday, True), ("high", 2.0))
+
+    def test_no_default_falls_back_to_all(self):
+        zones = {"peak": {"rate": 5.0, "schedule": [{"hours": [8], "days": "all"}]}}
+        table = compile_zones(zones)
+        self.assertEqual(table.resolve(datetime(2026, 1, 5, 9), False), ("all", 0.0))
+        self.assertEqual(table.resolve(datetime(2026, 1, 5, 8), False), ("peak", 5.0))
+
+    def test_compiled_once_per_schedule(self):
+        zones = {"all": {"rate": 3.0, "schedule": [{"default": True}]}}
+        self.assertIs(compile_zones(zones), compile_zones(dict(zones)))
+
+
+class TestZoneTimeline(unittest.TestCase):
+    """Whole-year timelines answer range queries."""
+
+    def setUp(self):
+        self.zones = {
+            "night": {"rate": 1.0, "schedule": [{"hours": [22, 23, 0, 1, 2, 3, 4, 5], "days": "all"}]},
+            "weekend": {"rate": 2.0, "schedule": [{"hours": list(range(24)), "days": "weekends"}]},
+            "day": {"rate": 3.0, "schedule": [{"default": True}]},
+        }
+        self.table = compile_zones(self.zones)
+
+    def test_year_length(self):
+        self.assertEqual(len(self.table.timeline(2026)), 365 * 24)
+        self.assertEqual(len(self.table.timeline(2028)), 366 * 24)
+
+    def test_timeline_is_cached(self):
+        self.assertIs(self.table.timeline(2026), self.table.timeline(2026))
+        extra = ((1, 5, 0, 0),)
+        self.assertIs(self.table.timeline(2026, extra), self.table.timeline(2026, extra))
+        self.assertIsNot(self.table.timeline(2026, extra), self.table.timeline(2026))
+
+    def test_extra_holidays_change_timeline(self):
+        table = compile_zones({
+            "off": {"rate": 1.0, "schedule": [{"hours": list(range(24)), "days": "holidays"}]},
+            "day": {"rate": 3.0, "schedule": [{"default": True}]},
+        })
+        # Monday 2026-01-05 at noon, as an extra day off and as a workday
+        noon = 4 * 24 + 12
+        self.assertEqual(table.names[table.timeline(2026, ((1, 5, 0, 0),))[noon]], "off")
+        self.assertEqual(table.names[table.timeline(2026)[noon]], "day")
+
+    def test_timeline_cache_is_bounded(self):
+        for day in range(1, 29):
+            self.table.timeline(2026, ((2, day, 0, 0),))
+        self.assertLessEqual(len(self.table._timelines), 8)
+
+    def test_spans_merge_equal_zones(self):
+        spans = self.table.spans(datetime(2026, 1, 5, 0), datetime(2026, 1, 6, 0))
+        self.assertEqual(
+            [(s.hour, e.hour, zone) for s, e, zone, _rate in spans],
+            [(0, 6, "night"), (6, 22, "day"), (22, 0, "night")],
+        )
+
+    def test_spans_clip_and_cross_year(self):
+        spans = self.table.spans(datetime(2026, 12, 31, 21, 30), datetime(2027, 1, 1, 1, 0))
+        self.assertEqual(spans[0][:3], (datetime(2026, 12, 31, 21, 30), datetime(2026, 12, 31, 22, 0), "day"))
+        self.assertEqual(spans[-1][1], datetime(2027, 1, 1, 1, 0))
+        self.assertEqual(spans[-1][2], "night")
+
+
+if __name__ == '__main__':
+    unittest.main()